@@ -15,9 +15,7 @@ v2 rules:
 import hashlib
 import os
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
-
-import requests
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from .errors import IntegrityError, InvalidVersionError, NetworkError, ReleaseNotFoundError
 
@@ -30,6 +28,13 @@ CHECKSUM_ASSET_NAMES = ("SHA256SUMS", "SHA256SUMS.txt", "checksums.txt")
 
 ProgressCallback = Callable[[int, int], None]  # (downloaded_bytes, total_bytes)
 
+if TYPE_CHECKING:
+    import requests
+
+# ``requests`` is imported inside the network functions, not at module scope:
+# manifest.py imports this module for compare_versions, so a top-level import
+# put ~100 ms of requests/urllib3 on every syrvisctl command, offline or not.
+
 
 def _headers() -> Dict[str, str]:
     headers = {"Accept": "application/vnd.github.v3+json"}
@@ -39,7 +44,9 @@ def _headers() -> Dict[str, str]:
     return headers
 
 
-def _get(url: str, **kwargs) -> requests.Response:
+def _get(url: str, **kwargs) -> "requests.Response":
+    import requests
+
     try:
         return requests.get(url, headers=_headers(), timeout=30, **kwargs)
     except requests.RequestException as e:
@@ -88,7 +95,7 @@ def get_release_by_tag(tag: str) -> Dict[str, Any]:
     raise NetworkError(_http_error_message(response))
 
 
-def _http_error_message(response: requests.Response) -> str:
+def _http_error_message(response: "requests.Response") -> str:
     msg = "GitHub API returned HTTP {} for {}".format(response.status_code, response.url)
     if response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0":
         msg += (
@@ -161,6 +168,8 @@ def download_file(url: str, dest: Path, progress: Optional[ProgressCallback] = N
     Raises:
         NetworkError: On any download failure.
     """
+    import requests
+
     try:
         response = requests.get(url, headers=_headers(), stream=True, timeout=60)
         response.raise_for_status()
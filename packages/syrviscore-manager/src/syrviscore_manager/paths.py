@@ -48,6 +48,9 @@ VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
 
 _VOLUME_RE = re.compile(r"^volume\d+$")
 
+# Leading "/volumeN" component of an absolute path
+_VOLUME_PREFIX_RE = re.compile(r"^/volume\d+(?=/|$)")
+
 
 def validate_version(version: str) -> str:
     """Validate a version string (strict MAJOR.MINOR.PATCH).
@@ -67,6 +70,12 @@ def validate_version(version: str) -> str:
     return v
 
 
+def _volume_of(path_str: str) -> Optional[str]:
+    """The "/volumeN" a path lives on, or None."""
+    match = _VOLUME_PREFIX_RE.match(path_str)
+    return match.group(0) if match else None
+
+
 def get_package_volume() -> Optional[str]:
     """
     Detect the volume where the SPK package is installed.
@@ -79,13 +88,6 @@ def get_package_volume() -> Optional[str]:
     Returns:
         Volume path (e.g., "/volume1") or None if not detectable
     """
-
-    def _volume_of(path_str: str) -> Optional[str]:
-        parts = path_str.split("/")
-        if len(parts) >= 2 and _VOLUME_RE.match(parts[1]):
-            return "/" + parts[1]
-        return None
-
     pkg_dest = os.environ.get("SYNOPKG_PKGDEST", "")
     if pkg_dest:
         vol = _volume_of(pkg_dest)
@@ -280,34 +282,37 @@ def active_version(home: Path) -> Optional[str]:
 
 def list_installed_versions(home: Path) -> List[str]:
     """List all installed versions, sorted by semantic version (newest first)."""
-    vdir = versions_dir(home)
-    if not vdir.exists():
-        return []
-
     versions = []
-    for item in vdir.iterdir():
-        if not item.is_dir() or item.name.startswith("."):
-            continue
-        if not VERSION_RE.match(item.name):
-            continue
-        # Verify it has a venv (properly installed)
-        if (item / "cli" / "venv").exists():
-            versions.append(item.name)
+    try:
+        with os.scandir(str(versions_dir(home))) as it:
+            for entry in it:
+                # VERSION_RE also rejects dot-names (staging trees, tmp files)
+                if not VERSION_RE.match(entry.name) or not entry.is_dir():
+                    continue
+                # Verify it has a venv (properly installed)
+                if os.path.isdir(os.path.join(entry.path, "cli", "venv")):
+                    versions.append(entry.name)
+    except FileNotFoundError:
+        return []
 
     return sorted(versions, key=lambda v: tuple(int(p) for p in v.split(".")), reverse=True)
 
 
+# Leaf directories of the shared structure; intermediates come from parents=True.
+_SHARED_DIR_LEAVES = (
+    "versions",
+    "config/traefik",
+    "data/traefik/config",
+    "data/portainer",
+    "data/cloudflared",
+    "bin",
+)
+
+
 def ensure_directory_structure(home: Path) -> None:
     """Create the shared directory structure for an installation."""
-    (home / "versions").mkdir(parents=True, exist_ok=True)
-    (home / "config").mkdir(exist_ok=True)
-    (home / "config" / "traefik").mkdir(exist_ok=True)
-    (home / "data").mkdir(exist_ok=True)
-    (home / "data" / "traefik").mkdir(exist_ok=True)
-    (home / "data" / "traefik" / "config").mkdir(exist_ok=True)
-    (home / "data" / "portainer").mkdir(exist_ok=True)
-    (home / "data" / "cloudflared").mkdir(exist_ok=True)
-    (home / "bin").mkdir(exist_ok=True)
+    for rel in _SHARED_DIR_LEAVES:
+        (home / rel).mkdir(parents=True, exist_ok=True)
 
 
 def update_current_symlink(home: Path, version: str) -> None:
@@ -358,8 +363,14 @@ fi
 """.format(
         home=home
     )
-    wrapper_path.write_text(wrapper_content)
-    wrapper_path.chmod(0o755)
+    # Rewritten on every activate: one open/write/close, with fchmod on the fd
+    # so the mode doesn't depend on the caller's umask.
+    fd = os.open(str(wrapper_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        os.fchmod(fd, 0o755)
+        os.write(fd, wrapper_content.encode())
+    finally:
+        os.close(fd)
     return wrapper_path
 
 
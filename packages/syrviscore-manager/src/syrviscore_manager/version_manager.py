@@ -18,8 +18,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Deque, Dict, List, Optional
 
 from . import backup, downloader, manifest, paths
 from .__version__ import __version__
@@ -70,16 +72,37 @@ def _create_venv(venv_path: Path) -> None:
         raise InstallError("Failed to create venv: {}".format(result.stderr.strip()))
 
 
+# Lines of pip output kept for the error message when an install fails.
+_PIP_OUTPUT_TAIL = 200
+
+
 def _pip_install_wheel(venv_path: Path, wheel_path: Path) -> None:
+    # One pip process upgrades pip and installs the wheel: each pip spawn costs
+    # a full interpreter start + pip import on the NAS. (`venv --upgrade-deps`
+    # would fold this into venv creation, but it needs Python 3.9; DSM is 3.8.)
     pip_path = venv_path / "bin" / "pip"
-    subprocess.run([str(pip_path), "install", "--upgrade", "pip", "--quiet"], capture_output=True)
-    result = subprocess.run(
-        [str(pip_path), "install", "--no-cache-dir", "--quiet", str(wheel_path)],
-        capture_output=True,
+    # Stream the output and keep only its tail: capture_output would hold all
+    # of it (a whole dependency tree's worth) in memory until pip exits.
+    tail: Deque[str] = deque(maxlen=_PIP_OUTPUT_TAIL)
+    with subprocess.Popen(
+        [
+            str(pip_path),
+            "install",
+            "--no-cache-dir",
+            "--quiet",
+            "--upgrade",
+            "pip",
+            str(wheel_path),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
-    if result.returncode != 0:
-        raise InstallError("pip install failed: {}".format(result.stderr.strip()))
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line.rstrip("\n"))
+    if proc.returncode != 0:
+        raise InstallError("pip install failed: {}".format("\n".join(tail).strip()))
 
 
 def _verify_cli_executes(syrvis_bin: Path) -> None:
@@ -144,23 +167,29 @@ def _fixup_relocated_venv(venv_dir: Path, old_prefix: str, new_prefix: str) -> N
     Console-script shebangs and activate scripts embed the venv's absolute
     path at creation time; after the staging-directory rename they would
     point at the (now gone) staging path.
+
+    Rewrites in place (the file keeps its mode); set_tree_readable runs right
+    after and normalizes bin/* to 755 regardless, so no stat/chmod per script.
     """
     bin_dir = venv_dir / "bin"
-    if not bin_dir.is_dir():
-        return
     old_bytes = old_prefix.encode()
     new_bytes = new_prefix.encode()
-    for item in bin_dir.iterdir():
-        if not item.is_file() or item.is_symlink():
+    try:
+        with os.scandir(str(bin_dir)) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        # d_type answers both checks without a stat per entry
+        if not entry.is_file(follow_symlinks=False):
             continue
+        item = Path(entry.path)
         try:
             content = item.read_bytes()
         except OSError:
             continue
         if old_bytes in content:
-            mode = item.stat().st_mode
             item.write_bytes(content.replace(old_bytes, new_bytes))
-            item.chmod(mode)
 
 
 # =============================================================================
@@ -168,18 +197,89 @@ def _fixup_relocated_venv(venv_dir: Path, old_prefix: str, new_prefix: str) -> N
 # =============================================================================
 
 
+# chmod/unlink release the GIL, so a small pool overlaps the per-file syscalls
+# (a real win on slow NAS flash). Each in-flight batch holds a dup'd directory
+# fd; the pending cap keeps that well under the process fd limit. (io_uring is
+# no help here: it has no chmod opcode, and the manager ships pure-Python only.)
+_TREE_WORKERS = 8
+_TREE_MAX_PENDING = 64
+
+
+def _chmod_dir_entries(dirfd: int, names: List[str], mode: int) -> None:
+    """chmod ``names`` relative to ``dirfd``, then close the (dup'd) fd."""
+    try:
+        for name in names:
+            try:
+                os.chmod(name, mode, dir_fd=dirfd)
+            except OSError:
+                continue  # e.g. broken symlinks inside venvs
+    finally:
+        os.close(dirfd)
+
+
 def set_tree_readable(path: Path) -> None:
-    """Recursively set directories to 755 and files to 644 (bin/* to 755)."""
-    for item in [path] + list(path.rglob("*")):
-        try:
-            if item.is_dir():
-                item.chmod(0o755)
-            elif item.parent.name == "bin":
-                item.chmod(0o755)
-            else:
-                item.chmod(0o644)
-        except OSError:
-            continue  # e.g. broken symlinks inside venvs
+    """Recursively set directories to 755 and files to 644 (bin/* to 755).
+
+    Walks with ``os.fwalk`` and chmods relative to each directory's fd, so the
+    kernel resolves one name per call instead of the full path — a fresh venv
+    is thousands of entries, several levels deep. Each directory's files are
+    chmodded as one batch on a small thread pool while the walk continues.
+    """
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=_TREE_WORKERS) as pool:
+        for root, _dirs, files, rootfd in os.fwalk(str(path)):
+            try:
+                os.fchmod(rootfd, 0o755)
+            except OSError:
+                pass
+            if not files:
+                continue
+            mode = 0o755 if os.path.basename(root) == "bin" else 0o644
+            # fwalk closes rootfd when it advances; the batch gets its own copy.
+            pending.append(pool.submit(_chmod_dir_entries, os.dup(rootfd), files, mode))
+            if len(pending) >= _TREE_MAX_PENDING:
+                pending.popleft().result()
+        for future in pending:
+            future.result()
+
+
+def _unlink_dir_entries(dirfd: int, names: List[str]) -> None:
+    """unlink ``names`` relative to ``dirfd``, then close the (dup'd) fd."""
+    try:
+        for name in names:
+            os.unlink(name, dir_fd=dirfd)
+    finally:
+        os.close(dirfd)
+
+
+def remove_tree(path: Path) -> None:
+    """Delete a directory tree, e.g. an old version's venv.
+
+    Same shape as ``set_tree_readable``: a bottom-up ``os.fwalk`` hands each
+    directory's files to the pool as one ``unlink(dir_fd=...)`` batch. The
+    now-empty directories are removed once every batch has finished; the walk
+    order already lists children before their parents. Symlinks are unlinked,
+    never followed (venvs carry ``lib64 -> lib``).
+    """
+    subdirs: List[str] = []
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=_TREE_WORKERS) as pool:
+        for root, dirs, files, rootfd in os.fwalk(str(path), topdown=False):
+            for name in dirs:
+                if os.path.islink(os.path.join(root, name)):
+                    files.append(name)
+                else:
+                    subdirs.append(os.path.join(root, name))
+            if not files:
+                continue
+            pending.append(pool.submit(_unlink_dir_entries, os.dup(rootfd), files))
+            if len(pending) >= _TREE_MAX_PENDING:
+                pending.popleft().result()
+        for future in pending:
+            future.result()
+    for subdir in subdirs:
+        os.rmdir(subdir)
+    os.rmdir(str(path))
 
 
 # =============================================================================
@@ -200,13 +300,16 @@ def _build_version_tree(
     cli_dir.mkdir(parents=True, exist_ok=True)
     (build_dir / "build").mkdir(exist_ok=True)
 
-    # Cache the wheel inside the version tree (required for backup/restore)
+    # Cache the wheel inside the version tree (required for backup/restore).
+    # pip installs from this copy, so the wheel crosses the disk once. copyfile
+    # skips copy's chmod (set_tree_readable normalizes modes after the swap);
+    # no hardlink — the cache must not alias a wheel the caller may rebuild.
     wheel_cache = build_dir / "wheel"
     wheel_cache.mkdir(exist_ok=True)
-    shutil.copy(str(wheel_path), str(wheel_cache / wheel_path.name))
+    shutil.copyfile(str(wheel_path), str(wheel_cache / wheel_path.name))
 
     if config_path and config_path.exists():
-        shutil.copy(str(config_path), str(build_dir / "build" / "config.yaml"))
+        shutil.copyfile(str(config_path), str(build_dir / "build" / "config.yaml"))
 
     venv_path = cli_dir / "venv"
     log("Creating virtual environment...")
@@ -284,7 +387,7 @@ def install_version(
             raise
 
         if old_dir.exists():
-            shutil.rmtree(str(old_dir))
+            remove_tree(old_dir)
         manifest.add_version_to_manifest(home, version, "available")
 
 
@@ -306,14 +409,18 @@ def uninstall_version(home: Path, version: str) -> None:
                 "activate another version first".format(version)
             )
 
-        vdir = paths.version_dir(home, version)
-        if not vdir.exists():
+        if not _version_dir_exists(home, version):
             raise VersionNotFoundError("Version {} is not installed".format(version))
 
-        shutil.rmtree(str(vdir))
+        remove_tree(paths.version_dir(home, version))
         manifest.remove_version_from_manifest(home, version)
 
 
+def _version_dir_exists(home: Path, version: str) -> bool:
+    """One stat on the joined path string; ``version`` must already be validated."""
+    return os.path.isdir(os.path.join(str(home), "versions", version))
+
+
 def _parse_semver(value: str) -> Optional[tuple]:
     """Parse 'MAJOR.MINOR.PATCH' into a comparable tuple; None if malformed."""
     try:
@@ -397,9 +504,9 @@ def activate_version(home: Path, version: str, log: LogCallback = _noop_log) ->
     version = paths.validate_version(version)
 
     with hold_lock(home):
-        vdir = paths.version_dir(home, version)
-        if not vdir.exists():
+        if not _version_dir_exists(home, version):
             raise VersionNotFoundError("Version {} is not installed".format(version))
+        vdir = paths.version_dir(home, version)
         if not (vdir / "cli" / "venv" / "bin" / "syrvis").exists():
             raise VersionNotFoundError(
                 "Version {} is incomplete (no working venv); reinstall it".format(version)
@@ -481,12 +588,7 @@ def download_and_install(
     log("      Version: {}".format(version))
 
     # Early exit if already installed (before any download)
-    already_installed = False
-    try:
-        already_installed = paths.version_dir(home, version).exists()
-    except Exception:
-        already_installed = False
-    if already_installed and not force:
+    if _version_dir_exists(home, version) and not force:
         if confirm_reinstall is None or not confirm_reinstall(
             "Version {} already installed. Reinstall?".format(version)
         ):
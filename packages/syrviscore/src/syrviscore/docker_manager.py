@@ -4,12 +4,17 @@ Docker container management for SyrvisCore.
 Manages core services using Docker SDK and docker-compose.
 """
 
+import hashlib
+import os
 import subprocess
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import docker
+import requests
 from docker.errors import DockerException
 from dotenv import load_dotenv
 
@@ -18,6 +23,7 @@ from syrviscore.errors import SyrvisError
 from syrviscore.paths import (
     get_docker_compose_path,
     get_env_path,
+    get_state_dir,
     get_syrvis_home,
     validate_docker_compose_exists,
 )
@@ -27,6 +33,27 @@ from syrviscore.traefik_config import (
 )
 
 
+# Per-container SDK calls are blocking HTTP requests over the Docker socket, so
+# a small pool overlaps their stop timeouts instead of paying them in series.
+# One pool per process, started on first use, so commands that fan out more
+# than once (clean's phases, status + logs) don't respawn threads each time.
+# (docker-py is synchronous; an asyncio/aiodocker port would mean a second
+# client stack for the same handful of concurrent calls.)
+_DOCKER_WORKERS = 8
+_docker_pool: Optional[ThreadPoolExecutor] = None
+_docker_pool_lock = threading.Lock()
+
+# One client per process: from_env() builds a fresh HTTP adapter and every
+# DockerManager() used to pay that plus a ping round trip. The client is
+# re-pinged once its last successful ping is older than the TTL, so a
+# long-running process (the dashboard) still sees the daemon go away; a failed
+# ping drops the client.
+_SHARED_CLIENT_PING_TTL = 5.0
+_shared_client: Optional[docker.DockerClient] = None
+_shared_client_pinged_at = 0.0
+_shared_client_lock = threading.Lock()
+
+
 class DockerConnectionError(SyrvisError):
     """Raised when cannot connect to Docker daemon."""
 
@@ -39,6 +66,50 @@ class DockerError(SyrvisError):
     code = "docker_error"
 
 
+# (path, st_mtime_ns, st_size) of the .env last loaded into os.environ.
+_env_loaded: Optional[tuple] = None
+
+
+def _load_env_file(env_path: Path) -> None:
+    """``load_dotenv(override=True)``, skipped while the file is unchanged.
+
+    Every start/restart regenerates the Traefik config; re-parsing an
+    unchanged .env and re-writing the same values into os.environ each time
+    is wasted work (and churns the environment subprocesses inherit).
+    """
+    global _env_loaded
+    try:
+        st = os.stat(str(env_path))
+    except OSError:
+        return  # load_dotenv on a missing file is a no-op too
+    key = (str(env_path), st.st_mtime_ns, st.st_size)
+    if key != _env_loaded:
+        load_dotenv(env_path, override=True)
+        _env_loaded = key
+
+
+def _write_if_changed(path: Path, content: str, mode: int) -> bool:
+    """Write ``content`` to ``path`` only if it differs; return whether it did.
+
+    The existing bytes and mode come from one open + fstat, and the chmod is
+    skipped when the mode is already right, so the steady state (nothing
+    changed) is a read and no writes.
+    """
+    data = content.encode()
+    try:
+        with open(path, "rb") as f:
+            existing: Optional[bytes] = f.read()
+            current_mode: Optional[int] = os.fstat(f.fileno()).st_mode & 0o777
+    except FileNotFoundError:
+        existing, current_mode = None, None
+    changed = existing != data
+    if changed:
+        path.write_bytes(data)
+    if current_mode != mode:
+        path.chmod(mode)
+    return changed
+
+
 def write_traefik_config_files(syrvis_home: Optional[Path] = None) -> bool:
     """Write Traefik's static + dynamic config; return whether a restart is needed.
 
@@ -59,39 +130,39 @@ def write_traefik_config_files(syrvis_home: Optional[Path] = None) -> bool:
         True if the static or dynamic content differed from what was on disk
         (so the caller should restart Traefik if it is running).
     """
-    load_dotenv(get_env_path(), override=True)
+    _load_env_file(get_env_path())
 
     home = Path(syrvis_home) if syrvis_home is not None else get_syrvis_home()
     traefik_data = home / "data" / "traefik"
-    traefik_data.mkdir(parents=True, exist_ok=True)
-
-    static_path = traefik_data / "traefik.yml"
-    new_static = generate_traefik_static_config()
-    old_static = static_path.read_text() if static_path.exists() else None
-    static_changed = old_static != new_static
-    # Only touch the file on a REAL change: the stale-static drift check compares
-    # the file's mtime against Traefik's StartedAt, so a no-op regeneration that
-    # rewrote identical bytes would bump the mtime and raise a false
+    config_dir = traefik_data / "config"
+    # One stat in the steady state; config/ existing implies its parent does.
+    if not config_dir.is_dir():
+        config_dir.mkdir(parents=True, exist_ok=True)
+
+    # Only touch a file on a REAL change: the stale-static drift check compares
+    # traefik.yml's mtime against Traefik's StartedAt, so a no-op regeneration
+    # that rewrote identical bytes would bump the mtime and raise a false
     # stale_static_config flag (observed live: `stack apply` with unchanged
     # content flipped the dashboard to degraded).
-    if static_changed:
-        static_path.write_text(new_static)
-    static_path.chmod(0o644)
+    static_changed = _write_if_changed(
+        traefik_data / "traefik.yml", generate_traefik_static_config(), 0o644
+    )
 
-    config_dir = traefik_data / "config"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    dynamic_path = config_dir / "dynamic.yml"
-    new_dynamic = generate_traefik_dynamic_config()
-    old_dynamic = dynamic_path.read_text() if dynamic_path.exists() else None
-    dynamic_changed = old_dynamic != new_dynamic
-    if dynamic_changed:
-        dynamic_path.write_text(new_dynamic)
-    dynamic_path.chmod(0o644)
-
-    acme_file = traefik_data / "acme.json"
-    if not acme_file.exists():
-        acme_file.touch()
-        acme_file.chmod(0o600)
+    dynamic_changed = _write_if_changed(
+        config_dir / "dynamic.yml", generate_traefik_dynamic_config(), 0o644
+    )
+
+    # Exclusive create: never clobbers issued certificates, and the file is
+    # 0600 from the start rather than briefly umask-readable.
+    try:
+        fd = os.open(str(traefik_data / "acme.json"), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        try:
+            os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
 
     return static_changed or dynamic_changed
 
@@ -166,6 +237,76 @@ def restart_traefik_if_running(timeout: int = 10) -> bool:
     return False
 
 
+def _get_docker_pool() -> ThreadPoolExecutor:
+    """Return the process-wide worker pool for concurrent Docker API calls."""
+    global _docker_pool
+    with _docker_pool_lock:
+        if _docker_pool is None:
+            _docker_pool = ThreadPoolExecutor(
+                max_workers=_DOCKER_WORKERS, thread_name_prefix="syrvis-docker"
+            )
+        return _docker_pool
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Return the process-wide Docker client, pinging it at most once per TTL.
+
+    The one client cache for the package: DockerManager and the service status
+    lookups both go through here.
+
+    Raises:
+        DockerConnectionError: If cannot connect to Docker daemon
+    """
+    global _shared_client, _shared_client_pinged_at
+    with _shared_client_lock:
+        now = time.monotonic()
+        if _shared_client is not None and now - _shared_client_pinged_at < _SHARED_CLIENT_PING_TTL:
+            return _shared_client
+        try:
+            client = _shared_client if _shared_client is not None else docker.from_env()
+            # Test connection (a dead socket on an existing client surfaces as a
+            # requests error, not a DockerException)
+            client.ping()
+        except (DockerException, requests.exceptions.RequestException) as e:
+            _shared_client = None
+            raise DockerConnectionError(
+                f"Cannot connect to Docker daemon. Is Docker running?\nError: {e}"
+            )
+        _shared_client = client
+        _shared_client_pinged_at = now
+        return _shared_client
+
+
+def _reset_shared_client() -> None:
+    """Drop the cached client (tests; or after the daemon was restarted)."""
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = None
+
+
+# The shim's kernel ifindex changes whenever the interface is deleted and
+# recreated, so it ties the "already reconciled" marker to the live interface.
+_SHIM_IFINDEX_PATH = Path("/sys/class/net/syrvis-shim/ifindex")
+
+
+def _macvlan_shim_key(interface: str, traefik_ip: str, shim_ip: str) -> Optional[str]:
+    """Fingerprint of the desired shim plus the live one's ifindex (None if absent)."""
+    try:
+        ifindex = _SHIM_IFINDEX_PATH.read_text().strip()
+    except OSError:
+        return None
+    raw = f"{interface}|{traefik_ip}|{shim_ip}|{ifindex}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _macvlan_shim_marker() -> Optional[Path]:
+    """Path of the shim marker in the instance state dir (None if no home)."""
+    try:
+        return get_state_dir() / "macvlan_shim.ok"
+    except SyrvisError:
+        return None
+
+
 class DockerManager:
     """Manage Docker containers for SyrvisCore core services."""
 
@@ -182,14 +323,12 @@ class DockerManager:
         Raises:
             DockerConnectionError: If cannot connect to Docker daemon
         """
-        try:
-            self.client = docker.from_env()
-            # Test connection
-            self.client.ping()
-        except DockerException as e:
-            raise DockerConnectionError(
-                f"Cannot connect to Docker daemon. Is Docker running?\nError: {e}"
-            )
+        self.client = get_docker_client()
+        # Resolved on first compose call, then reused: SYRVIS_HOME resolution
+        # doesn't change within a process.
+        self._syrvis_home: Optional[Path] = None
+        self._compose_path: Optional[Path] = None
+        self._compose_prefix: tuple = ()
 
     def get_core_containers(self) -> List[docker.models.containers.Container]:
         """
@@ -211,6 +350,50 @@ class DockerManager:
         except DockerException as e:
             raise DockerConnectionError(f"Failed to list containers: {e}")
 
+    def get_service_container(self, service: str) -> Optional[docker.models.containers.Container]:
+        """
+        Get one core service's container, matched by the daemon.
+
+        Both labels go in the filter (the API ANDs them), so only the wanted
+        container comes back instead of the whole project.
+
+        Returns:
+            The Container, or None if the service has no container
+
+        Raises:
+            DockerConnectionError: If Docker daemon unreachable
+        """
+        try:
+            matches = self.client.containers.list(
+                all=True,
+                filters={
+                    "label": [
+                        f"com.docker.compose.project={self.PROJECT_NAME}",
+                        f"com.docker.compose.service={service}",
+                    ]
+                },
+            )
+        except DockerException as e:
+            raise DockerConnectionError(f"Failed to list containers: {e}")
+        return matches[0] if matches else None
+
+    def _compose_argv(self, command: List[str]) -> List[str]:
+        """Full docker-compose argv for ``command`` (validates the compose file)."""
+        # Steady state is one stat; a vanished file falls back to the full
+        # resolve + validate (which raises the user-facing error).
+        if self._compose_path is None or not self._compose_path.exists():
+            validate_docker_compose_exists()
+            self._syrvis_home = get_syrvis_home()
+            self._compose_path = get_docker_compose_path()
+            self._compose_prefix = (
+                *resolve_compose_cmd(),
+                "-f",
+                str(self._compose_path),
+                "-p",
+                self.PROJECT_NAME,
+            )
+        return [*self._compose_prefix, *command]
+
     def _run_compose_command(self, command: List[str]) -> subprocess.CompletedProcess:
         """
         Run docker-compose command.
@@ -225,22 +408,10 @@ class DockerManager:
             FileNotFoundError: If docker-compose.yaml missing
             DockerError: If command fails
         """
-        validate_docker_compose_exists()
-        syrvis_home = get_syrvis_home()
-
-        full_command = (
-            resolve_compose_cmd()
-            + [
-                "-f",
-                str(get_docker_compose_path()),
-                "-p",
-                self.PROJECT_NAME,
-            ]
-            + command
-        )
+        full_command = self._compose_argv(command)
 
         result = subprocess.run(
-            full_command, cwd=str(syrvis_home), capture_output=True, text=True, check=False
+            full_command, cwd=str(self._syrvis_home), capture_output=True, text=True, check=False
         )
 
         if result.returncode != 0:
@@ -277,7 +448,6 @@ class DockerManager:
             work), else None. The library never prints — the caller renders it,
             so the shared library stays silent for the dashboard/MCP adapters.
         """
-        import os
         from . import privileged_ops
 
         # Get network settings from environment
@@ -297,11 +467,31 @@ class DockerManager:
             except (IndexError, ValueError):
                 return None  # Skip if IP format is unexpected
 
+        # Steady state: the shim we last reconciled is still the live interface
+        # (same ifindex) with the same settings, so skip the `ip` shell-outs.
+        key = _macvlan_shim_key(interface, traefik_ip, shim_ip)
+        marker = _macvlan_shim_marker()
+        if key is not None and marker is not None:
+            try:
+                if marker.read_text() == key:
+                    return None
+            except OSError:
+                pass
+
         # Create shim (requires root, but we're already elevated for Docker)
         ok, msg = privileged_ops.ensure_macvlan_shim(interface, traefik_ip, shim_ip)
         if not ok:
             # Surface as a warning but don't fail — services might still work.
             return str(msg)
+
+        # Re-read the ifindex: the call may have (re)created the interface.
+        key = _macvlan_shim_key(interface, traefik_ip, shim_ip)
+        if key is not None and marker is not None:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.write_text(key)
+            except OSError:
+                pass  # best-effort cache; next start just reconciles again
         return None
 
     def start_core_services(self, allow_halted: bool = False) -> List[str]:
@@ -348,13 +538,31 @@ class DockerManager:
 
     def stop_core_services(self) -> None:
         """
-        Stop core services using docker-compose.
+        Stop core services via the SDK, concurrently.
+
+        Equivalent to ``compose stop`` (containers are kept, 10s grace each) but
+        reuses this client's connection instead of spawning compose, and the
+        grace periods overlap rather than add up. Start and restart stay on
+        compose: they must (re)create containers from the compose spec.
 
         Raises:
-            FileNotFoundError: If docker-compose.yaml missing
-            DockerError: If docker-compose fails
+            DockerConnectionError: If Docker daemon unreachable
+            DockerError: If any container fails to stop
         """
-        self._run_compose_command(["stop"])
+        containers = self.get_core_containers()
+        if not containers:
+            return
+
+        def _stop(container) -> Optional[str]:
+            try:
+                container.stop(timeout=10)
+            except DockerException as e:
+                return f"{container.name}: {e}"
+            return None
+
+        failures = [err for err in _get_docker_pool().map(_stop, containers) if err]
+        if failures:
+            raise DockerError("Failed to stop core services:\n" + "\n".join(failures))
 
     def stop_core_container(self, name: str, timeout: int = 30) -> None:
         """Gracefully stop ONE core container by name via the SDK.
@@ -410,39 +618,36 @@ class DockerManager:
             "errors": [],
         }
 
-        # Stop and remove containers by name (more reliable than compose labels)
-        for container_name in self.CORE_SERVICES:
-            try:
-                container = self.client.containers.get(container_name)
-                container.stop(timeout=10)
-                container.remove(force=True)
-                results["containers_removed"] += 1
-                results["containers_stopped"].append(container_name)
-            except docker.errors.NotFound:
-                pass  # Container doesn't exist
-            except Exception as e:
-                results["errors"].append(f"Container {container_name}: {e}")
-
-        # Also try to get containers by compose project label (catches renamed containers)
+        # Containers by exact name (more reliable than compose labels) plus any
+        # carrying the compose project label (catches renamed containers), from
+        # ONE low-level listing — no per-name lookups, no per-container inspect.
+        # Keyed by id so a container matching both is handled once, then all are
+        # stopped+removed concurrently: each stop may sit out its full 10s grace.
+        project_label = "com.docker.compose.project"
+        targets: Dict[str, str] = {}
         try:
-            containers = self.client.containers.list(
-                all=True,
-                filters={"label": f"com.docker.compose.project={self.PROJECT_NAME}"},
-            )
-            for container in containers:
-                try:
-                    container_name = container.name
-                    container.stop(timeout=10)
-                    container.remove(force=True)
-                    results["containers_removed"] += 1
-                    if container_name not in results["containers_stopped"]:
-                        results["containers_stopped"].append(container_name)
-                except Exception as e:
-                    results["errors"].append(f"Container {container.name}: {e}")
+            for entry in self.client.api.containers(all=True):
+                names = entry.get("Names") or []
+                name = names[0].lstrip("/") if names else entry["Id"][:12]
+                labels = entry.get("Labels") or {}
+                if name in self.CORE_SERVICES or labels.get(project_label) == self.PROJECT_NAME:
+                    targets[entry["Id"]] = name
         except Exception as e:
             results["errors"].append(f"Listing containers: {e}")
 
-        # Remove networks - try various naming patterns
+        def _stop_and_remove(target):
+            container_id, container_name = target
+            try:
+                self.client.api.stop(container_id, timeout=10)
+                self.client.api.remove_container(container_id, force=True)
+            except Exception as e:
+                return container_name, f"Container {container_name}: {e}"
+            return container_name, None
+
+        # Networks created by compose carry the project label and are pruned in
+        # one daemon call once the containers are gone. The known names below
+        # also cover legacy/unlabelled ones (e.g. the old `config` project);
+        # whichever of those still exist after the prune are removed by name.
         network_patterns = [
             "proxy",
             "syrvis-macvlan",
@@ -452,13 +657,15 @@ class DockerManager:
             "config_proxy",
         ]
 
-        for network_name in network_patterns:
+        def _remove_network(network_name):
             try:
                 network = self.client.networks.get(network_name)
-                # Disconnect any remaining containers first
+                # Disconnect any remaining containers first. get() is already a
+                # full inspect, so attrs carries Containers; reload only if not.
                 try:
-                    network.reload()
-                    for container_id in network.attrs.get("Containers", {}).keys():
+                    if "Containers" not in network.attrs:
+                        network.reload()
+                    for container_id in (network.attrs.get("Containers") or {}).keys():
                         try:
                             network.disconnect(container_id, force=True)
                         except Exception:
@@ -466,31 +673,72 @@ class DockerManager:
                 except Exception:
                     pass
                 network.remove()
-                results["networks_removed"] += 1
-                results["networks_cleaned"].append(network_name)
             except docker.errors.NotFound:
-                pass  # Network doesn't exist
+                return network_name, False, None  # Network doesn't exist
             except Exception as e:
                 # Only log error if it's not a "not found" type error
                 if "not found" not in str(e).lower():
-                    results["errors"].append(f"Network {network_name}: {e}")
+                    return network_name, False, f"Network {network_name}: {e}"
+                return network_name, False, None
+            return network_name, True, None
+
+        volume_patterns = [
+            f"{self.PROJECT_NAME}_traefik_data",
+            f"{self.PROJECT_NAME}_portainer_data",
+        ]
+
+        def _remove_volume(volume_name):
+            try:
+                self.client.volumes.get(volume_name).remove(force=True)
+            except docker.errors.NotFound:
+                return volume_name, False, None
+            except Exception as e:
+                return volume_name, False, f"Volume {volume_name}: {e}"
+            return volume_name, True, None
+
+        # Phases stay ordered (a network can't go while containers use it); the
+        # work within each phase runs in parallel. map() keeps result order.
+        pool = _get_docker_pool()
+        for container_name, err in pool.map(_stop_and_remove, targets.items()):
+            if err:
+                results["errors"].append(err)
+            else:
+                results["containers_removed"] += 1
+                results["containers_stopped"].append(container_name)
+
+        try:
+            pruned = self.client.networks.prune(
+                filters={"label": f"com.docker.compose.project={self.PROJECT_NAME}"}
+            )
+            for network_name in (pruned or {}).get("NetworksDeleted") or []:
+                results["networks_removed"] += 1
+                results["networks_cleaned"].append(network_name)
+        except Exception as e:
+            results["errors"].append(f"Pruning networks: {e}")
+
+        try:
+            existing = {n.get("Name") for n in self.client.api.networks()}
+        except Exception as e:
+            results["errors"].append(f"Listing networks: {e}")
+            existing = set()
+        leftovers = [
+            n for n in network_patterns if n in existing and n not in results["networks_cleaned"]
+        ]
+        for network_name, removed, err in pool.map(_remove_network, leftovers):
+            if removed:
+                results["networks_removed"] += 1
+                results["networks_cleaned"].append(network_name)
+            elif err:
+                results["errors"].append(err)
 
         # Optionally remove volumes
         if remove_volumes:
-            volume_patterns = [
-                f"{self.PROJECT_NAME}_traefik_data",
-                f"{self.PROJECT_NAME}_portainer_data",
-            ]
-            for volume_name in volume_patterns:
-                try:
-                    volume = self.client.volumes.get(volume_name)
-                    volume.remove(force=True)
+            for volume_name, removed, err in pool.map(_remove_volume, volume_patterns):
+                if removed:
                     results["volumes_removed"] += 1
                     results["volumes_cleaned"].append(volume_name)
-                except docker.errors.NotFound:
-                    pass
-                except Exception as e:
-                    results["errors"].append(f"Volume {volume_name}: {e}")
+                elif err:
+                    results["errors"].append(err)
 
         return results
 
@@ -563,41 +811,61 @@ class DockerManager:
         Raises:
             DockerConnectionError: If Docker daemon unreachable
         """
-        containers = self.get_core_containers()
+        # One low-level list call carries everything needed (Names, State,
+        # Created, Image, Labels). The high-level containers.list() re-inspects
+        # every container, i.e. N+1 round trips over the socket.
+        try:
+            containers = self.client.api.containers(
+                all=True,
+                filters={"label": f"com.docker.compose.project={self.PROJECT_NAME}"},
+            )
+        except DockerException as e:
+            raise DockerConnectionError(f"Failed to list containers: {e}")
+
         status_dict = {}
+        now = time.time()
 
         for container in containers:
+            names = container.get("Names") or []
+            name = names[0].lstrip("/") if names else container.get("Id", "")[:12]
+            labels = container.get("Labels") or {}
             # Get service name from compose label
-            service_name = container.labels.get("com.docker.compose.service", container.name)
+            service_name = labels.get("com.docker.compose.service", name)
 
-            # Calculate uptime
-            created_at = container.attrs.get("Created", "")
-            if created_at:
-                try:
-                    created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    uptime_seconds = (datetime.now(created.tzinfo) - created).total_seconds()
-                    uptime = self._format_uptime(uptime_seconds)
-                except Exception:
-                    uptime = "Unknown"
+            # The list endpoint reports Created as epoch seconds: one subtraction.
+            created = container.get("Created")
+            if isinstance(created, (int, float)) and created > 0:
+                uptime = self._format_uptime(now - created)
             else:
                 uptime = "Unknown"
 
-            # Use the image reference the container was created with (Config.Image),
-            # not image.tags[0] — a pulled image can carry several tags and tags[0]
-            # may not be the one compose declared (causes false image_mismatch drift).
-            configured_image = container.attrs.get("Config", {}).get("Image")
-            if not configured_image:
-                configured_image = container.image.tags[0] if container.image.tags else "Unknown"
-
             status_dict[service_name] = {
-                "name": container.name,
-                "status": container.status,
+                "name": name,
+                "status": container.get("State", "unknown"),
                 "uptime": uptime,
-                "image": configured_image,
+                "image": self._configured_image(container),
             }
 
         return status_dict
 
+    def _configured_image(self, container: dict) -> str:
+        """
+        Image reference a listed container was created with (Config.Image).
+
+        The list endpoint's ``Image`` is only that reference while the tag still
+        resolves to the container's image; once the tag is re-pulled or moved the
+        daemon reports the ``sha256:`` image ID instead, which drift would flag as
+        a false image_mismatch. Only in that case, inspect the one container.
+        """
+        image = container.get("Image") or ""
+        if image.startswith("sha256:"):
+            try:
+                attrs = self.client.api.inspect_container(container.get("Id", ""))
+                image = (attrs.get("Config") or {}).get("Image") or image
+            except DockerException:
+                pass
+        return image or "Unknown"
+
     def get_container_logs(
         self, service: Optional[str] = None, follow: bool = False, tail: int = 100
     ) -> str:
@@ -617,16 +885,9 @@ class DockerManager:
             DockerConnectionError: If Docker daemon unreachable
             ValueError: If service not found
         """
-        containers = self.get_core_containers()
-
         if service:
-            # Find specific service
-            container = None
-            for c in containers:
-                service_name = c.labels.get("com.docker.compose.service")
-                if service_name == service:
-                    container = c
-                    break
+            # Find specific service (the daemon does the label match)
+            container = self.get_service_container(service)
 
             if not container:
                 # Fall back to a Layer 2 service — its container runs in its own
@@ -636,51 +897,96 @@ class DockerManager:
                 container = self._find_l2_container(service)
 
             if not container:
-                available = [c.labels.get("com.docker.compose.service", c.name) for c in containers]
+                available = [self._service_name(c) for c in self.get_core_containers()]
                 raise ValueError(
                     f"Service '{service}' not found. Available services: {', '.join(available)}"
                 )
 
             containers = [container]
+        else:
+            containers = self.get_core_containers()
 
         if not containers:
             return "No containers found"
 
         if follow:
-            # Core services stream via `docker compose logs -f`; a resolved Layer 2
-            # container (its own compose project) streams directly from the container.
-            is_l2 = bool(
-                service
-                and containers
-                and containers[0].labels.get("com.docker.compose.project") != self.PROJECT_NAME
-            )
             try:
-                if is_l2:
-                    for chunk in containers[0].logs(stream=True, follow=True, tail=tail):
-                        print(chunk.decode("utf-8", errors="replace"), end="")
-                else:
-                    cmd = ["logs", "-f", "--tail", str(tail)]
-                    if service:
-                        cmd.append(service)
-                    self._run_compose_command(cmd)
-            except (subprocess.CalledProcessError, KeyboardInterrupt):
+                self._follow_logs(containers, tail)
+            except KeyboardInterrupt:
                 # User likely interrupted with Ctrl+C
                 pass
             return ""
         else:
-            # Get logs from all containers
-            logs = []
-            for container in containers:
-                service_name = container.labels.get("com.docker.compose.service", container.name)
-                logs.append(f"=== {service_name} ===")
+            # Get logs from all containers: one HTTP GET each, fetched in parallel
+            # (map keeps container order in the output).
+            def _fetch(container) -> bytes:
                 try:
-                    container_logs = container.logs(tail=tail, timestamps=True).decode("utf-8")
-                    logs.append(container_logs)
+                    return container.logs(tail=tail, timestamps=True)
                 except Exception as e:
-                    logs.append(f"Error getting logs: {e}")
-                logs.append("")
+                    return f"Error getting logs: {e}".encode()
+
+            fetched = list(_get_docker_pool().map(_fetch, containers))
+
+            # Assemble the raw bytes once and decode once: a large --tail is not
+            # copied again per container, and stray non-UTF-8 bytes in a log are
+            # replaced rather than failing that container's section.
+            buf = bytearray()
+            for i, (container, container_logs) in enumerate(zip(containers, fetched)):
+                if i:
+                    buf += b"\n"
+                buf += f"=== {self._service_name(container)} ===\n".encode()
+                buf += container_logs
+                buf += b"\n"
+
+            return buf.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _service_name(container) -> str:
+        """Compose service label, else the container name.
+
+        Reads ``labels`` once: on docker-py it is a property over ``attrs``,
+        and it can be None for a container created without labels.
+        """
+        labels = container.labels or {}
+        return labels.get("com.docker.compose.service", container.name)
+
+    @staticmethod
+    def _follow_logs(containers: list, tail: int) -> None:
+        """Stream container logs to stdout until interrupted, via the SDK.
+
+        Each container's follow generator reads straight off the daemon socket
+        (no compose process). A single container streams raw; several are
+        multiplexed compose-style (``<service> | <line>``), one daemon thread
+        per container so Ctrl+C in the main thread always ends the command.
+        """
+        if len(containers) == 1:
+            for chunk in containers[0].logs(stream=True, follow=True, tail=tail):
+                print(chunk.decode("utf-8", errors="replace"), end="", flush=True)
+            return
+
+        lock = threading.Lock()
+
+        def _pump(container) -> None:
+            prefix = f"{DockerManager._service_name(container)} | "
+            pending = ""
+            try:
+                for chunk in container.logs(stream=True, follow=True, tail=tail):
+                    pending += chunk.decode("utf-8", errors="replace")
+                    *lines, pending = pending.split("\n")
+                    if lines:
+                        with lock:
+                            print(
+                                "".join(f"{prefix}{line}\n" for line in lines), end="", flush=True
+                            )
+            except Exception:  # noqa: BLE001 - container went away; others keep streaming
+                pass
 
-            return "\n".join(logs)
+        threads = [threading.Thread(target=_pump, args=(c,), daemon=True) for c in containers]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(0.5)
 
     def _find_l2_container(self, service: str):
         """Resolve a Layer 2 service's container by its per-service compose project.
@@ -1,11 +1,15 @@
 """Doctor command for SyrvisCore - diagnose and fix installation issues."""
 
 import click
+import json
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, TypeVar
 
+from . import paths
 from . import remediation
 from .validators import (
     CheckResult,
@@ -22,16 +26,41 @@ from .validators import (
     check_tcp_port,
 )
 
+T = TypeVar("T")
+
+# Upper bound on concurrent network probes. Each DNS check shells out to
+# nslookup, so this also caps how many subprocesses doctor has in flight.
+_MAX_PROBES = 16
+
+
+def _probe_all(check: Callable[..., T], *arg_lists: list) -> List[T]:
+    """Run a blocking network check over every argument set concurrently.
+
+    The checks are I/O bound (DNS, TCP, TLS, HTTP), so threads collapse the
+    wall time from the sum of the round trips to roughly the slowest one.
+    Results come back in input order so the report reads the same as a serial
+    run.
+    """
+    count = len(arg_lists[0]) if arg_lists else 0
+    if count <= 1:
+        return [check(*args) for args in zip(*arg_lists)]
+    with ThreadPoolExecutor(max_workers=min(_MAX_PROBES, count)) as pool:
+        return list(pool.map(check, *arg_lists))
+
 
 # =============================================================================
 # Output Formatting
 # =============================================================================
 
 
+def _section_lines(title: str) -> List[str]:
+    """Lines of a section header, for runners that emit a section in one write."""
+    return [title, "-" * 70]
+
+
 def print_section(title: str):
     """Print a section header."""
-    click.echo(title)
-    click.echo("-" * 70)
+    click.echo("\n".join(_section_lines(title)))
 
 
 def print_check(result: CheckResult, verbose: bool = False):
@@ -61,89 +90,193 @@ def print_report(report: ValidationReport, verbose: bool = False):
 # =============================================================================
 
 
-def run_dns_checks(endpoints: List[dict], verbose: bool = False) -> List[str]:
-    """Run DNS validation for all endpoints."""
-    print_section("DNS Resolution")
+def _unique_by_domain(endpoints: List[dict]) -> List[dict]:
+    """The first endpoint for each domain, in order."""
+    unique: Dict[str, dict] = {}
+    for endpoint in endpoints:
+        unique.setdefault(endpoint["domain"], endpoint)
+    return list(unique.values())
+
+
+# Healthy DNS answers are recorded for this long and reused by a later doctor
+# run only on request (--cached-dns): doctor usually runs right after something
+# broke, so by default every record is resolved live. Neither gethostbyname nor
+# nslookup exposes the record TTL, so this is a fixed, short window. Failures
+# are never cached.
+_DNS_CACHE_TTL = 120
+
+
+def _dns_cache_path() -> Optional[Path]:
+    """Where doctor keeps recent healthy DNS answers (None without an install)."""
+    try:
+        return paths.get_state_dir() / "doctor_dns.json"
+    except paths.SyrvisHomeError:
+        return None
+
+
+def _load_dns_cache(now: float) -> Dict[str, dict]:
+    """Unexpired cache entries ({"expires", "result"}) keyed by "domain|expected_ip"."""
+    cache_path = _dns_cache_path()
+    if cache_path is None:
+        return {}
+    try:
+        entries = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict) and entry.get("expires", 0) > now and "result" in entry
+    }
+
+
+def _save_dns_cache(entries: Dict[str, dict]) -> None:
+    """Best-effort write of the DNS cache; doctor must not fail on it."""
+    cache_path = _dns_cache_path()
+    if cache_path is None:
+        return
+    tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(entries))
+        os.replace(str(tmp), str(cache_path))
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _dns_result_healthy(dns_result: dict, expected_ip: str) -> bool:
+    """True if this result reports no DNS issue."""
+    if not (dns_result["local"]["ok"] and dns_result["public"]["ok"]):
+        return False
+    return not expected_ip or bool(dns_result.get("correct"))
+
+
+def run_dns_checks(
+    endpoints: List[dict], verbose: bool = False, use_cache: bool = False
+) -> List[str]:
+    """Run DNS validation for all endpoints.
+
+    Healthy answers are always recorded. With ``use_cache`` (and not
+    ``verbose``, which shows the live IPs), ones from the last _DNS_CACHE_TTL
+    seconds are reused and their rows marked "(cached)".
+    """
+    lines = _section_lines("DNS Resolution")
     issues = []
 
-    for endpoint in endpoints:
+    now = time.time()
+    cache = _load_dns_cache(now)
+    keys = [f"{endpoint['domain']}|{endpoint.get('expected_ip', '')}" for endpoint in endpoints]
+    reuse = use_cache and not verbose
+    # Keyed, so an endpoint repeated under the same key is resolved once.
+    pending = {
+        key: endpoint
+        for key, endpoint in zip(keys, endpoints)
+        if not (reuse and key in cache)
+    }
+    fresh = _probe_all(
+        validate_dns,
+        [endpoint["domain"] for endpoint in pending.values()],
+        [endpoint.get("expected_ip", "") for endpoint in pending.values()],
+    )
+    resolved = dict(zip(pending, fresh))
+    if resolved:
+        for key, endpoint in pending.items():
+            if _dns_result_healthy(resolved[key], endpoint.get("expected_ip", "")):
+                cache[key] = {"expires": now + _DNS_CACHE_TTL, "result": resolved[key]}
+            else:
+                cache.pop(key, None)
+        _save_dns_cache(cache)
+    dns_results = [resolved[key] if key in resolved else cache[key]["result"] for key in keys]
+
+    for key, endpoint, dns_result in zip(keys, endpoints, dns_results):
         domain = endpoint["domain"]
+        # Only healthy (✓) rows can come from the cache.
+        shown = domain if key in resolved else f"{domain} (cached)"
         expected_ip = endpoint.get("expected_ip", "")
 
-        dns_result = validate_dns(domain, expected_ip)
         local = dns_result["local"]
         public = dns_result["public"]
 
         if local["ok"] and public["ok"]:
             # Check for valid split-horizon DNS
             if dns_result.get("split_horizon_ok"):
-                click.echo(f"  ✓ {domain}")
+                lines.append(f"  ✓ {shown}")
                 if verbose or not dns_result.get("consistent"):
-                    click.echo(
+                    lines.append(
                         f"     Local: {local['ip']} | Public: {public['ip']} (split-horizon OK)"
                     )
             elif dns_result.get("consistent"):
                 if expected_ip and local["ip"] == expected_ip:
-                    click.echo(f"  ✓ {domain}")
+                    lines.append(f"  ✓ {shown}")
                     if verbose:
-                        click.echo(f"     Local: {local['ip']} | Public: {public['ip']}")
+                        lines.append(f"     Local: {local['ip']} | Public: {public['ip']}")
                 elif expected_ip:
-                    click.echo(f"  ⚠ {domain} → {local['ip']} (expected {expected_ip})")
+                    lines.append(f"  ⚠ {domain} → {local['ip']} (expected {expected_ip})")
                     issues.append(f"{domain}: points to {local['ip']}, expected {expected_ip}")
                 else:
-                    click.echo(f"  ✓ {domain} → {local['ip']}")
+                    lines.append(f"  ✓ {shown} → {local['ip']}")
             elif expected_ip and local["ip"] != expected_ip:
-                click.echo(f"  ⚠ {domain}: Local DNS incorrect")
-                click.echo(
+                lines.append(f"  ⚠ {domain}: Local DNS incorrect")
+                lines.append(
                     f"     Local: {local['ip']} (expected {expected_ip}) | Public: {public['ip']}"
                 )
                 issues.append(f"{domain}: local ({local['ip']}) should be {expected_ip}")
             else:
-                click.echo(f"  ✓ {domain}")
+                lines.append(f"  ✓ {shown}")
                 if verbose:
-                    click.echo(f"     Local: {local['ip']} | Public: {public['ip']}")
+                    lines.append(f"     Local: {local['ip']} | Public: {public['ip']}")
         elif public["ok"]:
-            click.echo(f"  ⚠ {domain}: Local NXDOMAIN, Public: {public['ip']}")
+            lines.append(f"  ⚠ {domain}: Local NXDOMAIN, Public: {public['ip']}")
             issues.append(f"{domain}: not in local DNS")
         elif local["ok"]:
-            click.echo(f"  ✗ {domain}: Public NXDOMAIN (Let's Encrypt will fail!)")
-            click.echo(f"     Local: {local['ip']} | Public: {public['ip']}")
+            lines.append(f"  ✗ {domain}: Public NXDOMAIN (Let's Encrypt will fail!)")
+            lines.append(f"     Local: {local['ip']} | Public: {public['ip']}")
             issues.append(f"{domain}: not in public DNS - Let's Encrypt will fail")
         else:
-            click.echo(f"  ✗ {domain}: NXDOMAIN")
+            lines.append(f"  ✗ {domain}: NXDOMAIN")
             issues.append(f"{domain}: no DNS record")
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
     return issues
 
 
 def run_certificate_checks(endpoints: List[dict], verbose: bool = False) -> List[str]:
     """Run SSL certificate validation for all endpoints."""
-    print_section("SSL Certificates")
+    lines = _section_lines("SSL Certificates")
     issues = []
 
+    # Several endpoints can share a domain (path-routed services); handshake once each.
+    domains = list(dict.fromkeys(endpoint["domain"] for endpoint in endpoints))
+    by_domain = dict(zip(domains, _probe_all(check_certificate, domains)))
+
     for endpoint in endpoints:
         domain = endpoint["domain"]
-        cert_result = check_certificate(domain)
+        cert_result = by_domain[domain]
 
         if cert_result.get("error"):
-            click.echo(f"  ✗ {domain}: {cert_result['error']}")
+            lines.append(f"  ✗ {domain}: {cert_result['error']}")
             issues.append(f"Cert: {domain} - {cert_result['error']}")
         elif cert_result.get("is_letsencrypt"):
             days = cert_result.get("days_remaining", "?")
-            click.echo(f"  ✓ {domain}: Let's Encrypt (expires in {days} days)")
+            lines.append(f"  ✓ {domain}: Let's Encrypt (expires in {days} days)")
         elif cert_result.get("is_traefik_default"):
-            click.echo(f"  ✗ {domain}: Traefik default cert (no Let's Encrypt)")
+            lines.append(f"  ✗ {domain}: Traefik default cert (no Let's Encrypt)")
             issues.append(f"Cert: {domain} using Traefik default - check DNS & port 80")
         elif cert_result.get("is_self_signed"):
-            click.echo(f"  ⚠ {domain}: Self-signed certificate")
+            lines.append(f"  ⚠ {domain}: Self-signed certificate")
             if verbose:
-                click.echo(f"     Issuer: {cert_result.get('issuer', 'unknown')}")
+                lines.append(f"     Issuer: {cert_result.get('issuer', 'unknown')}")
         else:
             issuer = cert_result.get("issuer", "unknown")
-            click.echo(f"  ? {domain}: {issuer}")
+            lines.append(f"  ? {domain}: {issuer}")
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
     return issues
 
 
@@ -154,24 +287,29 @@ def run_backend_checks(endpoints: List[dict]) -> List[str]:
     if not backends:
         return []
 
-    print_section("Backend Services")
+    lines = _section_lines("Backend Services")
     issues = []
 
-    for endpoint in backends:
+    results = _probe_all(
+        check_tcp_port,
+        [endpoint["backend_host"] for endpoint in backends],
+        [endpoint["backend_port"] for endpoint in backends],
+    )
+
+    for endpoint, result in zip(backends, results):
         name = endpoint["name"]
         host = endpoint["backend_host"]
         port = endpoint["backend_port"]
 
-        result = check_tcp_port(host, port)
-
         if result["reachable"]:
-            click.echo(f"  ✓ {name}: {host}:{port} reachable")
+            lines.append(f"  ✓ {name}: {host}:{port} reachable")
         else:
             error = result.get("error", "unreachable")
-            click.echo(f"  ✗ {name}: {host}:{port} - {error}")
+            lines.append(f"  ✗ {name}: {host}:{port} - {error}")
             issues.append(f"Backend: {name} ({host}:{port}) - {error}")
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
     return issues
 
 
@@ -180,9 +318,9 @@ def run_file_sharing_checks(nas_ip: str) -> None:
     if not nas_ip:
         return
 
-    print_section("File Sharing (direct to NAS)")
-    click.echo("  Note: SMB/AFP/NFS connect directly to NAS, not through Traefik")
-    click.echo()
+    lines = _section_lines("File Sharing (direct to NAS)")
+    lines.append("  Note: SMB/AFP/NFS connect directly to NAS, not through Traefik")
+    lines.append("")
 
     services = [
         ("SMB (Windows/Mac)", 445, "smb://"),
@@ -191,41 +329,58 @@ def run_file_sharing_checks(nas_ip: str) -> None:
         ("NFS (Linux)", 2049, "nfs://"),
     ]
 
-    for name, port, url_scheme in services:
-        result = check_tcp_port(nas_ip, port)
+    results = _probe_all(
+        check_tcp_port, [nas_ip] * len(services), [port for _, port, _ in services]
+    )
+
+    for (name, port, url_scheme), result in zip(services, results):
         if result["reachable"]:
             if url_scheme:
-                click.echo(f"  ✓ {name}: {nas_ip}:{port}")
-                click.echo(f"     Connect: {url_scheme}{nas_ip}")
+                lines.append(f"  ✓ {name}: {nas_ip}:{port}")
+                lines.append(f"     Connect: {url_scheme}{nas_ip}")
             else:
-                click.echo(f"  ✓ {name}: {nas_ip}:{port}")
+                lines.append(f"  ✓ {name}: {nas_ip}:{port}")
         else:
-            click.echo(f"  - {name}: {nas_ip}:{port} (not enabled)")
+            lines.append(f"  - {name}: {nas_ip}:{port} (not enabled)")
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
+
+
+# Statuses an endpoint may answer with and still count as healthy, on top of
+# any endpoint-specific ``expected_status``.
+_DEFAULT_OK_STATUS = frozenset({200, 301, 302, 303, 307, 308})
 
 
 def run_endpoint_health_checks(endpoints: List[dict]) -> None:
     """Run HTTP endpoint health checks."""
-    print_section("Endpoint Health")
+    lines = _section_lines("Endpoint Health")
 
-    for endpoint in endpoints:
-        domain = endpoint["domain"]
-        expected_status = endpoint.get("expected_status", [200, 301, 302, 303, 307, 308])
+    results = _probe_all(
+        check_http_endpoint, [f"https://{endpoint['domain']}" for endpoint in endpoints]
+    )
 
-        result = check_http_endpoint(f"https://{domain}")
+    for endpoint, result in zip(endpoints, results):
+        domain = endpoint["domain"]
+        expected_status = endpoint.get("expected_status")
+        ok_status = (
+            _DEFAULT_OK_STATUS | frozenset(expected_status)
+            if expected_status
+            else _DEFAULT_OK_STATUS
+        )
 
         if result["reachable"]:
             status = result["status_code"]
-            if status in expected_status or status in (200, 301, 302, 303, 307, 308):
-                click.echo(f"  ✓ {domain}: HTTP {status}")
+            if status in ok_status:
+                lines.append(f"  ✓ {domain}: HTTP {status}")
             else:
-                click.echo(f"  ⚠ {domain}: HTTP {status}")
+                lines.append(f"  ⚠ {domain}: HTTP {status}")
         else:
             error = result.get("error", "unreachable")
-            click.echo(f"  ✗ {domain}: {error}")
+            lines.append(f"  ✗ {domain}: {error}")
 
-    click.echo()
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 # =============================================================================
@@ -263,7 +418,10 @@ def apply_fixes(fixable_issues: List[CheckResult], install_dir: Path = None) ->
 @click.option(
     "--network", "-n", is_flag=True, help="Run network checks only (DNS, certs, endpoints)"
 )
-def doctor(fix, verbose, network):
+@click.option(
+    "--cached-dns", is_flag=True, help="Reuse healthy DNS answers from the last two minutes"
+)
+def doctor(fix, verbose, network, cached_dns):
     """Verify SyrvisCore installation and diagnose issues."""
 
     is_root = os.getuid() == 0
@@ -290,30 +448,28 @@ def doctor(fix, verbose, network):
 
     # Skip installation checks if --network flag is set
     if not network:
-        # Installation checks
-        install_report = install_validator.validate()
-        print_report(install_report, verbose)
-        all_issues.extend([c.message for c in install_report.issues])
-        fixable_checks.extend(install_report.fixable_issues)
-
-        # Docker checks
-        docker_report = DockerValidator().validate()
-        print_report(docker_report, verbose)
-        all_issues.extend([c.message for c in docker_report.issues])
-        fixable_checks.extend(docker_report.fixable_issues)
-
-        # Configuration checks
-        if install_validator.syrvis_home:
-            config_report = config_validator.validate()
-            print_report(config_report, verbose)
-            all_issues.extend([c.message for c in config_report.issues])
-            fixable_checks.extend(config_report.fixable_issues)
-
-            # System integration checks
-            system_report = SystemValidator(install_validator.syrvis_home).validate()
-            print_report(system_report, verbose)
-            all_issues.extend([c.message for c in system_report.issues])
-            fixable_checks.extend(system_report.fixable_issues)
+        # The validators only read state (files, group db, docker/subprocess
+        # probes) and share nothing mutable, so they run concurrently; reports
+        # are printed in the fixed order below once all are in.
+        syrvis_home = install_validator.syrvis_home
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                # Installation checks
+                pool.submit(install_validator.validate),
+                # Docker checks
+                pool.submit(lambda: DockerValidator().validate()),
+            ]
+            if syrvis_home:
+                # Configuration checks
+                futures.append(pool.submit(config_validator.validate))
+                # System integration checks
+                futures.append(pool.submit(lambda: SystemValidator(syrvis_home).validate()))
+            reports = [future.result() for future in futures]
+
+        for report in reports:
+            print_report(report, verbose)
+            all_issues.extend([c.message for c in report.issues])
+            fixable_checks.extend(report.fixable_issues)
 
     # Macvlan checks
     if config_validator.get_value("TRAEFIK_IP"):
@@ -325,12 +481,17 @@ def doctor(fix, verbose, network):
     endpoints = get_configured_endpoints(config_validator)
 
     if endpoints:
+        # DNS, certificate and HTTP checks are per domain: probe (and report)
+        # each domain once even if several services route through it.
+        # Backend checks keep every endpoint (they key on host:port).
+        domain_endpoints = _unique_by_domain(endpoints)
+
         # DNS resolution
-        dns_issues = run_dns_checks(endpoints, verbose)
+        dns_issues = run_dns_checks(domain_endpoints, verbose, cached_dns)
         all_issues.extend([f"DNS: {i}" for i in dns_issues])
 
         # SSL certificates
-        cert_issues = run_certificate_checks(endpoints, verbose)
+        cert_issues = run_certificate_checks(domain_endpoints, verbose)
         all_issues.extend(cert_issues)
 
         # Backend services
@@ -342,7 +503,7 @@ def doctor(fix, verbose, network):
         run_file_sharing_checks(nas_ip)
 
         # HTTP endpoints
-        run_endpoint_health_checks(endpoints)
+        run_endpoint_health_checks(domain_endpoints)
 
     # Summary
     click.echo("=" * 70)
@@ -351,18 +512,18 @@ def doctor(fix, verbose, network):
         click.echo()
         click.echo("Your SyrvisCore installation is healthy.")
     else:
-        click.echo(f"✗ Issues Found: {len(all_issues)}")
-        click.echo()
-        for i, issue in enumerate(all_issues, 1):
-            click.echo(f"  {i}. {issue}")
-
-        click.echo()
+        summary = [f"✗ Issues Found: {len(all_issues)}", ""]
+        summary.extend(f"  {i}. {issue}" for i, issue in enumerate(all_issues, 1))
+        summary.append("")
+        click.echo("\n".join(summary))
 
         if fixable_checks and not fix:
-            click.echo(f"Fixable with --fix: {len(fixable_checks)}")
-            click.echo()
-            click.echo("Run with --fix to attempt automatic repairs:")
-            click.echo("  sudo syrvis doctor --fix")
+            click.echo(
+                f"Fixable with --fix: {len(fixable_checks)}\n"
+                "\n"
+                "Run with --fix to attempt automatic repairs:\n"
+                "  sudo syrvis doctor --fix"
+            )
         elif fix and fixable_checks:
             click.echo()
             fixed_count = apply_fixes(fixable_checks, install_validator.syrvis_home)
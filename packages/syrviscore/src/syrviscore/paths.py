@@ -15,11 +15,15 @@ Directory Structure (v3, split packages):
     └── data/                          # Persistent data
 """
 
+import functools
+import glob
 import os
 import json
+import re
+import stat
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from syrviscore.errors import SyrvisError
@@ -35,6 +39,11 @@ class SyrvisHomeError(SyrvisError):
 # Must match syrviscore_manager.manifest.MANIFEST_SCHEMA_VERSION
 MANIFEST_SCHEMA_VERSION = 3
 
+# Version directory names are dotted integers (e.g. "0.3.1"). Anything else
+# sorts as (0, 0, 0) — oldest — rather than failing the listing.
+_VERSION_NAME_RE = re.compile(r"^\d+(?:\.\d+)*$")
+_VERSION_PART_RE = re.compile(r"\d+")
+
 
 # =============================================================================
 # Simulation Mode Support
@@ -103,13 +112,11 @@ def _is_install_root(candidate: Path) -> bool:
     installs) as long as it parses and looks like an install manifest, never a
     bare marker. Any read/parse failure → not an install root (fail closed).
     """
+    # Just try the read: a missing candidate or manifest fails the open, so a
+    # miss (the common case while probing volumes) costs one syscall.
     manifest = candidate / ".syrviscore-manifest.json"
-    if not candidate.exists() or not manifest.exists():
-        return False
     try:
-        import json as _json
-
-        data = _json.loads(manifest.read_text())
+        data = json.loads(manifest.read_bytes())
     except Exception:
         return False
     if not isinstance(data, dict):
@@ -125,6 +132,27 @@ def _is_install_root(candidate: Path) -> bool:
     return "schema_version" in data or "versions" in data
 
 
+# Strategy 3 candidates of get_syrvis_home(): /volume2 .. /volume9.
+_SECONDARY_VOLUME_MANIFEST_GLOB = "/volume[2-9]/syrviscore/.syrviscore-manifest.json"
+
+# Auto-detected SYRVIS_HOME (strategies 2-4 below). Detection reads and parses
+# manifests on up to nine volumes, and every path helper goes through
+# get_syrvis_home(), so the result is kept and only re-checked with one stat.
+# Cleared by set_syrvis_home()/unset_syrvis_home().
+_detected_home: Optional[Path] = None
+
+# The SYRVIS_HOME value last confirmed to be a directory, and its Path. A
+# repeat call with the same value skips the isdir stat. Keyed on the raw value
+# because callers (and tests) change the variable freely; cleared with the above.
+# Tradeoff: a hit is never re-checked, so if that directory is removed or
+# unmounted later in the same process it keeps being returned (the uncached
+# lookup would fall through to auto-detection). Re-checking would cost the very
+# stat this saves; CLI processes are short-lived, and the next file access
+# under a vanished home fails loudly anyway. Long-running callers that remount
+# the home should call set_syrvis_home()/unset_syrvis_home() to clear this.
+_env_home: Optional[Tuple[str, Path]] = None
+
+
 def get_syrvis_home() -> Path:
     """
     Get the SYRVIS_HOME directory with auto-detection fallback.
@@ -141,13 +169,28 @@ def get_syrvis_home() -> Path:
     Raises:
         SyrvisHomeError: If SYRVIS_HOME cannot be determined
     """
+    global _detected_home, _env_home
+
     # Strategy 1: Environment variable
     syrvis_home = os.environ.get("SYRVIS_HOME")
     if syrvis_home:
-        syrvis_path = Path(syrvis_home)
-        if syrvis_path.exists() and syrvis_path.is_dir():
-            return syrvis_path
+        env_home = _env_home
+        if env_home is not None and env_home[0] == syrvis_home:
+            return env_home[1]
+        if os.path.isdir(syrvis_home):
+            _env_home = (syrvis_home, Path(syrvis_home))
+            return _env_home[1]
+
+    detected = _detected_home
+    if detected is not None and os.path.exists(str(detected / ".syrviscore-manifest.json")):
+        return detected
+
+    _detected_home = _detect_syrvis_home()
+    return _detected_home
 
+
+def _detect_syrvis_home() -> Path:
+    """Search the well-known locations for an installation (uncached)."""
     # Strategy 2: Default location
     default = Path("/volume1/syrviscore")
     if _is_install_root(default):
@@ -158,8 +201,11 @@ def get_syrvis_home() -> Path:
     # so a bare `.syrviscore-manifest.json` marker is no longer sufficient proof
     # of an install root — a stray/mis-scoped copy under a location root would
     # otherwise mis-root the whole CLI. Require the manifest to self-identify.
-    for vol_num in range(2, 10):
-        candidate = Path(f"/volume{vol_num}/syrviscore")
+    # One listing of / instead of probing all eight volume paths: only volumes
+    # that exist and actually carry a manifest are examined. Single-digit
+    # pattern, so lexical order is volume order (first match wins, as before).
+    for manifest_path in sorted(glob.glob(_SECONDARY_VOLUME_MANIFEST_GLOB)):
+        candidate = Path(manifest_path).parent
         if _is_install_root(candidate):
             return candidate
 
@@ -195,6 +241,24 @@ def get_current_symlink() -> Path:
     return get_syrvis_home() / "current"
 
 
+# (link path, inode, mtime_ns) -> resolved target. ``current`` is switched by
+# replacing the link (new inode), so a stale entry can never match.
+_current_resolved: Dict[tuple, Path] = {}
+
+
+def _resolve_current_symlink(current: Path, st: os.stat_result) -> Optional[Path]:
+    """Resolve the ``current`` symlink once per link; None if it dangles."""
+    key = (str(current), st.st_ino, st.st_mtime_ns)
+    resolved = _current_resolved.get(key)
+    if resolved is None:
+        resolved = Path(os.path.realpath(str(current)))
+        if not resolved.is_dir():
+            return None
+        _current_resolved.clear()
+        _current_resolved[key] = resolved
+    return resolved
+
+
 def get_active_version_dir() -> Path:
     """
     Get path to the active version directory.
@@ -203,8 +267,14 @@ def get_active_version_dir() -> Path:
     looking up the active version from manifest.
     """
     current = get_current_symlink()
-    if current.exists() and current.is_symlink():
-        return current.resolve()
+    try:
+        st = os.lstat(str(current))
+    except OSError:
+        st = None
+    if st is not None and stat.S_ISLNK(st.st_mode):
+        resolved = _resolve_current_symlink(current, st)
+        if resolved is not None:
+            return resolved
 
     # Fallback: look up from manifest
     try:
@@ -223,26 +293,28 @@ def get_version_dir(version: str) -> Path:
     return get_versions_dir() / version
 
 
+@functools.lru_cache(maxsize=256)
+def _version_key(version: str) -> tuple:
+    """Sort key for a version directory name (cached: names repeat across calls)."""
+    if not _VERSION_NAME_RE.match(version):
+        return (0, 0, 0)
+    return tuple(int(part) for part in _VERSION_PART_RE.findall(version))
+
+
 def list_installed_versions() -> List[str]:
     """List all installed versions, sorted by semantic version."""
-    versions_dir = get_versions_dir()
-    if not versions_dir.exists():
+    # scandir: is_dir() answers from the directory entry's type instead of a
+    # stat per entry, and a missing versions/ needs no separate exists() probe.
+    try:
+        with os.scandir(str(get_versions_dir())) as it:
+            versions = [
+                entry.name for entry in it if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except FileNotFoundError:
         return []
 
-    versions = []
-    for item in versions_dir.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            versions.append(item.name)
-
-    # Sort by semantic version (simple approach)
-    def version_key(v):
-        try:
-            parts = v.split(".")
-            return tuple(int(p) for p in parts)
-        except ValueError:
-            return (0, 0, 0)
-
-    return sorted(versions, key=version_key, reverse=True)
+    # key= computes each (cached) key once, not per comparison.
+    return sorted(versions, key=_version_key, reverse=True)
 
 
 def get_active_version() -> Optional[str]:
@@ -383,6 +455,13 @@ def get_manifest_path() -> Path:
     return get_syrvis_home() / ".syrviscore-manifest.json"
 
 
+# (path, mtime_ns, size, inode) -> raw manifest bytes. The bytes, not the parsed
+# dict, is cached: callers mutate what get_manifest() returns, and re-parsing
+# is cheaper than a deep copy. Writers replace the file (new inode), so a
+# rewrite by any process invalidates the entry.
+_manifest_cache: Optional[Tuple[tuple, bytes]] = None
+
+
 def get_manifest() -> Dict[str, Any]:
     """
     Read installation manifest.
@@ -395,11 +474,23 @@ def get_manifest() -> Dict[str, Any]:
         FileNotFoundError: If manifest file doesn't exist
         json.JSONDecodeError: If manifest is invalid JSON
     """
+    global _manifest_cache
+
     manifest_path = get_manifest_path()
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+    try:
+        st = os.stat(str(manifest_path))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}") from None
+
+    key = (str(manifest_path), st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _manifest_cache
+    if cached is not None and cached[0] == key:
+        return json.loads(cached[1])
 
-    return json.loads(manifest_path.read_text())
+    # Bytes straight to json.loads: no text-mode wrapper or separate decode.
+    raw = manifest_path.read_bytes()
+    _manifest_cache = (key, raw)
+    return json.loads(raw)
 
 
 def create_manifest(
@@ -477,15 +568,25 @@ def _write_manifest_atomic(manifest_path: Path, manifest: Dict[str, Any]) -> Non
     never leave a truncated manifest. 0644 keeps it world-readable so doctor
     can read it without sudo.
     """
+    global _manifest_cache
+
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    _manifest_cache = None
+    raw = json.dumps(manifest, indent=2).encode("utf-8")
     fd, tmp_name = tempfile.mkstemp(
         dir=str(manifest_path.parent), prefix=".manifest-", suffix=".tmp"
     )
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(manifest, f, indent=2)
-        os.chmod(tmp_name, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fchmod(f.fileno(), 0o644)
+            st = os.fstat(f.fileno())
         os.replace(tmp_name, str(manifest_path))
+        # The rename keeps the inode and mtime, so the next get_manifest()
+        # (set_active_version right after add_version_to_manifest, say) is
+        # served from what was just written instead of reading it back.
+        _manifest_cache = ((str(manifest_path), st.st_mtime_ns, st.st_size, st.st_ino), raw)
     except BaseException:
         try:
             os.unlink(tmp_name)
@@ -568,6 +669,19 @@ def set_active_version(version: str) -> None:
 # =============================================================================
 
 
+# Leaf directories of a fresh installation (relative to SYRVIS_HOME, and to
+# the version directory respectively).
+_SHARED_DIR_LEAVES = (
+    "versions",
+    "config/traefik",
+    "data/traefik/config",
+    "data/traefik/logs",
+    "data/portainer",
+    "data/cloudflared",
+)
+_VERSION_DIR_LEAVES = ("cli", "build")
+
+
 def ensure_directory_structure(install_path: Path, version: str) -> None:
     """
     Create the complete directory structure for a new installation.
@@ -576,27 +690,22 @@ def ensure_directory_structure(install_path: Path, version: str) -> None:
         install_path: Path to SYRVIS_HOME
         version: Version being installed
     """
-    # Root directories
-    (install_path / "versions").mkdir(parents=True, exist_ok=True)
-    (install_path / "config").mkdir(exist_ok=True)
-    (install_path / "config" / "traefik").mkdir(exist_ok=True)
-    (install_path / "data").mkdir(exist_ok=True)
-    (install_path / "data" / "traefik").mkdir(exist_ok=True)
-    (install_path / "data" / "traefik" / "config").mkdir(exist_ok=True)
-    (install_path / "data" / "traefik" / "logs").mkdir(exist_ok=True)
-    (install_path / "data" / "portainer").mkdir(exist_ok=True)
-    (install_path / "data" / "cloudflared").mkdir(exist_ok=True)
-
-    # Version-specific directories
+    # Leaves only: mkdir(parents=True) creates each intermediate directory once.
+    for rel in _SHARED_DIR_LEAVES:
+        (install_path / rel).mkdir(parents=True, exist_ok=True)
+
     version_dir = install_path / "versions" / version
-    version_dir.mkdir(exist_ok=True)
-    (version_dir / "cli").mkdir(exist_ok=True)
-    (version_dir / "build").mkdir(exist_ok=True)
+    for rel in _VERSION_DIR_LEAVES:
+        (version_dir / rel).mkdir(parents=True, exist_ok=True)
 
 
 def update_current_symlink(version: str) -> None:
     """
-    Update the 'current' symlink to point to a version.
+    Atomically update the 'current' symlink to point to a version.
+
+    The new link is created under a temporary name and renamed over
+    ``current`` (as syrviscore_manager.paths does), so a concurrent ``syrvis``
+    invocation never sees a moment with no active version.
 
     Args:
         version: Version to point to
@@ -605,12 +714,17 @@ def update_current_symlink(version: str) -> None:
     current = syrvis_home / "current"
     target = Path("versions") / version  # Relative path
 
-    # Remove existing symlink if present
-    if current.exists() or current.is_symlink():
-        current.unlink()
-
-    # Create new symlink
-    current.symlink_to(target)
+    tmp = syrvis_home / f".current.{os.getpid()}.tmp"
+    try:
+        tmp.unlink()  # leftover from a crashed switch
+    except FileNotFoundError:
+        pass
+    tmp.symlink_to(target)
+    try:
+        os.replace(str(tmp), str(current))
+    except BaseException:
+        tmp.unlink()
+        raise
 
 
 # =============================================================================
@@ -647,12 +761,18 @@ def set_syrvis_home(path: str) -> None:
     Args:
         path: Path to set as SYRVIS_HOME
     """
+    global _detected_home, _env_home
     os.environ["SYRVIS_HOME"] = path
+    _detected_home = None
+    _env_home = None
 
 
 def unset_syrvis_home() -> None:
     """
     Unset SYRVIS_HOME environment variable (for testing).
     """
+    global _detected_home, _env_home
     if "SYRVIS_HOME" in os.environ:
         del os.environ["SYRVIS_HOME"]
+    _detected_home = None
+    _env_home = None
@@ -5,14 +5,20 @@ Uses a provider pattern to abstract system operations, allowing different
 implementations for real DSM environments vs simulation/testing.
 """
 
+import fcntl
+import functools
 import os
+import shutil
+import socket
+import stat
+import struct
 import subprocess
 import tempfile
 import grp
 import pwd
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from syrviscore.errors import SyrvisError
 
@@ -128,6 +134,47 @@ class SystemOperations(ABC):
         """
         pass
 
+    def _ensure_symlink_at(self, symlink_path: Path, install_dir: Path) -> Tuple[bool, str]:
+        """Point ``symlink_path`` at the install's ``bin/syrvis`` (shared by providers)."""
+        raw_target = str(install_dir / "bin" / "syrvis")
+
+        # bin/syrvis is the wrapper syrvisctl writes as a regular file. lstat it
+        # unresolved: a symlink planted there would otherwise be followed and
+        # the root-owned global command pointed wherever it leads.
+        try:
+            target_st = os.lstat(raw_target)
+        except FileNotFoundError:
+            return False, f"Target script not found: {raw_target}"
+        if not stat.S_ISREG(target_st.st_mode):
+            return False, f"Target script is not a regular file (refusing): {raw_target}"
+
+        # One lstat covers "absent", "symlink (possibly broken)" and "other file"
+        try:
+            st = os.lstat(str(symlink_path))
+        except FileNotFoundError:
+            st = None
+        current = None
+        if st is not None:
+            if not stat.S_ISLNK(st.st_mode):
+                return False, f"File exists but is not a symlink: {symlink_path}"
+            current = os.readlink(str(symlink_path))
+            # Canonical install paths match verbatim, without a realpath walk
+            if os.path.isabs(raw_target) and current == raw_target:
+                return True, f"Global symlink already correct: {symlink_path} -> {raw_target}"
+
+        target = os.path.realpath(raw_target)
+        if current is not None:
+            if current == target:
+                return True, f"Global symlink already correct: {symlink_path} -> {target}"
+            symlink_path.unlink()
+
+        try:
+            symlink_path.parent.mkdir(parents=True, exist_ok=True)
+            symlink_path.symlink_to(target)
+            return True, f"Global symlink created: {symlink_path} -> {target}"
+        except (OSError, PermissionError) as e:
+            return False, f"Failed to create symlink: {e}"
+
 
 # =============================================================================
 # Boot-hook rendering (single source of truth)
@@ -318,27 +365,39 @@ def _write_script_if_changed(
     freshly-rendered ``content``. Rewrites ONLY on a mismatch (or when absent) —
     the missing-only installers never noticed content drift, which is how a stale
     boot hook rotted on the NAS. Writes atomically (temp file + rename) so a crash
-    mid-write can't leave a truncated boot script.
+    mid-write can't leave a truncated boot script; the temp file is fsynced
+    before the rename. That path only runs on drift, so idle re-runs never pay
+    for the fsync.
 
     Returns ``(changed, state)`` where ``state`` is one of ``"created"``,
     ``"updated"`` (content drift), or ``"unchanged"``.
     """
-    existed = path.exists()
-    if existed:
-        try:
-            if path.read_text() == content:
-                # Already current; still (re)assert the mode cheaply, then no-op.
+    existed = True
+    try:
+        with open(str(path)) as f:
+            current = f.read()
+            current_mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+        if current == content:
+            # Already current; (re)assert the mode only if it drifted, so an
+            # idle re-run writes nothing at all to the flash-backed root.
+            if current_mode != mode:
                 path.chmod(mode)
-                return False, "unchanged"
-        except OSError:
-            # Unreadable → fall through and rewrite from the rendered content.
-            pass
+            return False, "unchanged"
+    except FileNotFoundError:
+        existed = False
+    except (OSError, UnicodeDecodeError):
+        # Unreadable → fall through and rewrite from the rendered content.
+        pass
 
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix="." + path.name + "-", suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as f:
             f.write(content)
+            f.flush()
+            # Durable before the rename, so a power cut right after an upgrade
+            # can't leave a boot hook that exists but is empty.
+            os.fsync(f.fileno())
         os.chmod(tmp_name, mode)
         os.replace(tmp_name, str(path))
     except BaseException:
@@ -351,6 +410,63 @@ def _write_script_if_changed(
     return True, ("updated" if existed else "created")
 
 
+@functools.lru_cache(maxsize=None)
+def _tool(name: str) -> str:
+    """Absolute path of a system tool, looked up on PATH once per process.
+
+    Saves execvp's per-spawn PATH walk; falls back to the bare name (so the
+    spawn behaves exactly as before) when the tool isn't on PATH.
+    """
+    return shutil.which(name) or name
+
+
+_PROC_NET_ROUTE = "/proc/net/route"
+_SIOCGIFADDR = 0x8915
+_SIOCGIFNETMASK = 0x891B
+
+
+def _iface_exists(name: str) -> bool:
+    """Whether network interface ``name`` exists (a single if_nametoindex call)."""
+    try:
+        socket.if_nametoindex(name)
+    except OSError:
+        return False
+    return True
+
+
+def _iface_ipv4(name: str) -> Optional[str]:
+    """The interface's IPv4 address as ``addr/prefix``, or None if it has none.
+
+    Reads the primary address and netmask with two ioctls rather than
+    spawning ``ip addr show``.
+    """
+    ifreq = struct.pack("256s", name.encode()[:15])
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            addr = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, ifreq)[20:24]
+            mask = fcntl.ioctl(sock.fileno(), _SIOCGIFNETMASK, ifreq)[20:24]
+    except OSError:
+        return None
+    prefix = bin(int.from_bytes(mask, "big")).count("1")
+    return f"{socket.inet_ntoa(addr)}/{prefix}"
+
+
+def _host_route_dev(ip: str) -> Optional[str]:
+    """Device carrying the main-table ``ip/32`` route, per /proc/net/route."""
+    # Destination and Mask are the raw in-memory (network order) u32s, in hex.
+    dest = "{:08X}".format(struct.unpack("=I", socket.inet_aton(ip))[0])
+    try:
+        with open(_PROC_NET_ROUTE) as f:
+            next(f, None)  # header
+            for line in f:
+                fields = line.split()
+                if len(fields) > 7 and fields[1] == dest and fields[7] == "FFFFFFFF":
+                    return fields[0]
+    except OSError:
+        pass
+    return None
+
+
 # =============================================================================
 # DSM Operations (Production)
 # =============================================================================
@@ -363,6 +479,11 @@ class DsmOperations(SystemOperations):
     Uses synopkg, synogroup, and other Synology-specific commands.
     """
 
+    def __init__(self) -> None:
+        # Positive `synopkg status` result; a failure is re-probed so a
+        # re-check after starting Docker sees the new state.
+        self._docker_running: Optional[Tuple[bool, str]] = None
+
     @property
     def mode_name(self) -> str:
         return "DSM"
@@ -388,12 +509,15 @@ class DsmOperations(SystemOperations):
 
     def verify_docker_installed(self) -> Tuple[bool, str]:
         """Check if Docker package is installed on Synology."""
+        if self._docker_running is not None:
+            return self._docker_running
         try:
             result = subprocess.run(
-                ["synopkg", "status", "Docker"], capture_output=True, text=True, timeout=5
+                [_tool("synopkg"), "status", "Docker"], capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0 and "running" in result.stdout.lower():
-                return True, "Docker is installed and running"
+                self._docker_running = (True, "Docker is installed and running")
+                return self._docker_running
             elif result.returncode == 0:
                 return False, "Docker is installed but not running"
             else:
@@ -410,11 +534,7 @@ class DsmOperations(SystemOperations):
 
     def _get_docker_group_info(self) -> Tuple[bool, Optional[int]]:
         """Check if docker group exists and return its GID."""
-        try:
-            docker_group = grp.getgrnam("docker")
-            return True, docker_group.gr_gid
-        except KeyError:
-            return False, None
+        return get_docker_group_info()
 
     def ensure_docker_group(self) -> Tuple[bool, str]:
         """Create docker group if it doesn't exist."""
@@ -424,7 +544,11 @@ class DsmOperations(SystemOperations):
 
         try:
             result = subprocess.run(
-                ["synogroup", "--add", "docker"], capture_output=True, text=True, timeout=10
+                [_tool("synogroup"), "--add", "docker"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=10,
             )
             if result.returncode == 0:
                 exists, gid = self._get_docker_group_info()
@@ -436,14 +560,7 @@ class DsmOperations(SystemOperations):
 
     def _is_user_in_group(self, username: str, groupname: str) -> bool:
         """Check if user is in specified group."""
-        try:
-            user_info = pwd.getpwnam(username)
-            user_groups = [g.gr_name for g in grp.getgrall() if username in g.gr_mem]
-            primary_group = grp.getgrgid(user_info.pw_gid).gr_name
-            user_groups.append(primary_group)
-            return groupname in user_groups
-        except KeyError:
-            return False
+        return is_user_in_group(username, groupname)
 
     def ensure_user_in_docker_group(self, username: str) -> Tuple[bool, str]:
         """Add user to docker group."""
@@ -452,8 +569,9 @@ class DsmOperations(SystemOperations):
 
         try:
             result = subprocess.run(
-                ["synogroup", "--member", "docker", username],
-                capture_output=True,
+                [_tool("synogroup"), "--member", "docker", username],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10,
             )
@@ -466,66 +584,45 @@ class DsmOperations(SystemOperations):
 
     def _get_docker_socket_permissions(self) -> Tuple[str, str, str]:
         """Get Docker socket owner, group, and permissions."""
-        socket_path = Path("/var/run/docker.sock")
-        if not socket_path.exists():
+        socket_stat = _get_docker_socket_stat()
+        if socket_stat is None:
             return "missing", "missing", "000"
 
-        stat_info = socket_path.stat()
-        owner = pwd.getpwuid(stat_info.st_uid).pw_name
-        group = grp.getgrgid(stat_info.st_gid).gr_name
-        perms = oct(stat_info.st_mode)[-3:]
-        return owner, group, perms
+        uid, gid, mode = socket_stat
+        owner, group = _format_socket_owners(uid, gid)
+        return owner, group, oct(mode)[-3:]
 
     def ensure_docker_socket_permissions(self) -> Tuple[bool, str]:
         """Set Docker socket to root:docker 660."""
-        socket_path = Path("/var/run/docker.sock")
-        if not socket_path.exists():
+        socket_stat = _get_docker_socket_stat()
+        if socket_stat is None:
             return False, "Docker socket not found"
 
-        owner, group, perms = self._get_docker_socket_permissions()
-
-        if group == "docker" and perms == "660":
-            return True, f"Docker socket permissions already correct ({owner}:{group} {perms})"
+        # Compare ids and mode numerically; names are only resolved for the
+        # "updated" message, never on the already-correct path.
+        uid, sock_gid, mode = socket_stat
+        _, gid = self._get_docker_group_info()
+        if gid is not None and sock_gid == gid and stat.S_IMODE(mode) == 0o660:
+            return True, "Docker socket permissions already correct (group docker, 660)"
 
         try:
-            _, gid = self._get_docker_group_info()
             if gid is None:
                 return False, "Docker group not found"
 
-            os.chown(str(socket_path), -1, gid)
-            os.chmod(str(socket_path), 0o660)
+            # Touch only what drifted; the result is known, so no re-stat.
+            if sock_gid != gid:
+                os.chown(_DOCKER_SOCKET, -1, gid)
+            if stat.S_IMODE(mode) != 0o660:
+                os.chmod(_DOCKER_SOCKET, 0o660)
 
-            owner, group, perms = self._get_docker_socket_permissions()
-            return True, f"Docker socket permissions updated ({owner}:{group} {perms})"
+            owner, group = _format_socket_owners(uid, gid)
+            return True, f"Docker socket permissions updated ({owner}:{group} 660)"
         except (OSError, PermissionError) as e:
             return False, f"Failed to set socket permissions: {e}"
 
     def ensure_global_symlink(self, install_dir: Path) -> Tuple[bool, str]:
         """Create /usr/local/bin/syrvis symlink."""
-        symlink_path = Path("/usr/local/bin/syrvis")
-        target = (install_dir / "bin" / "syrvis").resolve()
-
-        if not target.exists():
-            return False, f"Target script not found: {target}"
-
-        # Check if symlink exists (including broken symlinks)
-        # exists() returns False for broken symlinks, but is_symlink() returns True
-        if symlink_path.exists() or symlink_path.is_symlink():
-            if symlink_path.is_symlink():
-                current_target = os.readlink(str(symlink_path))
-                if str(current_target) == str(target):
-                    return True, f"Global symlink already correct: {symlink_path} -> {target}"
-                else:
-                    symlink_path.unlink()
-            else:
-                return False, f"File exists but is not a symlink: {symlink_path}"
-
-        try:
-            symlink_path.parent.mkdir(parents=True, exist_ok=True)
-            symlink_path.symlink_to(target)
-            return True, f"Global symlink created: {symlink_path} -> {target}"
-        except (OSError, PermissionError) as e:
-            return False, f"Failed to create symlink: {e}"
+        return self._ensure_symlink_at(Path("/usr/local/bin/syrvis"), install_dir)
 
     def ensure_startup_script(self, install_dir: Path, username: str) -> Tuple[bool, str]:
         """Create/update the startup script, rewriting on content drift."""
@@ -571,26 +668,16 @@ class DsmOperations(SystemOperations):
 
     def verify_docker_accessible(self, username: Optional[str] = None) -> Tuple[bool, str]:
         """Test if Docker daemon is accessible."""
-        try:
-            result = subprocess.run(["docker", "info"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                return True, "Docker daemon accessible"
+        if _docker_ping():
+            return True, "Docker daemon accessible"
 
-            if username:
-                result = subprocess.run(
-                    ["su", "-", username, "-c", "docker info"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    return True, f"Docker daemon accessible for user '{username}'"
-                else:
-                    return False, f"Docker not accessible for user '{username}' (may need logout)"
+        # Callers pass ``username`` only when not root, i.e. when this process
+        # already is that user: the ping above answered for them, and a fresh
+        # docker group membership only takes effect after a new login.
+        if username:
+            return False, f"Docker not accessible for user '{username}' (may need logout)"
 
-            return False, "Docker daemon not accessible"
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            return False, f"Cannot test Docker access: {e}"
+        return False, "Docker daemon not accessible"
 
     def ensure_macvlan_shim(
         self, interface: str, traefik_ip: str, shim_ip: str
@@ -604,33 +691,17 @@ class DsmOperations(SystemOperations):
         shim_name = "syrvis-shim"
 
         try:
-            # Check if shim interface already exists
-            result = subprocess.run(
-                ["ip", "link", "show", shim_name], capture_output=True, text=True, timeout=5
-            )
-
-            if result.returncode == 0:
+            # The steady state (shim present and correct) is checked with
+            # syscalls and a /proc read: no `ip` process unless something drifted.
+            if _iface_exists(shim_name):
                 # Interface exists. Reconcile its assigned address and host route
                 # against the desired values. If TRAEFIK_IP (and thus SHIM_IP)
                 # changed since the shim was created, the stale address/route would
                 # linger and break host->Traefik reachability until reboot, so
                 # tear the shim down and rebuild it cleanly. When the current state
                 # already matches, do nothing extra (stay idempotent).
-                addr_result = subprocess.run(
-                    ["ip", "addr", "show", shim_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                addr_matches = f"inet {shim_ip}/32" in addr_result.stdout
-
-                route_result = subprocess.run(
-                    ["ip", "route", "show", f"{traefik_ip}/32"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                route_matches = f"dev {shim_name}" in route_result.stdout
+                addr_matches = _iface_ipv4(shim_name) == f"{shim_ip}/32"
+                route_matches = _host_route_dev(traefik_ip) == shim_name
 
                 if addr_matches and route_matches:
                     return True, f"Macvlan shim already configured ({shim_name})"
@@ -639,76 +710,52 @@ class DsmOperations(SystemOperations):
                     # The shim's IP drifted (TRAEFIK_IP/SHIM_IP changed). Tear it
                     # down so it can be recreated with the correct address; the
                     # stale /32 route it carried disappears with the interface.
-                    subprocess.run(["ip", "link", "del", shim_name], capture_output=True, timeout=5)
-                    # Fall through to the create path below to rebuild cleanly.
-                else:
-                    # Address is correct but the route to Traefik is missing or on
-                    # the wrong device. Reconcile the route in place.
                     subprocess.run(
-                        ["ip", "route", "del", f"{traefik_ip}/32"],
-                        capture_output=True,
+                        [_tool("ip"), "link", "del", shim_name],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         timeout=5,
                     )
+                    # Fall through to the create path below to rebuild cleanly.
+                else:
+                    # Address is correct but the route to Traefik is missing or on
+                    # the wrong device. `route replace` moves or adds it in place.
                     subprocess.run(
-                        ["ip", "route", "add", f"{traefik_ip}/32", "dev", shim_name],
-                        capture_output=True,
+                        [_tool("ip"), "route", "replace", f"{traefik_ip}/32", "dev", shim_name],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         timeout=5,
                     )
                     return True, f"Macvlan shim route reconciled for {traefik_ip}"
 
-            # Create the shim interface
-            # Step 1: Create macvlan interface
+            # Create the shim in one `ip -batch` run: a single process and netlink
+            # socket instead of four fork+exec round trips. The batch stops at the
+            # first failing line; `route replace` keeps an already-present route
+            # from counting as a failure.
+            batch = (
+                f"link add {shim_name} link {interface} type macvlan mode bridge\n"
+                f"addr add {shim_ip}/32 dev {shim_name}\n"
+                f"link set {shim_name} up\n"
+                f"route replace {traefik_ip}/32 dev {shim_name}\n"
+            )
             result = subprocess.run(
-                [
-                    "ip",
-                    "link",
-                    "add",
-                    shim_name,
-                    "link",
-                    interface,
-                    "type",
-                    "macvlan",
-                    "mode",
-                    "bridge",
-                ],
-                capture_output=True,
+                [_tool("ip"), "-batch", "-"],
+                input=batch,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10,
             )
             if result.returncode != 0:
+                # Roll back a half-built shim
+                subprocess.run(
+                    [_tool("ip"), "link", "del", shim_name],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                )
                 return False, f"Failed to create shim interface: {result.stderr}"
 
-            # Step 2: Assign IP address to shim
-            result = subprocess.run(
-                ["ip", "addr", "add", f"{shim_ip}/32", "dev", shim_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                # Cleanup on failure
-                subprocess.run(["ip", "link", "del", shim_name], capture_output=True, timeout=5)
-                return False, f"Failed to assign IP to shim: {result.stderr}"
-
-            # Step 3: Bring interface up
-            result = subprocess.run(
-                ["ip", "link", "set", shim_name, "up"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode != 0:
-                subprocess.run(["ip", "link", "del", shim_name], capture_output=True, timeout=5)
-                return False, f"Failed to bring up shim interface: {result.stderr}"
-
-            # Step 4: Add route to Traefik IP
-            result = subprocess.run(
-                ["ip", "route", "add", f"{traefik_ip}/32", "dev", shim_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                # Route might already exist, not a fatal error
-                pass
-
             return True, f"Macvlan shim created: {shim_name} ({shim_ip}) -> {traefik_ip}"
 
         except subprocess.TimeoutExpired:
@@ -756,7 +803,10 @@ class SimulationOperations(SystemOperations):
         """Check if Docker is available on host."""
         try:
             result = subprocess.run(
-                ["docker", "--version"], capture_output=True, text=True, timeout=5
+                ["docker", "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
             if result.returncode == 0:
                 return True, "Docker available (host)"
@@ -772,11 +822,10 @@ class SimulationOperations(SystemOperations):
 
     def ensure_docker_group(self) -> Tuple[bool, str]:
         """Skip docker group creation in simulation."""
-        try:
-            docker_group = grp.getgrnam("docker")
-            return True, f"Docker group exists (GID: {docker_group.gr_gid})"
-        except KeyError:
-            return True, "Docker group check skipped"
+        exists, gid = get_docker_group_info()
+        if exists:
+            return True, f"Docker group exists (GID: {gid})"
+        return True, "Docker group check skipped"
 
     def ensure_user_in_docker_group(self, username: str) -> Tuple[bool, str]:
         """Skip group membership in simulation."""
@@ -789,28 +838,7 @@ class SimulationOperations(SystemOperations):
     def ensure_global_symlink(self, install_dir: Path) -> Tuple[bool, str]:
         """Create symlink in simulation root."""
         symlink_path = self._sim_root / "usr" / "local" / "bin" / "syrvis"
-        target = (install_dir / "bin" / "syrvis").resolve()
-
-        if not target.exists():
-            return False, f"Target script not found: {target}"
-
-        # Check if symlink exists (including broken symlinks)
-        if symlink_path.exists() or symlink_path.is_symlink():
-            if symlink_path.is_symlink():
-                current_target = os.readlink(str(symlink_path))
-                if str(current_target) == str(target):
-                    return True, f"Global symlink already correct: {symlink_path} -> {target}"
-                else:
-                    symlink_path.unlink()
-            else:
-                return False, f"File exists but is not a symlink: {symlink_path}"
-
-        try:
-            symlink_path.parent.mkdir(parents=True, exist_ok=True)
-            symlink_path.symlink_to(target)
-            return True, f"Global symlink created: {symlink_path} -> {target}"
-        except (OSError, PermissionError) as e:
-            return False, f"Failed to create symlink: {e}"
+        return self._ensure_symlink_at(symlink_path, install_dir)
 
     def ensure_startup_script(self, install_dir: Path, username: str) -> Tuple[bool, str]:
         """Create startup script (same as DSM, just for testing)."""
@@ -830,12 +858,12 @@ exit 0
 """
 
         try:
-            startup_script_path.parent.mkdir(parents=True, exist_ok=True)
-            startup_script_path.write_text(script_content)
-            startup_script_path.chmod(0o755)
-            return True, f"Startup script created: {startup_script_path}"
+            changed, _ = _write_script_if_changed(startup_script_path, script_content, 0o755)
         except (OSError, PermissionError) as e:
             return False, f"Failed to create startup script: {e}"
+        if changed:
+            return True, f"Startup script created: {startup_script_path}"
+        return True, f"Startup script already current: {startup_script_path}"
 
     def ensure_boot_script(self, install_dir: Path) -> Tuple[bool, str]:
         """Create boot script in simulation rc.d directory."""
@@ -859,17 +887,19 @@ exit 0
 """
 
         try:
-            rc_d_path.mkdir(parents=True, exist_ok=True)
-            boot_script_path.write_text(script_content)
-            boot_script_path.chmod(0o755)
-            return True, f"Boot script created (sim): {boot_script_path}"
+            changed, _ = _write_script_if_changed(boot_script_path, script_content, 0o755)
         except (OSError, PermissionError) as e:
             return False, f"Failed to create boot script: {e}"
+        if changed:
+            return True, f"Boot script created (sim): {boot_script_path}"
+        return True, f"Boot script already current (sim): {boot_script_path}"
 
     def verify_docker_accessible(self, username: Optional[str] = None) -> Tuple[bool, str]:
         """Check Docker on host."""
         try:
-            result = subprocess.run(["docker", "info"], capture_output=True, text=True, timeout=5)
+            result = subprocess.run(
+                ["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+            )
             if result.returncode == 0:
                 return True, "Docker daemon accessible (host)"
             return True, "Docker access check skipped"
@@ -916,9 +946,10 @@ def get_system_operations() -> SystemOperations:
 
 
 def reset_operations_instance() -> None:
-    """Reset the cached operations instance (for testing)."""
+    """Reset the cached operations instance and probe caches (for testing)."""
     global _operations_instance
     _operations_instance = None
+    clear_probe_caches()
 
 
 # =============================================================================
@@ -1109,6 +1140,71 @@ def ensure_schedule_block(install_dir: Optional[Path] = None) -> Tuple[bool, str
 # Read-only diagnostic functions (don't need SystemOperations)
 # =============================================================================
 
+_DOCKER_SOCKET = "/var/run/docker.sock"
+
+# GID of the docker group once seen; a missing group is re-checked every call
+# so ensure_docker_group's post-create lookup sees the new group.
+_docker_group_gid: Optional[int] = None
+
+# (uid, gid) -> (owner, group) names of the socket's owners
+_socket_owner_cache: Dict[Tuple[int, int], Tuple[str, str]] = {}
+
+
+def clear_probe_caches() -> None:
+    """Forget cached docker group / socket lookups (for testing)."""
+    global _docker_group_gid
+    _docker_group_gid = None
+    _socket_owner_cache.clear()
+
+
+def _get_docker_socket_stat() -> Optional[Tuple[int, int, int]]:
+    """Return the Docker socket's ``(uid, gid, st_mode)``, or None if it is missing."""
+    try:
+        st = os.stat(_DOCKER_SOCKET)
+    except FileNotFoundError:
+        return None
+    return st.st_uid, st.st_gid, st.st_mode
+
+
+def _format_socket_owners(uid: int, gid: int) -> Tuple[str, str]:
+    """Resolve owner and group names for display, falling back to the ids.
+
+    These are NSS lookups (slow on LDAP-joined boxes), so callers that only
+    need to compare ids should use :func:`_get_docker_socket_stat` alone.
+    """
+    key = (uid, gid)
+    names = _socket_owner_cache.get(key)
+    if names is None:
+        try:
+            owner = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            owner = str(uid)
+        try:
+            group = grp.getgrgid(gid).gr_name
+        except KeyError:
+            group = str(gid)
+        names = (owner, group)
+        _socket_owner_cache.clear()
+        _socket_owner_cache[key] = names
+    return names
+
+
+def _docker_ping(timeout: float = 2.0) -> bool:
+    """Send ``GET /_ping`` over the Docker socket; True if the daemon answers 200.
+
+    Answers "can this process reach dockerd" without launching the docker CLI
+    (which negotiates versions and loads plugins on every ``docker info``).
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(_DOCKER_SOCKET)
+            sock.sendall(b"GET /_ping HTTP/1.0\r\nHost: docker\r\n\r\n")
+            status_line = sock.recv(64).split(b"\r\n", 1)[0]
+    except OSError:
+        return False
+    return status_line.startswith(b"HTTP/") and status_line.split(b" ")[1:2] == [b"200"]
+
 
 def get_docker_group_info() -> Tuple[bool, Optional[int]]:
     """Check if docker group exists and get its GID.
@@ -1116,11 +1212,13 @@ def get_docker_group_info() -> Tuple[bool, Optional[int]]:
     Returns:
         Tuple of (exists, gid) - gid is None if group doesn't exist
     """
-    import grp
+    global _docker_group_gid
 
+    if _docker_group_gid is not None:
+        return True, _docker_group_gid
     try:
-        group_info = grp.getgrnam("docker")
-        return True, group_info.gr_gid
+        _docker_group_gid = grp.getgrnam("docker").gr_gid
+        return True, _docker_group_gid
     except KeyError:
         return False, None
 
@@ -1135,24 +1233,22 @@ def is_user_in_group(username: str, group: str) -> bool:
     Returns:
         True if user is in the group, False otherwise
     """
-    import grp
-    import pwd
-
     try:
         group_info = grp.getgrnam(group)
-        # Check if user is in the group's member list
-        if username in group_info.gr_mem:
-            return True
-        # Also check if this is the user's primary group
-        try:
-            user_info = pwd.getpwnam(username)
-            if user_info.pw_gid == group_info.gr_gid:
-                return True
-        except KeyError:
-            pass
-        return False
     except KeyError:
         return False
+    try:
+        user_info = pwd.getpwnam(username)
+    except KeyError:
+        # Unknown user: only an explicit member-list entry can match
+        return username in group_info.gr_mem
+    # getgrouplist() takes the NSS initgroups fast path instead of walking
+    # every group (thousands on LDAP-joined DSM boxes); it includes the
+    # primary group.
+    try:
+        return group_info.gr_gid in os.getgrouplist(username, user_info.pw_gid)
+    except OSError:
+        return username in group_info.gr_mem or user_info.pw_gid == group_info.gr_gid
 
 
 def get_docker_socket_permissions() -> Tuple[str, str, str]:
@@ -1162,33 +1258,17 @@ def get_docker_socket_permissions() -> Tuple[str, str, str]:
         Tuple of (owner, group, permissions) as strings
         e.g., ("root", "docker", "660")
     """
-    import os
-    import stat
-    import pwd
-    import grp
-
-    socket_path = "/var/run/docker.sock"
-
     try:
-        st = os.stat(socket_path)
-
-        # Get owner name
-        try:
-            owner = pwd.getpwuid(st.st_uid).pw_name
-        except KeyError:
-            owner = str(st.st_uid)
-
-        # Get group name
-        try:
-            group = grp.getgrgid(st.st_gid).gr_name
-        except KeyError:
-            group = str(st.st_gid)
+        socket_stat = _get_docker_socket_stat()
+        if socket_stat is None:
+            return "unknown", "unknown", "000"
+        uid, gid, mode = socket_stat
+        owner, group = _format_socket_owners(uid, gid)
 
         # Get permissions as octal string (e.g., "660")
-        perms = oct(stat.S_IMODE(st.st_mode))[2:]
+        perms = oct(stat.S_IMODE(mode))[2:]
 
         return owner, group, perms
-    except FileNotFoundError:
-        return "unknown", "unknown", "000"
-    except Exception:
+    except OSError:
+        # e.g. PermissionError stat-ing the socket as an unprivileged user
         return "unknown", "unknown", "000"
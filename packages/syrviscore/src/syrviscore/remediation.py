@@ -13,10 +13,12 @@ hooks, symlinks) and therefore require root — callers must elevate first.
 """
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 from . import paths, privileged_ops
 
+Fixer = Callable[[str, Optional[Path]], Tuple[bool, str]]
+
 
 def resolve_install_dir() -> Optional[Path]:
     """Best-effort resolution of SYRVIS_HOME for fixers that need it."""
@@ -26,49 +28,59 @@ def resolve_install_dir() -> Optional[Path]:
         return None
 
 
+def _needs_install_dir(name: str, fix: Callable[..., Tuple[bool, str]]) -> Fixer:
+    """Wrap a fixer that cannot run without the install directory."""
+
+    def fixer(arg: str, install_dir: Optional[Path]) -> Tuple[bool, str]:
+        if not install_dir:
+            return False, "{} fix needs the install directory".format(name)
+        return fix(arg, install_dir)
+
+    return fixer
+
+
+# fix_action -> fixer(arg, install_dir). Parameterised actions ("user_group:<user>",
+# "startup:<user>") are keyed by their prefix including the colon; ``arg`` is the
+# text after it ("" for plain actions). Fixers look privileged_ops up at call
+# time so it can be swapped out (tests fake it).
+_FIXERS: Dict[str, Fixer] = {
+    "docker_group": lambda arg, install_dir: privileged_ops.ensure_docker_group(),
+    "user_group:": lambda arg, install_dir: privileged_ops.ensure_user_in_docker_group(arg),
+    "socket_perms": lambda arg, install_dir: privileged_ops.ensure_docker_socket_permissions(),
+    "symlink": _needs_install_dir(
+        "symlink", lambda arg, install_dir: privileged_ops.ensure_global_symlink(install_dir)
+    ),
+    "startup:": _needs_install_dir(
+        "startup",
+        lambda arg, install_dir: privileged_ops.ensure_startup_script(install_dir, arg),
+    ),
+    "boot_script": _needs_install_dir(
+        "boot_script", lambda arg, install_dir: privileged_ops.ensure_boot_script(install_dir)
+    ),
+    "manifest_perms": lambda arg, install_dir: privileged_ops.ensure_manifest_permissions(
+        install_dir
+    ),
+    "config_tree_perms": lambda arg, install_dir: privileged_ops.ensure_config_tree_readable(
+        install_dir
+    ),
+    # Re-apply SyrvisCore's managed /etc/crontab block from config/jobs.d
+    # (DSM can drop it on a UI task edit). No-op with an empty jobs.d.
+    "schedule_block": lambda arg, install_dir: privileged_ops.ensure_schedule_block(install_dir),
+}
+
+
 def apply_fix(fix_action: Optional[str], install_dir: Optional[Path]) -> Tuple[bool, str]:
     """Apply the privileged remediation for a single validator ``fix_action``.
 
     Returns (ok, message). Unknown or un-actionable actions return
     ``(False, ...)`` explicitly rather than being silently skipped.
     """
-    action = fix_action
-
-    if action == "docker_group":
-        return privileged_ops.ensure_docker_group()
-
-    if action and action.startswith("user_group:"):
-        user = action.split(":", 1)[1]
-        return privileged_ops.ensure_user_in_docker_group(user)
-
-    if action == "socket_perms":
-        return privileged_ops.ensure_docker_socket_permissions()
-
-    if action == "symlink":
-        if not install_dir:
-            return False, "symlink fix needs the install directory"
-        return privileged_ops.ensure_global_symlink(install_dir)
-
-    if action and action.startswith("startup:"):
-        if not install_dir:
-            return False, "startup fix needs the install directory"
-        user = action.split(":", 1)[1]
-        return privileged_ops.ensure_startup_script(install_dir, user)
-
-    if action == "boot_script":
-        if not install_dir:
-            return False, "boot_script fix needs the install directory"
-        return privileged_ops.ensure_boot_script(install_dir)
-
-    if action == "manifest_perms":
-        return privileged_ops.ensure_manifest_permissions(install_dir)
-
-    if action == "config_tree_perms":
-        return privileged_ops.ensure_config_tree_readable(install_dir)
-
-    if action == "schedule_block":
-        # Re-apply SyrvisCore's managed /etc/crontab block from config/jobs.d
-        # (DSM can drop it on a UI task edit). No-op with an empty jobs.d.
-        return privileged_ops.ensure_schedule_block(install_dir)
-
-    return False, "No automatic fix wired up for '{}'".format(action)
+    action = fix_action or ""
+    fixer = _FIXERS.get(action)
+    arg = ""
+    if fixer is None and ":" in action:
+        prefix, arg = action.split(":", 1)
+        fixer = _FIXERS.get(prefix + ":")
+    if fixer is None:
+        return False, "No automatic fix wired up for '{}'".format(fix_action)
+    return fixer(arg, install_dir)
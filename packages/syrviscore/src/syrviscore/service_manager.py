@@ -14,6 +14,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 if TYPE_CHECKING:
     from .bundle import DeployBundle
 
@@ -56,6 +61,9 @@ def _image_tag(image: str) -> str:
 # NEVER escalate itself to the infra tier. This tuple is the whole authorship gate.
 OPERATOR_AUTHORED_PREFIXES = ("services.d:", "deploy:")
 
+# The only transports `syrvis service add` will clone from (see _is_git_url).
+_GIT_URL_PREFIXES = ("https://", "git@", "ssh://")
+
 # design/26: refusal message for a location change on an installed service that
 # still has data — a naive replace would materialize an EMPTY home at the new
 # location (Postgres would happily initdb: presents as data loss). The
@@ -91,6 +99,8 @@ class ServiceManager:
         self.traefik_config = ServiceTraefikConfig(
             config_dir=self.syrvis_home / "data" / "traefik" / "config" / "dynamic"
         )
+        # Container statuses captured by list() for the duration of one listing.
+        self._status_snapshot: Optional[Dict[str, str]] = None
 
     def _manifest_location(self, name: str) -> str:
         """The ``location:`` recorded in the CENTRAL materialized manifest, or "".
@@ -309,11 +319,7 @@ class ServiceManager:
         """
         if not source or source.startswith("-"):
             return False
-        return (
-            source.startswith("https://")
-            or source.startswith("git@")
-            or source.startswith("ssh://")
-        )
+        return source.startswith(_GIT_URL_PREFIXES)
 
     def _clone_service(self, git_url: str) -> Tuple[bool, str, Optional[Path]]:
         """Clone a service from git.
@@ -338,12 +344,30 @@ class ServiceManager:
         env["GIT_ALLOW_PROTOCOL"] = "https:git:ssh"
         env["GIT_TERMINAL_PROMPT"] = "0"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Stage the clone inside services/ rather than /tmp: on DSM those are
+        # usually different filesystems, and shutil.move would then copy the
+        # whole tree. Same filesystem means the install is a single rename. The
+        # dot prefix keeps the staging dir out of the installed-services scans.
+        self._ensure_directories()
+        temp_dir = tempfile.mkdtemp(prefix=".clone-", dir=str(self.services_dir))
+        try:
             temp_path = Path(temp_dir) / "repo"
 
             try:
+                # Only the HEAD of the default branch is ever used (update is a
+                # plain ff-only pull), so skip other branches and all tags.
                 result = subprocess.run(
-                    ["git", "clone", "--depth", "1", "--", git_url, str(temp_path)],
+                    [
+                        "git",
+                        "clone",
+                        "--depth",
+                        "1",
+                        "--single-branch",
+                        "--no-tags",
+                        "--",
+                        git_url,
+                        str(temp_path),
+                    ],
                     capture_output=True,
                     text=True,
                     timeout=60,
@@ -376,10 +400,11 @@ class ServiceManager:
                 return False, f"Service '{service.name}' is already installed", None
 
             # Move to services directory
-            self._ensure_directories()
-            shutil.move(str(temp_path), str(target_dir))
+            os.rename(str(temp_path), str(target_dir))
 
             return True, f"Cloned service '{service.name}'", target_dir
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     @staticmethod
     def _apply_overrides(
@@ -421,7 +446,8 @@ class ServiceManager:
         self._ensure_directories()
 
         # Clone from git
-        if self._is_git_url(source):
+        is_git = self._is_git_url(source)
+        if is_git:
             success, msg, service_path = self._clone_service(source)
             if not success:
                 return False, msg
@@ -432,7 +458,7 @@ class ServiceManager:
         # Load service definition
         try:
             service = load_service_definition(service_path)
-            service.source_url = source if self._is_git_url(source) else None
+            service.source_url = source if is_git else None
         except Exception as e:
             # Cleanup on failure
             if service_path and service_path.exists():
@@ -1145,7 +1171,7 @@ class ServiceManager:
 
         compose_path = paths_["compose"]
         with open(compose_path, "w") as f:
-            yaml.dump(compose, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(compose, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
         return compose_path
 
@@ -1408,68 +1434,81 @@ class ServiceManager:
         """
         services = []
 
-        if not self.services_dir.exists():
+        # scandir's DirEntry.is_dir() answers from the dirent type without a
+        # stat, and the manifest is simply opened: a dir without one raises
+        # FileNotFoundError instead of costing a separate exists() probe.
+        try:
+            with os.scandir(self.services_dir) as it:
+                service_dirs = [entry for entry in it if entry.is_dir()]
+        except FileNotFoundError:
             return services
 
-        for service_dir in self.services_dir.iterdir():
-            if not service_dir.is_dir():
-                continue
+        # One container listing for the whole table instead of a daemon round
+        # trip per service; _get_service_status answers from it while it is set.
+        self._status_snapshot = self._container_statuses()
+        instance_domain: Optional[str] = None
+        try:
+            for service_dir in service_dirs:
+                yaml_path = Path(service_dir.path) / "syrvis-service.yaml"
+                try:
+                    service = ServiceDefinition.from_yaml(yaml_path)
+                except FileNotFoundError:
+                    continue
+                except Exception:
+                    # Only a genuine manifest-load failure is "error".
+                    services.append(
+                        {
+                            "name": service_dir.name,
+                            "version": "unknown",
+                            "status": "error",
+                            "url": "",
+                            "description": "Failed to load service definition",
+                            "location": "",
+                        }
+                    )
+                    continue
 
-            yaml_path = service_dir / "syrvis-service.yaml"
-            if not yaml_path.exists():
-                continue
+                # Manifest loaded — status + URL are best-effort. The unprivileged
+                # operator may not reach the docker daemon or read the 0600 .env
+                # (for DOMAIN); neither should turn a loadable service into an error.
+                try:
+                    # Inspect by container_name — it defaults to the service name but
+                    # a manifest may override it, and the container is what has status.
+                    status = self._get_service_status(service.container_name or service.name)
+                except Exception:
+                    status = "unknown"
+                url = ""
+                if service.traefik.enabled and service.traefik.subdomain:
+                    # Use the per-service domain override when set; fall back to the
+                    # instance domain, looked up once per listing ("" = unavailable).
+                    if not service.traefik.domain and instance_domain is None:
+                        try:
+                            instance_domain = get_domain_from_env()
+                        except (ValueError, OSError):
+                            instance_domain = ""
+                    effective_domain = service.traefik.domain or instance_domain
+                    if effective_domain:
+                        url = f"https://{service.traefik.subdomain}.{effective_domain}"
 
-            try:
-                service = load_service_definition(yaml_path)
-            except Exception:
-                # Only a genuine manifest-load failure is "error".
                 services.append(
                     {
-                        "name": service_dir.name,
-                        "version": "unknown",
-                        "status": "error",
-                        "url": "",
-                        "description": "Failed to load service definition",
-                        "location": "",
+                        "name": service.name,
+                        "version": service.version,
+                        "status": status,
+                        "url": url,
+                        "description": service.description,
+                        "subdomain": service.traefik.subdomain if service.traefik.enabled else "",
+                        # Per-service domain override (empty string = use instance domain).
+                        # hostnames.py reads this to build the correct external hostname.
+                        "domain": service.traefik.domain if service.traefik.enabled else "",
+                        "exposure": (service.traefik.exposure if service.traefik.enabled else None),
+                        # The app's declared home volume ("" = legacy layout on
+                        # SYRVIS_HOME). Flows to the seam/dashboard rows as-is.
+                        "location": service.location or "",
                     }
                 )
-                continue
-
-            # Manifest loaded — status + URL are best-effort. The unprivileged
-            # operator may not reach the docker daemon or read the 0600 .env
-            # (for DOMAIN); neither should turn a loadable service into an error.
-            try:
-                # Inspect by container_name — it defaults to the service name but
-                # a manifest may override it, and the container is what has status.
-                status = self._get_service_status(service.container_name or service.name)
-            except Exception:
-                status = "unknown"
-            url = ""
-            if service.traefik.enabled and service.traefik.subdomain:
-                try:
-                    # Use the per-service domain override when set; fall back to the instance domain.
-                    effective_domain = service.traefik.domain or get_domain_from_env()
-                    url = f"https://{service.traefik.subdomain}.{effective_domain}"
-                except (ValueError, OSError):
-                    pass
-
-            services.append(
-                {
-                    "name": service.name,
-                    "version": service.version,
-                    "status": status,
-                    "url": url,
-                    "description": service.description,
-                    "subdomain": service.traefik.subdomain if service.traefik.enabled else "",
-                    # Per-service domain override (empty string = use instance domain).
-                    # hostnames.py reads this to build the correct external hostname.
-                    "domain": service.traefik.domain if service.traefik.enabled else "",
-                    "exposure": (service.traefik.exposure if service.traefik.enabled else None),
-                    # The app's declared home volume ("" = legacy layout on
-                    # SYRVIS_HOME). Flows to the seam/dashboard rows as-is.
-                    "location": service.location or "",
-                }
-            )
+        finally:
+            self._status_snapshot = None
 
         return services
 
@@ -1490,16 +1529,42 @@ class ServiceManager:
             "stopped" if no such container exists, or "unknown" if the Docker
             daemon can't be reached.
         """
+        if self._status_snapshot is not None:
+            return self._status_snapshot.get(name, "stopped")
         try:
             import docker
 
+            from .docker_manager import get_docker_client
+
             try:
-                return docker.from_env().containers.get(name).status
+                return get_docker_client().containers.get(name).status
             except docker.errors.NotFound:
                 return "stopped"
         except Exception:
             return "unknown"
 
+    def _container_statuses(self) -> Optional[Dict[str, str]]:
+        """Status of every container by name in one daemon call, or None.
+
+        Sparse listing: the non-sparse form inspects each container in turn,
+        which is exactly the per-service round trip this replaces. None when
+        the daemon can't be reached, so callers fall back to per-name lookups.
+        """
+        try:
+            from .docker_manager import get_docker_client
+
+            containers = get_docker_client().containers.list(all=True, sparse=True)
+        except Exception:
+            return None
+        statuses = {}
+        for container in containers:
+            state = container.attrs.get("State")
+            if not isinstance(state, str):
+                continue
+            for name in container.attrs.get("Names") or ():
+                statuses[name.lstrip("/")] = state
+        return statuses
+
     def start(
         self,
         name: str,
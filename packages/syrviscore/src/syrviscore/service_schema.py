@@ -20,6 +20,11 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from syrviscore.errors import SyrvisError
 
 from . import exposure as exposure_mod
@@ -998,11 +1003,12 @@ class ServiceDefinition:
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "ServiceDefinition":
         """Load service definition from YAML file."""
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"Service definition not found: {yaml_path}")
-
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        try:
+            f = open(yaml_path, "r")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Service definition not found: {yaml_path}") from None
+        with f:
+            data = yaml.load(f, Loader=_YamlLoader)
 
         if not data:
             raise ValueError(f"Empty service definition: {yaml_path}")
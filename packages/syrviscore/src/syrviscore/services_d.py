@@ -125,7 +125,9 @@ def _installed_manifests(manager) -> Dict[str, ServiceDefinition]:
     if not services_dir.exists():
         return installed
     for service_dir in sorted(services_dir.iterdir()):
-        if not service_dir.is_dir():
+        # Dot entries are ServiceManager's in-flight clone staging dirs, never
+        # installs (service names cannot start with '.').
+        if service_dir.name.startswith(".") or not service_dir.is_dir():
             continue
         manifest = service_dir / "syrvis-service.yaml"
         try:
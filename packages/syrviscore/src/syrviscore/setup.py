@@ -13,6 +13,7 @@ It handles:
 import click
 import sys
 import os
+import stat
 from pathlib import Path
 from datetime import datetime
 
@@ -681,27 +682,37 @@ def generate_docker_compose(install_dir: Path) -> bool:
         return False
 
 
+# Directories setup owns, relative to SYRVIS_HOME, parents before children.
+# Intermediates are listed too: each one is forced to 0755, not left to umask.
+_DATA_DIRECTORIES = (
+    # Core data directories
+    "data",
+    "data/traefik",
+    "data/traefik/config",
+    "data/traefik/config/dynamic",  # Layer 2 service configs
+    "data/traefik/logs",
+    "data/portainer",
+    "data/cloudflared",
+    # Layer 2 service directories
+    "services",  # Service definitions (cloned repos)
+    "compose",  # Generated compose files
+)
+
+
 def ensure_data_directories() -> None:
     """Ensure all data directories exist with proper permissions."""
     syrvis_home = paths.get_syrvis_home()
-    data_dir = paths.get_data_dir()
-
-    # Create all required directories with 755 permissions
-    directories = [
-        # Core data directories
-        data_dir,
-        data_dir / "traefik",
-        data_dir / "traefik" / "config",
-        data_dir / "traefik" / "config" / "dynamic",  # Layer 2 service configs
-        data_dir / "traefik" / "logs",
-        data_dir / "portainer",
-        data_dir / "cloudflared",
-        # Layer 2 service directories
-        syrvis_home / "services",  # Service definitions (cloned repos)
-        syrvis_home / "compose",  # Generated compose files
-    ]
-
-    for directory in directories:
+
+    for rel in _DATA_DIRECTORIES:
+        directory = syrvis_home / rel
+        # Re-runs find everything in place: one stat per directory instead of
+        # mkdir + is_dir + chmod.
+        try:
+            st = os.stat(str(directory))
+        except FileNotFoundError:
+            st = None
+        if st is not None and stat.S_ISDIR(st.st_mode) and stat.S_IMODE(st.st_mode) == 0o755:
+            continue
         directory.mkdir(parents=True, exist_ok=True)
         directory.chmod(0o755)
 
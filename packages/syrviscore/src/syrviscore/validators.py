@@ -14,10 +14,13 @@ Used by:
 - syrvis setup: Pre-flight validation
 """
 
+import functools
+import ipaddress
 import os
 import socket
 import ssl
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -166,6 +169,51 @@ def validate_dns(domain: str, expected_ip: str = None) -> Dict:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _cert_inspection_context() -> ssl.SSLContext:
+    """One TLS client context shared by every certificate check.
+
+    The check wants to see whatever certificate is served, valid or not, so it
+    never verifies: no CA bundle is loaded (create_default_context would read
+    the system store on every call just to be ignored). SSLContext is safe to
+    share across the doctor's probe threads.
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE  # We want to see any cert, even invalid
+    return context
+
+
+@functools.lru_cache(maxsize=64)
+def _openssl_cert_fields(cert_der: bytes) -> Optional[str]:
+    """Issuer/subject/dates of a DER certificate as printed by ``openssl x509``.
+
+    Endpoints behind one Traefik usually present the same (wildcard or SAN)
+    certificate, so the parse is cached by the certificate bytes and the
+    openssl subprocess runs once per distinct cert. Only the text is cached;
+    expiry arithmetic is redone by the caller on every check. None if openssl
+    could not parse it.
+    """
+    proc = subprocess.run(
+        [
+            "openssl",
+            "x509",
+            "-inform",
+            "DER",
+            "-noout",
+            "-issuer",
+            "-subject",
+            "-dates",
+        ],
+        input=cert_der,
+        capture_output=True,
+        timeout=10,
+    )
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode()
+
+
 def check_certificate(hostname: str, port: int = 443) -> Dict:
     """
     Check SSL certificate for a hostname.
@@ -187,34 +235,16 @@ def check_certificate(hostname: str, port: int = 443) -> Dict:
     }
 
     try:
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE  # We want to see any cert, even invalid
+        context = _cert_inspection_context()
 
         with socket.create_connection((hostname, port), timeout=10) as sock:
             with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                 cert = ssock.getpeercert(binary_form=True)
 
                 # Parse certificate using openssl
-                proc = subprocess.run(
-                    [
-                        "openssl",
-                        "x509",
-                        "-inform",
-                        "DER",
-                        "-noout",
-                        "-issuer",
-                        "-subject",
-                        "-dates",
-                    ],
-                    input=cert,
-                    capture_output=True,
-                    timeout=10,
-                )
-
-                if proc.returncode == 0:
-                    output = proc.stdout.decode()
+                output = _openssl_cert_fields(cert)
 
+                if output is not None:
                     for line in output.split("\n"):
                         if line.startswith("issuer="):
                             result["issuer"] = line.split("=", 1)[1].strip()
@@ -318,6 +348,42 @@ def check_http_endpoint(url: str, timeout: int = 10) -> Dict:
     return result
 
 
+def _connect_tcp(host: str, port: int, timeout: float) -> None:
+    """Open (and close) a TCP connection to host:port, raising on failure.
+
+    An IP literal (the NAS_IP probes, most backend hosts) is connected to
+    directly with no getaddrinfo round. For a hostname, IPv4 addresses are
+    tried before IPv6: an unroutable AAAA answer would otherwise cost a full
+    timeout before the working A record is tried.
+    """
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        ip = None
+    if ip is not None:
+        family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+        candidates = [(family, (host, int(port)))]
+    else:
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        candidates = sorted(
+            ((family, sockaddr) for family, _, _, _, sockaddr in infos),
+            key=lambda candidate: candidate[0] != socket.AF_INET,
+        )
+
+    error: Optional[OSError] = None
+    for family, sockaddr in candidates:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(sockaddr)
+            return
+        except OSError as exc:
+            error = exc
+        finally:
+            sock.close()
+    raise error if error is not None else OSError(f"No address for {host}")
+
+
 def check_tcp_port(host: str, port: int, timeout: int = 5) -> Dict:
     """
     Check if a TCP port is reachable.
@@ -330,8 +396,8 @@ def check_tcp_port(host: str, port: int, timeout: int = 5) -> Dict:
     }
 
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            result["reachable"] = True
+        _connect_tcp(host, port, timeout)
+        result["reachable"] = True
     except socket.timeout:
         result["error"] = "Connection timeout"
     except ConnectionRefusedError:
@@ -635,13 +701,23 @@ class DockerValidator:
         )
 
     def validate(self) -> ValidationReport:
-        """Run all Docker checks."""
+        """Run all Docker checks.
+
+        The checks are independent, so they run concurrently: the sweep costs
+        the slowest probe (the ``docker info`` round trip) rather than the sum.
+        Results keep their fixed order.
+        """
         report = ValidationReport(category="Docker Access")
-        report.checks.append(self.check_docker_group())
-        report.checks.append(self.check_user_in_group())
-        report.checks.append(self.check_socket_exists())
-        report.checks.append(self.check_socket_permissions())
-        report.checks.append(self.check_daemon_accessible())
+        checks = (
+            self.check_docker_group,
+            self.check_user_in_group,
+            self.check_socket_exists,
+            self.check_socket_permissions,
+            self.check_daemon_accessible,
+        )
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [pool.submit(check) for check in checks]
+        report.checks.extend(future.result() for future in futures)
         return report
 
 
@@ -57,6 +57,36 @@ class TestWriteScriptIfChanged:
         assert state == "updated"
         assert target.read_text() == "new\n"
 
+    def test_fsync_only_when_written(self, tmp_path, monkeypatch):
+        target = tmp_path / "S99syrviscore.sh"
+        synced = []
+        real_fsync = privileged_ops.os.fsync
+        monkeypatch.setattr(
+            privileged_ops.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd)
+        )
+
+        privileged_ops._write_script_if_changed(target, "hello\n", 0o755)
+        assert len(synced) == 1
+        privileged_ops._write_script_if_changed(target, "hello\n", 0o755)
+        assert len(synced) == 1
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_unchanged_skips_chmod_unless_mode_drifted(self, tmp_path, monkeypatch):
+        target = tmp_path / "S99syrviscore.sh"
+        privileged_ops._write_script_if_changed(target, "hello\n", 0o755)
+        chmods = []
+        real_chmod = Path.chmod
+        monkeypatch.setattr(Path, "chmod", lambda p, m: chmods.append(m) or real_chmod(p, m))
+
+        privileged_ops._write_script_if_changed(target, "hello\n", 0o755)
+        assert chmods == []
+
+        real_chmod(target, 0o644)
+        changed, state = privileged_ops._write_script_if_changed(target, "hello\n", 0o755)
+        assert (changed, state) == (False, "unchanged")
+        assert chmods == [0o755]
+        assert (target.stat().st_mode & 0o777) == 0o755
+
 
 def _patch_s99_path(monkeypatch, s99: Path) -> None:
     """Redirect the hardcoded ``/usr/local/etc/rc.d/S99syrviscore.sh`` lookup in
@@ -6,9 +6,10 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 from docker.errors import DockerException
 
-from syrviscore import compose_cmd
+from syrviscore import compose_cmd, docker_manager
 from syrviscore.docker_manager import DockerConnectionError, DockerError, DockerManager
 from syrviscore.paths import set_syrvis_home
 
@@ -23,6 +24,14 @@ def _pin_compose_cmd():
     compose_cmd.reset_cache()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_docker_client():
+    """Each test patches docker.from_env; never reuse a previous test's client."""
+    docker_manager._reset_shared_client()
+    yield
+    docker_manager._reset_shared_client()
+
+
 @pytest.fixture
 def temp_syrvis_home_with_compose(tmp_path):
     """Create temp SYRVIS_HOME with docker-compose.yaml in versioned structure."""
@@ -75,6 +84,26 @@ class TestDockerManagerInit:
         assert manager.client == mock_docker_client
         mock_docker_client.ping.assert_called_once()
 
+    def test_client_is_shared_and_pinged_once(self, mock_docker_client):
+        """A second manager reuses the connected client without another ping."""
+        first = DockerManager()
+        second = DockerManager()
+        assert first.client is second.client
+        mock_docker_client.ping.assert_called_once()
+
+    def test_init_raises_once_daemon_goes_away(self, mock_docker_client, monkeypatch):
+        """After the TTL the shared client is re-pinged; a dead daemon raises."""
+        DockerManager()
+        monkeypatch.setattr(docker_manager, "_SHARED_CLIENT_PING_TTL", 0)
+        mock_docker_client.ping.side_effect = requests.exceptions.ConnectionError("refused")
+
+        with pytest.raises(DockerConnectionError, match="Cannot connect to Docker daemon"):
+            DockerManager()
+        assert docker_manager._shared_client is None
+
+        mock_docker_client.ping.side_effect = None
+        assert DockerManager().client is mock_docker_client
+
     def test_init_docker_not_running(self):
         """Test initialization when Docker not running."""
         with patch("syrviscore.docker_manager.docker.from_env") as mock:
@@ -129,16 +158,29 @@ class TestStartStopRestart:
             assert "-d" in args
 
     def test_stop_core_services(self, mock_docker_client, temp_syrvis_home_with_compose):
-        """Test stopping services."""
+        """Stop goes through the SDK (no compose subprocess), one stop per container."""
+        containers = [Mock(), Mock(), Mock()]
+        mock_docker_client.containers.list.return_value = containers
         with patch("syrviscore.docker_manager.subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-
             manager = DockerManager()
             manager.stop_core_services()
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert "stop" in args
+            mock_run.assert_not_called()
+        for container in containers:
+            container.stop.assert_called_once_with(timeout=10)
+
+    def test_stop_core_services_reports_failures(self, mock_docker_client):
+        """A failed stop is surfaced as DockerError naming the container."""
+        ok = Mock()
+        bad = Mock()
+        bad.name = "portainer"
+        bad.stop.side_effect = DockerException("conflict")
+        mock_docker_client.containers.list.return_value = [ok, bad]
+
+        manager = DockerManager()
+        with pytest.raises(DockerError, match="portainer: conflict"):
+            manager.stop_core_services()
+        ok.stop.assert_called_once_with(timeout=10)
 
     def test_restart_core_services(self, mock_docker_client, temp_syrvis_home_with_compose):
         """Restart force-recreates so both static-config AND compose-spec changes apply."""
@@ -154,23 +196,89 @@ class TestStartStopRestart:
             assert "--force-recreate" in args
 
 
+class TestCleanCoreServices:
+    """Test clean_core_services."""
+
+    def test_clean_selects_named_and_labelled_containers(self, mock_docker_client):
+        """One listing; exact-name or project-label matches are each removed once."""
+        mock_docker_client.api.containers.return_value = [
+            {
+                "Id": "t1",
+                "Names": ["/traefik"],
+                "Labels": {"com.docker.compose.project": "syrviscore"},
+            },
+            {
+                "Id": "r1",
+                "Names": ["/syrviscore-portainer-1"],
+                "Labels": {"com.docker.compose.project": "syrviscore"},
+            },
+            {"Id": "u1", "Names": ["/my-traefik-test"], "Labels": {}},
+        ]
+        mock_docker_client.networks.prune.return_value = {"NetworksDeleted": None}
+        mock_docker_client.api.networks.return_value = [{"Name": "bridge"}]
+
+        manager = DockerManager()
+        results = manager.clean_core_services()
+
+        mock_docker_client.api.containers.assert_called_once_with(all=True)
+        stopped = sorted(c.args[0] for c in mock_docker_client.api.stop.call_args_list)
+        assert stopped == ["r1", "t1"]
+        mock_docker_client.api.remove_container.assert_any_call("t1", force=True)
+        assert results["containers_removed"] == 2
+        assert results["containers_stopped"] == ["traefik", "syrviscore-portainer-1"]
+        assert results["networks_removed"] == 0
+        assert results["errors"] == []
+
+    def test_clean_collects_errors_and_networks(self, mock_docker_client):
+        """Per-container failures are reported; pruned and legacy networks are listed."""
+        mock_docker_client.api.containers.return_value = [
+            {"Id": "c1", "Names": ["/cloudflared"], "Labels": {}},
+        ]
+        mock_docker_client.api.stop.side_effect = RuntimeError("stuck")
+        mock_docker_client.networks.prune.return_value = {
+            "NetworksDeleted": ["syrviscore_proxy"]
+        }
+        # syrviscore_proxy is still listed (pruned concurrently) -> not removed twice
+        mock_docker_client.api.networks.return_value = [
+            {"Name": "config_proxy"},
+            {"Name": "syrviscore_proxy"},
+            {"Name": "unrelated"},
+        ]
+        legacy = Mock(attrs={"Containers": {"abc": {}}})
+        mock_docker_client.networks.get.return_value = legacy
+
+        manager = DockerManager()
+        results = manager.clean_core_services()
+
+        legacy.reload.assert_not_called()  # get() already inspected it
+        legacy.disconnect.assert_called_once_with("abc", force=True)
+
+        mock_docker_client.networks.prune.assert_called_once_with(
+            filters={"label": "com.docker.compose.project=syrviscore"}
+        )
+        mock_docker_client.networks.get.assert_called_once_with("config_proxy")
+        assert results["containers_removed"] == 0
+        assert results["errors"] == ["Container cloudflared: stuck"]
+        assert results["networks_cleaned"] == ["syrviscore_proxy", "config_proxy"]
+        assert results["networks_removed"] == 2
+
+
 class TestGetContainerStatus:
     """Test getting container status."""
 
     def test_get_container_status(self, mock_docker_client):
-        """Test getting status of containers."""
-        # Mock container
-        container = Mock()
-        container.name = "traefik"
-        container.status = "running"
-        container.labels = {"com.docker.compose.service": "traefik"}
-        container.image.tags = ["traefik:v3.0.0"]
-
-        # Mock created time (2 hours ago)
-        created_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        container.attrs = {"Created": created_time.isoformat()}
-
-        mock_docker_client.containers.list.return_value = [container]
+        """Status comes from one low-level list call (no per-container inspect)."""
+        created = datetime.now(timezone.utc) - timedelta(hours=2)
+        mock_docker_client.api.containers.return_value = [
+            {
+                "Id": "abc123",
+                "Names": ["/traefik"],
+                "State": "running",
+                "Created": int(created.timestamp()),
+                "Image": "traefik:v3.0.0",
+                "Labels": {"com.docker.compose.service": "traefik"},
+            }
+        ]
 
         manager = DockerManager()
         status = manager.get_container_status()
@@ -180,16 +288,70 @@ class TestGetContainerStatus:
         assert status["traefik"]["status"] == "running"
         assert status["traefik"]["image"] == "traefik:v3.0.0"
         assert "hour" in status["traefik"]["uptime"]
+        mock_docker_client.api.containers.assert_called_once_with(
+            all=True,
+            filters={"label": "com.docker.compose.project=syrviscore"},
+        )
+        mock_docker_client.containers.list.assert_not_called()
+        mock_docker_client.api.inspect_container.assert_not_called()
+
+    def test_get_container_status_image_id_uses_config_image(self, mock_docker_client):
+        """A moved tag lists the sha256 image ID; report Config.Image instead."""
+        created = datetime.now(timezone.utc) - timedelta(hours=2)
+        mock_docker_client.api.containers.return_value = [
+            {
+                "Id": "abc123",
+                "Names": ["/traefik"],
+                "State": "running",
+                "Created": int(created.timestamp()),
+                "Image": "sha256:" + "0" * 64,
+                "Labels": {"com.docker.compose.service": "traefik"},
+            }
+        ]
+        mock_docker_client.api.inspect_container.return_value = {
+            "Config": {"Image": "traefik:v3.0.0"}
+        }
+
+        manager = DockerManager()
+        status = manager.get_container_status()
+
+        assert status["traefik"]["image"] == "traefik:v3.0.0"
+        mock_docker_client.api.inspect_container.assert_called_once_with("abc123")
+
+    def test_get_container_status_missing_created(self, mock_docker_client):
+        """A list entry without Created shows Unknown uptime, not a KeyError."""
+        mock_docker_client.api.containers.return_value = [
+            {
+                "Id": "abc123",
+                "Names": ["/traefik"],
+                "State": "running",
+                "Image": "traefik:v3.0.0",
+                "Labels": {"com.docker.compose.service": "traefik"},
+            }
+        ]
+
+        manager = DockerManager()
+        status = manager.get_container_status()
+
+        assert status["traefik"]["uptime"] == "Unknown"
 
     def test_get_container_status_empty(self, mock_docker_client):
         """Test status with no containers."""
-        mock_docker_client.containers.list.return_value = []
+        mock_docker_client.api.containers.return_value = []
 
         manager = DockerManager()
         status = manager.get_container_status()
 
         assert status == {}
 
+    def test_get_container_status_docker_error(self, mock_docker_client):
+        """A daemon failure surfaces as DockerConnectionError."""
+        mock_docker_client.api.containers.side_effect = DockerException("socket closed")
+
+        manager = DockerManager()
+        with pytest.raises(DockerConnectionError, match="Failed to list containers"):
+            manager.get_container_status()
+
 
 class TestGetContainerLogs:
     """Test getting container logs."""
@@ -209,6 +371,25 @@ class TestGetContainerLogs:
         assert "traefik" in logs
         assert "Test log" in logs
 
+    def test_get_logs_single_service_filters_server_side(self, mock_docker_client):
+        """The service lookup pushes both labels to the daemon in one list call."""
+        container = Mock()
+        container.logs.return_value = b"ok\n"
+        mock_docker_client.containers.list.return_value = [container]
+
+        manager = DockerManager()
+        manager.get_container_logs(service="portainer", follow=False)
+
+        mock_docker_client.containers.list.assert_called_once_with(
+            all=True,
+            filters={
+                "label": [
+                    "com.docker.compose.project=syrviscore",
+                    "com.docker.compose.service=portainer",
+                ]
+            },
+        )
+
     def test_get_logs_all_services(self, mock_docker_client):
         """Test getting logs for all services."""
         container1 = Mock()
@@ -227,6 +408,69 @@ class TestGetContainerLogs:
         assert "traefik" in logs
         assert "portainer" in logs
 
+    def test_get_logs_tolerates_invalid_utf8(self, mock_docker_client):
+        """Undecodable bytes are replaced instead of failing the section."""
+        container = Mock()
+        container.labels = {"com.docker.compose.service": "traefik"}
+        container.logs.return_value = b"ok \xff\xfe done\n"
+        mock_docker_client.containers.list.return_value = [container]
+
+        manager = DockerManager()
+        logs = manager.get_container_logs(follow=False)
+
+        assert logs == "=== traefik ===\nok \ufffd\ufffd done\n\n"
+
+    def test_get_logs_all_services_keeps_order_and_errors(self, mock_docker_client):
+        """Parallel fetches still render in container order; a failure is inlined."""
+        first = Mock()
+        first.labels = {"com.docker.compose.service": "traefik"}
+        first.logs.side_effect = RuntimeError("gone")
+        second = Mock()
+        second.labels = {"com.docker.compose.service": "portainer"}
+        second.logs.return_value = b"Portainer log\n"
+        mock_docker_client.containers.list.return_value = [first, second]
+
+        manager = DockerManager()
+        logs = manager.get_container_logs(follow=False)
+
+        assert logs.index("=== traefik ===") < logs.index("=== portainer ===")
+        assert "Error getting logs: gone" in logs
+        assert "Portainer log" in logs
+
+    def test_follow_single_service_streams_via_sdk(self, mock_docker_client, capsys):
+        """`logs -f <svc>` streams from the SDK generator; no compose process."""
+        container = Mock()
+        container.labels = {
+            "com.docker.compose.project": "syrviscore",
+            "com.docker.compose.service": "traefik",
+        }
+        container.logs.return_value = iter([b"line one\n", b"line two\n"])
+        mock_docker_client.containers.list.return_value = [container]
+
+        with patch("syrviscore.docker_manager.subprocess.run") as mock_run:
+            manager = DockerManager()
+            assert manager.get_container_logs(service="traefik", follow=True) == ""
+            mock_run.assert_not_called()
+
+        container.logs.assert_called_once_with(stream=True, follow=True, tail=100)
+        assert capsys.readouterr().out == "line one\nline two\n"
+
+    def test_follow_all_services_prefixes_lines(self, mock_docker_client, capsys):
+        """Multi-container follow is multiplexed with compose-style prefixes."""
+        traefik = Mock()
+        traefik.labels = {"com.docker.compose.service": "traefik"}
+        traefik.logs.return_value = iter([b"a\nb", b"c\n"])
+        portainer = Mock()
+        portainer.labels = {"com.docker.compose.service": "portainer"}
+        portainer.logs.return_value = iter([b"ready\n"])
+        mock_docker_client.containers.list.return_value = [traefik, portainer]
+
+        manager = DockerManager()
+        manager.get_container_logs(follow=True)
+
+        out = capsys.readouterr().out.splitlines()
+        assert sorted(out) == ["portainer | ready", "traefik | a", "traefik | bc"]
+
     def test_get_logs_service_not_found(self, mock_docker_client):
         """Test error when service not found (not core, not an L2 project)."""
         mock_docker_client.containers.list.return_value = []
@@ -354,6 +598,18 @@ class TestCreateTraefikFiles:
         updated_content = traefik_yml.read_text()
         assert updated_content == initial_content
 
+    def test_second_manager_rewrites_nothing(
+        self, mock_docker_client, temp_syrvis_home_with_compose
+    ):
+        """A fresh manager (one per command) regenerates, but unchanged files are left alone."""
+        assert DockerManager()._create_traefik_files() is True
+        traefik_data = temp_syrvis_home_with_compose / "data" / "traefik"
+        outputs = [traefik_data / "traefik.yml", traefik_data / "config" / "dynamic.yml"]
+        before = [p.stat().st_mtime_ns for p in outputs]
+
+        assert DockerManager()._create_traefik_files() is False
+        assert [p.stat().st_mtime_ns for p in outputs] == before
+
     def test_acme_json_not_overwritten(self, mock_docker_client, temp_syrvis_home_with_compose):
         """Test that acme.json is NOT overwritten if it already exists."""
         manager = DockerManager()
@@ -433,6 +689,23 @@ class TestCreateTraefikFiles:
         traefik_yml.write_text("stale: config\n")
         assert write_traefik_config_files() is True
 
+    def test_env_file_reloaded_only_when_changed(self, temp_syrvis_home_with_compose):
+        """.env is parsed into os.environ once per content change, not per call."""
+        import os
+
+        env_file = temp_syrvis_home_with_compose / "config" / ".env"
+        env_file.write_text("DOMAIN=one.example\n")
+        with patch("syrviscore.docker_manager.load_dotenv") as mock_load:
+            docker_manager._load_env_file(env_file)
+            docker_manager._load_env_file(env_file)
+            assert mock_load.call_count == 1
+
+            env_file.write_text("DOMAIN=two.example.org\n")
+            st = env_file.stat()
+            os.utime(str(env_file), ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            docker_manager._load_env_file(env_file)
+            assert mock_load.call_count == 2
+
     def test_noop_regeneration_preserves_static_mtime(self, temp_syrvis_home_with_compose):
         """An unchanged static config must NOT be rewritten: the stale-static
         drift check is mtime-vs-StartedAt, so a no-op regen that bumped the
@@ -450,6 +723,24 @@ class TestCreateTraefikFiles:
         assert write_traefik_config_files() is False
         assert traefik_yml.stat().st_mtime == old_epoch  # untouched
 
+    def test_unchanged_config_with_wrong_mode_is_chmodded_not_rewritten(
+        self, temp_syrvis_home_with_compose
+    ):
+        """A mode drift is repaired without rewriting (and re-dating) the file."""
+        import os
+
+        from syrviscore.docker_manager import write_traefik_config_files
+
+        write_traefik_config_files()
+        traefik_yml = temp_syrvis_home_with_compose / "data" / "traefik" / "traefik.yml"
+        traefik_yml.chmod(0o600)
+        old_epoch = traefik_yml.stat().st_mtime - 3600
+        os.utime(str(traefik_yml), (old_epoch, old_epoch))
+
+        assert write_traefik_config_files() is False
+        assert oct(traefik_yml.stat().st_mode)[-3:] == "644"
+        assert traefik_yml.stat().st_mtime == old_epoch
+
     def test_start_core_services_restarts_traefik_on_static_change(
         self, mock_docker_client, temp_syrvis_home_with_compose
     ):
@@ -538,6 +829,79 @@ class TestCreateTraefikFiles:
         assert dynamic_yml.is_file(), "dynamic.yml should be a file"
 
 
+class TestMacvlanShimMarker:
+    """The shim reconcile is skipped while the marker matches the live shim."""
+
+    def test_marker_skips_repeat_reconcile(
+        self, mock_docker_client, temp_syrvis_home_with_compose, tmp_path, monkeypatch
+    ):
+        ifindex = tmp_path / "ifindex"
+        ifindex.write_text("42\n")
+        monkeypatch.setattr(docker_manager, "_SHIM_IFINDEX_PATH", ifindex)
+        monkeypatch.setenv("NETWORK_INTERFACE", "ovs_eth0")
+        monkeypatch.setenv("TRAEFIK_IP", "192.168.1.10")
+        monkeypatch.delenv("SHIM_IP", raising=False)
+
+        manager = DockerManager()
+        with patch("syrviscore.privileged_ops.ensure_macvlan_shim") as mock_shim:
+            mock_shim.return_value = (True, "ok")
+            assert manager._ensure_macvlan_shim() is None
+            assert manager._ensure_macvlan_shim() is None
+            assert mock_shim.call_count == 1
+
+            # Shim recreated (new ifindex) -> reconcile again.
+            ifindex.write_text("43\n")
+            manager._ensure_macvlan_shim()
+            assert mock_shim.call_count == 2
+
+            # Settings changed -> reconcile again.
+            monkeypatch.setenv("TRAEFIK_IP", "192.168.1.20")
+            manager._ensure_macvlan_shim()
+            assert mock_shim.call_count == 3
+
+    def test_no_live_shim_always_reconciles(
+        self, mock_docker_client, temp_syrvis_home_with_compose, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(docker_manager, "_SHIM_IFINDEX_PATH", tmp_path / "missing")
+        monkeypatch.setenv("NETWORK_INTERFACE", "ovs_eth0")
+        monkeypatch.setenv("TRAEFIK_IP", "192.168.1.10")
+
+        manager = DockerManager()
+        with patch("syrviscore.privileged_ops.ensure_macvlan_shim") as mock_shim:
+            mock_shim.return_value = (False, "ip failed")
+            assert manager._ensure_macvlan_shim() == "ip failed"
+            assert manager._ensure_macvlan_shim() == "ip failed"
+            assert mock_shim.call_count == 2
+
+
+class TestComposePathCache:
+    """The compose file location is resolved once per manager."""
+
+    def test_compose_paths_resolved_once(self, mock_docker_client, temp_syrvis_home_with_compose):
+        with patch("syrviscore.docker_manager.subprocess.run") as mock_run, patch(
+            "syrviscore.docker_manager.get_syrvis_home",
+            wraps=docker_manager.get_syrvis_home,
+        ) as mock_home:
+            mock_run.return_value = Mock(returncode=0)
+            manager = DockerManager()
+            manager.pull_core_images()
+            manager.pull_core_images()
+
+        assert mock_home.call_count == 1
+        assert mock_run.call_args[1]["cwd"] == str(temp_syrvis_home_with_compose)
+
+    def test_missing_compose_file_still_raises(
+        self, mock_docker_client, temp_syrvis_home_with_compose
+    ):
+        with patch("syrviscore.docker_manager.subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            manager = DockerManager()
+            manager.pull_core_images()
+            (temp_syrvis_home_with_compose / "config" / "docker-compose.yaml").unlink()
+            with pytest.raises(FileNotFoundError, match="docker-compose.yaml not found"):
+                manager.pull_core_images()
+
+
 class TestDockerErrorHandling:
     """Test Docker error handling and output capture."""
 
@@ -567,7 +931,7 @@ class TestDockerErrorHandling:
 
             manager = DockerManager()
             with pytest.raises(DockerError) as exc_info:
-                manager.stop_core_services()
+                manager.pull_core_images()
 
             # Error should contain stdout if stderr empty
             assert "Error in stdout message" in str(exc_info.value)
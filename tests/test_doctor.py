@@ -0,0 +1,429 @@
+"""
+Tests for the doctor network check runners.
+
+The probes themselves are faked; these tests pin that the runners fan out
+concurrently while still reporting in endpoint order.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from syrviscore import doctor, validators
+
+
+@pytest.fixture(autouse=True)
+def _dns_cache_in_tmp(tmp_path, monkeypatch):
+    """Keep doctor's cross-run DNS cache out of any real installation."""
+    cache_path = tmp_path / "doctor_dns.json"
+    monkeypatch.setattr(doctor, "_dns_cache_path", lambda: cache_path)
+    return cache_path
+
+
+def _endpoints(*domains):
+    return [{"domain": d, "expected_ip": "192.168.1.10"} for d in domains]
+
+
+def test_unique_by_domain_keeps_first_in_order():
+    """Per-domain runners see each domain once, first occurrence, original order."""
+    endpoints = [
+        {"domain": "b.example.com", "name": "b"},
+        {"domain": "a.example.com", "name": "a1"},
+        {"domain": "b.example.com", "name": "b2"},
+        {"domain": "a.example.com", "name": "a2"},
+    ]
+    assert [e["name"] for e in doctor._unique_by_domain(endpoints)] == ["b", "a1"]
+
+
+class TestDnsChecks:
+    """run_dns_checks fans lookups out and reports in order."""
+
+    def test_lookups_run_concurrently_and_report_in_order(self, monkeypatch, capsys):
+        """Slow lookups overlap; output keeps the endpoint order."""
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake_validate(domain, expected_ip):
+            with lock:
+                active.append(domain)
+                peak[0] = max(peak[0], len(active))
+            # The first endpoint is the slowest, so a serial run would
+            # reorder nothing but a racing one would.
+            time.sleep(0.2 if domain == "a.example.com" else 0.05)
+            with lock:
+                active.remove(domain)
+            ok = {"ok": True, "ip": expected_ip}
+            return {
+                "domain": domain,
+                "local": ok,
+                "public": ok,
+                "consistent": True,
+                "split_horizon_ok": True,
+            }
+
+        monkeypatch.setattr(doctor, "validate_dns", fake_validate)
+
+        issues = doctor.run_dns_checks(
+            _endpoints("a.example.com", "b.example.com", "c.example.com")
+        )
+
+        assert issues == []
+        assert peak[0] > 1
+        out = capsys.readouterr().out
+        assert out.index("a.example.com") < out.index("b.example.com") < out.index("c.example.com")
+
+    def test_issue_reported_for_missing_record(self, monkeypatch, capsys):
+        """Per-endpoint results are matched to the right domain."""
+
+        def fake_validate(domain, expected_ip):
+            ok = domain != "missing.example.com"
+            res = {"ok": ok, "ip": expected_ip if ok else "NXDOMAIN"}
+            return {"domain": domain, "local": res, "public": res, "consistent": ok}
+
+        monkeypatch.setattr(doctor, "validate_dns", fake_validate)
+
+        issues = doctor.run_dns_checks(_endpoints("ok.example.com", "missing.example.com"))
+
+        assert issues == ["missing.example.com: no DNS record"]
+
+
+class TestDnsCache:
+    """Healthy DNS answers are reused across runs on request; failures never are."""
+
+    @staticmethod
+    def _resolver(calls, broken=()):
+        def fake_validate(domain, expected_ip):
+            calls.append(domain)
+            ok = domain not in broken
+            res = {"ok": ok, "ip": expected_ip if ok else "NXDOMAIN"}
+            return {"domain": domain, "local": res, "public": res, "consistent": ok, "correct": ok}
+
+        return fake_validate
+
+    def test_live_by_default(self, monkeypatch):
+        """Without opting in, every run resolves again."""
+        calls = []
+        monkeypatch.setattr(doctor, "validate_dns", self._resolver(calls))
+        endpoints = _endpoints("good.example.com")
+
+        doctor.run_dns_checks(endpoints)
+        doctor.run_dns_checks(endpoints)
+
+        assert calls == ["good.example.com", "good.example.com"]
+
+    def test_healthy_answers_reused_on_request(self, monkeypatch, capsys):
+        """With use_cache, healthy lookups are skipped and their rows marked."""
+        calls = []
+        monkeypatch.setattr(
+            doctor, "validate_dns", self._resolver(calls, broken={"bad.example.com"})
+        )
+        endpoints = _endpoints("good.example.com", "bad.example.com")
+
+        first = doctor.run_dns_checks(endpoints)
+        capsys.readouterr()
+        second = doctor.run_dns_checks(endpoints, use_cache=True)
+
+        assert first == second == ["bad.example.com: no DNS record"]
+        assert sorted(calls) == ["bad.example.com", "bad.example.com", "good.example.com"]
+        out = capsys.readouterr().out
+        assert "✓ good.example.com (cached)" in out
+        assert "bad.example.com (cached)" not in out
+
+    def test_expired_entries_resolved_again(self, monkeypatch):
+        """Entries older than the TTL are ignored."""
+        calls = []
+        monkeypatch.setattr(doctor, "validate_dns", self._resolver(calls))
+        endpoints = _endpoints("good.example.com")
+
+        doctor.run_dns_checks(endpoints)
+        real_time = time.time
+        monkeypatch.setattr(doctor.time, "time", lambda: real_time() + doctor._DNS_CACHE_TTL + 1)
+        doctor.run_dns_checks(endpoints, use_cache=True)
+
+        assert calls == ["good.example.com", "good.example.com"]
+
+    def test_unreadable_cache_ignored(self, monkeypatch, _dns_cache_in_tmp):
+        """A corrupt cache file just means resolving everything."""
+        _dns_cache_in_tmp.write_text("{not json")
+        calls = []
+        monkeypatch.setattr(doctor, "validate_dns", self._resolver(calls))
+
+        assert doctor.run_dns_checks(_endpoints("good.example.com"), use_cache=True) == []
+        assert calls == ["good.example.com"]
+
+
+class TestPortAndHttpChecks:
+    """TCP and HTTP runners match results back to the right target."""
+
+    def test_file_sharing_ports_probed_concurrently(self, monkeypatch, capsys):
+        """All four file-sharing ports are probed, overlapping, in listed order."""
+        started = []
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_tcp(host, port):
+            started.append(port)
+            barrier.wait()  # only passes if all four run at once
+            return {"host": host, "port": port, "reachable": port == 445, "error": None}
+
+        monkeypatch.setattr(doctor, "check_tcp_port", fake_tcp)
+
+        doctor.run_file_sharing_checks("192.168.1.5")
+
+        assert sorted(started) == [139, 445, 548, 2049]
+        out = capsys.readouterr().out
+        assert "✓ SMB (Windows/Mac): 192.168.1.5:445" in out
+        assert "- AFP (Mac): 192.168.1.5:548 (not enabled)" in out
+        assert out.index(":445") < out.index(":139") < out.index(":548") < out.index(":2049")
+
+    def test_backend_issue_names_the_failing_backend(self, monkeypatch):
+        """A failing backend's issue carries its own name and address."""
+
+        def fake_tcp(host, port):
+            reachable = port != 9000
+            return {"reachable": reachable, "error": None if reachable else "Connection refused"}
+
+        monkeypatch.setattr(doctor, "check_tcp_port", fake_tcp)
+        endpoints = [
+            {
+                "name": "web",
+                "domain": "w.example.com",
+                "backend_host": "10.0.0.2",
+                "backend_port": 80,
+            },
+            {
+                "name": "api",
+                "domain": "a.example.com",
+                "backend_host": "10.0.0.3",
+                "backend_port": 9000,
+            },
+        ]
+
+        issues = doctor.run_backend_checks(endpoints)
+
+        assert issues == ["Backend: api (10.0.0.3:9000) - Connection refused"]
+
+
+class TestCertificateChecks:
+    """Certificate parsing is shared across endpoints presenting one cert."""
+
+    def test_openssl_parse_cached_per_certificate(self, monkeypatch):
+        """The same DER bytes are parsed by openssl once."""
+        validators._openssl_cert_fields.cache_clear()
+        calls = []
+
+        class Proc:
+            returncode = 0
+            stdout = (
+                b"issuer=C = US, O = Let's Encrypt, CN = R11\nnotAfter=Jan  1 00:00:00 2099 GMT\n"
+            )
+
+        def fake_run(argv, **kwargs):
+            calls.append(kwargs["input"])
+            return Proc()
+
+        monkeypatch.setattr(validators.subprocess, "run", fake_run)
+
+        first = validators._openssl_cert_fields(b"cert-a")
+        second = validators._openssl_cert_fields(b"cert-a")
+        validators._openssl_cert_fields(b"cert-b")
+
+        assert first == second
+        assert calls == [b"cert-a", b"cert-b"]
+        validators._openssl_cert_fields.cache_clear()
+
+    def test_check_certificate_reuses_one_context(self, monkeypatch):
+        """No per-call default context (and CA bundle load) for an unverified probe."""
+        validators._cert_inspection_context.cache_clear()
+
+        def no_default_context(*args, **kwargs):
+            raise AssertionError("create_default_context called")
+
+        def refused(*args, **kwargs):
+            raise ConnectionRefusedError()
+
+        monkeypatch.setattr(validators.ssl, "create_default_context", no_default_context)
+        monkeypatch.setattr(validators.socket, "create_connection", refused)
+
+        assert validators.check_certificate("a.example.com")["error"] == "Connection refused"
+        assert validators.check_certificate("b.example.com")["error"] == "Connection refused"
+        context = validators._cert_inspection_context()
+        assert context is validators._cert_inspection_context()
+        assert context.verify_mode == validators.ssl.CERT_NONE
+
+    def test_duplicate_domains_handshake_once(self, monkeypatch, capsys):
+        """Endpoints sharing a domain reuse one certificate check."""
+        checked = []
+
+        def fake_check(domain):
+            checked.append(domain)
+            return {"is_letsencrypt": True, "days_remaining": 60}
+
+        monkeypatch.setattr(doctor, "check_certificate", fake_check)
+
+        issues = doctor.run_certificate_checks(
+            [
+                {"domain": "apps.example.com"},
+                {"domain": "apps.example.com"},
+                {"domain": "x.example.com"},
+            ]
+        )
+
+        assert issues == []
+        assert sorted(checked) == ["apps.example.com", "x.example.com"]
+        assert capsys.readouterr().out.count("✓ apps.example.com") == 2
+
+
+class TestCheckTcpPort:
+    """check_tcp_port against a real loopback listener."""
+
+    def test_ip_literal_connects_without_getaddrinfo(self, monkeypatch):
+        """A literal address is connected to directly."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def no_lookup(*args, **kwargs):
+            raise AssertionError("getaddrinfo called for an IP literal")
+
+        monkeypatch.setattr(validators.socket, "getaddrinfo", no_lookup)
+        try:
+            assert validators.check_tcp_port("127.0.0.1", port)["reachable"] is True
+        finally:
+            server.close()
+
+        closed = validators.check_tcp_port("127.0.0.1", port)
+        assert closed["reachable"] is False
+        assert closed["error"] == "Connection refused"
+
+    def test_hostname_resolved(self):
+        """Hostnames still go through the resolver."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        try:
+            result = validators.check_tcp_port("localhost", server.getsockname()[1])
+        finally:
+            server.close()
+        assert result["reachable"] is True
+
+
+class TestDockerValidator:
+    """DockerValidator runs its independent checks concurrently."""
+
+    def test_checks_overlap_and_keep_order(self, monkeypatch):
+        """All five checks are in flight together; results stay in order."""
+        names = [
+            "check_docker_group",
+            "check_user_in_group",
+            "check_socket_exists",
+            "check_socket_permissions",
+            "check_daemon_accessible",
+        ]
+        barrier = threading.Barrier(len(names), timeout=5)
+
+        for name in names:
+
+            def check(self, name=name):
+                barrier.wait()
+                return validators.CheckResult(name=name, passed=True, message="ok")
+
+            monkeypatch.setattr(validators.DockerValidator, name, check)
+
+        report = validators.DockerValidator(username="alice").validate()
+
+        assert [c.name for c in report.checks] == names
+
+
+class TestSectionOutput:
+    """Each runner writes its whole section with one echo."""
+
+    def test_health_section_written_once(self, monkeypatch):
+        """Header, per-endpoint lines and trailing blank line arrive in one write."""
+        writes = []
+        monkeypatch.setattr(doctor.click, "echo", lambda message=None, **kw: writes.append(message))
+        monkeypatch.setattr(
+            doctor,
+            "check_http_endpoint",
+            lambda url: {"reachable": True, "status_code": 200, "error": None},
+        )
+
+        doctor.run_endpoint_health_checks(_endpoints("a.example.com", "b.example.com"))
+
+        assert len(writes) == 1
+        assert writes[0].splitlines() == [
+            "Endpoint Health",
+            "-" * 70,
+            "  ✓ a.example.com: HTTP 200",
+            "  ✓ b.example.com: HTTP 200",
+        ]
+        assert writes[0].endswith("\n")
+
+    def test_endpoint_expected_status_extends_defaults(self, monkeypatch):
+        """An endpoint's expected_status adds to the default healthy set."""
+        writes = []
+        monkeypatch.setattr(doctor.click, "echo", lambda message=None, **kw: writes.append(message))
+        monkeypatch.setattr(
+            doctor,
+            "check_http_endpoint",
+            lambda url: {"reachable": True, "status_code": 401, "error": None},
+        )
+        endpoints = [
+            {"domain": "auth.example.com", "expected_status": [401]},
+            {"domain": "plain.example.com"},
+        ]
+
+        doctor.run_endpoint_health_checks(endpoints)
+
+        assert "  ✓ auth.example.com: HTTP 401" in writes[0]
+        assert "  ⚠ plain.example.com: HTTP 401" in writes[0]
+
+
+class TestDoctorValidators:
+    """The installation-side validators run together; reports keep their order."""
+
+    def test_validators_overlap_and_report_in_order(self, monkeypatch):
+        from click.testing import CliRunner
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_validator(category):
+            class Fake:
+                syrvis_home = "/volume1/syrviscore"
+
+                def __init__(self, *args, **kwargs):
+                    pass
+
+                def validate(self):
+                    barrier.wait()  # only passes if all four run at once
+                    report = validators.ValidationReport(category=category)
+                    report.checks.append(
+                        validators.CheckResult(name=category, passed=True, message="ok")
+                    )
+                    return report
+
+                def get_value(self, key, default=""):
+                    return default
+
+            return Fake
+
+        monkeypatch.setattr(doctor, "InstallationValidator", fake_validator("Installation"))
+        monkeypatch.setattr(doctor, "DockerValidator", fake_validator("Docker"))
+        monkeypatch.setattr(doctor, "ConfigurationValidator", fake_validator("Configuration"))
+        monkeypatch.setattr(doctor, "SystemValidator", fake_validator("System"))
+        monkeypatch.setattr(doctor, "get_configured_endpoints", lambda config: [])
+
+        result = CliRunner().invoke(doctor.doctor, [])
+
+        assert result.exit_code == 0, result.output
+        out = result.output
+        assert (
+            out.index("Installation\n")
+            < out.index("Docker\n")
+            < out.index("Configuration\n")
+            < out.index("System\n")
+        )
+        assert "All checks passed" in out
@@ -8,68 +8,63 @@ must be reconciled -- otherwise the stale address/route lingers and host->Traefi
 reachability stays broken until a reboot.
 
 These tests fake `subprocess.run` (the real thing needs root + `ip`), dispatching
-on the `ip ...` argv so each scenario returns realistic output.
+on the `ip ...` argv, plus the syscall-level probes (interface existence, its
+address, the /32 host route) the steady-state check uses instead of `ip`. The
+create path runs as one `ip -batch -`; the fake replays each batch line as its
+own argv.
 """
 
+import os
 from unittest.mock import Mock
 
 import pytest
 
+from syrviscore import privileged_ops
 from syrviscore.privileged_ops import DsmOperations
 
 SHIM = "syrvis-shim"
 INTERFACE = "ovs_eth0"
 
 
-def _addr_output(ip):
-    """Realistic-ish `ip addr show syrvis-shim` output carrying one inet addr."""
-    return (
-        f"42: {SHIM}@{INTERFACE}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500\n"
-        f"    link/ether 02:42:ac:11:00:02 brd ff:ff:ff:ff:ff:ff\n"
-        f"    inet {ip}/32 scope global {SHIM}\n"
-        f"       valid_lft forever preferred_lft forever\n"
-    )
-
-
-def _route_output(traefik_ip, dev=SHIM):
-    """Realistic `ip route show <traefik_ip>/32` output."""
-    return f"{traefik_ip} dev {dev} scope link\n"
-
-
 class _FakeIp:
     """
     Dispatches faked `ip` invocations based on argv and records calls.
 
     State (the shim's currently-assigned address, whether the interface exists,
     and the current route device) is configurable so each test can model a
-    starting condition. Mutating verbs (link add/del, addr add, route add/del)
+    starting condition. Mutating verbs (link add/del, addr add, route replace)
     update the recorded state so assertions can inspect the resulting config.
+    Lines fed to `ip -batch -` are recorded and dispatched one by one; a line in
+    ``fail_on`` makes the batch stop there with a non-zero exit. ``iface_exists``,
+    ``iface_ipv4`` and ``host_route_dev`` stand in for the module's probes.
     """
 
-    def __init__(self, *, exists, current_shim_ip=None, route_dev=None):
+    def __init__(self, *, exists, current_shim_ip=None, route_dev=None, fail_on=None):
         self.exists = exists
         self.current_shim_ip = current_shim_ip
         self.route_dev = route_dev
+        self.fail_on = fail_on
         self.calls = []
+        self.spawns = 0
+
+    def __call__(self, argv, *args, input=None, **kwargs):
+        self.spawns += 1
+        if argv[1:] == ["-batch", "-"]:
+            for line in input.splitlines():
+                if self.fail_on and line.startswith(self.fail_on):
+                    self.calls.append(["ip"] + line.split())
+                    return Mock(returncode=1, stdout="", stderr="RTNETLINK answers: error")
+                self._dispatch(["ip"] + line.split())
+            return Mock(returncode=0, stdout="", stderr="")
+        return self._dispatch(argv)
 
-    def __call__(self, argv, *args, **kwargs):
-        self.calls.append(list(argv))
+    def _dispatch(self, argv):
+        # The code resolves `ip` to an absolute path; record it by name.
+        argv = [os.path.basename(argv[0])] + list(argv[1:])
+        self.calls.append(argv)
         # argv always starts with "ip"; branch on the subcommand.
         sub = argv[1:]
 
-        if sub[:2] == ["link", "show"]:
-            rc = 0 if self.exists else 1
-            return Mock(returncode=rc, stdout="", stderr="")
-
-        if sub[:2] == ["addr", "show"]:
-            stdout = _addr_output(self.current_shim_ip) if self.current_shim_ip else ""
-            return Mock(returncode=0, stdout=stdout, stderr="")
-
-        if sub[:2] == ["route", "show"]:
-            traefik_ip = sub[2].split("/")[0]
-            stdout = _route_output(traefik_ip, self.route_dev) if self.route_dev else ""
-            return Mock(returncode=0, stdout=stdout, stderr="")
-
         if sub[:2] == ["link", "add"]:
             self.exists = True
             return Mock(returncode=0, stdout="", stderr="")
@@ -87,16 +82,23 @@ class _FakeIp:
             self.current_shim_ip = sub[2].split("/")[0]
             return Mock(returncode=0, stdout="", stderr="")
 
-        if sub[:2] == ["route", "add"]:
+        if sub[:2] == ["route", "replace"]:
             self.route_dev = sub[-1]  # ... dev <shim_name>
             return Mock(returncode=0, stdout="", stderr="")
 
-        if sub[:2] == ["route", "del"]:
-            self.route_dev = None
-            return Mock(returncode=0, stdout="", stderr="")
-
         raise AssertionError(f"unexpected ip invocation: {argv}")
 
+    def iface_exists(self, name):
+        return name == SHIM and self.exists
+
+    def iface_ipv4(self, name):
+        if not self.iface_exists(name) or not self.current_shim_ip:
+            return None
+        return f"{self.current_shim_ip}/32"
+
+    def host_route_dev(self, ip):
+        return self.route_dev
+
     def argv_list(self):
         """The recorded argv lists, one per subprocess.run call."""
         return self.calls
@@ -110,6 +112,9 @@ class _FakeIp:
 def patch_ip(monkeypatch):
     def _install(fake):
         monkeypatch.setattr("syrviscore.privileged_ops.subprocess.run", fake)
+        monkeypatch.setattr(privileged_ops, "_iface_exists", fake.iface_exists)
+        monkeypatch.setattr(privileged_ops, "_iface_ipv4", fake.iface_ipv4)
+        monkeypatch.setattr(privileged_ops, "_host_route_dev", fake.host_route_dev)
         return fake
 
     return _install
@@ -125,12 +130,12 @@ class TestEnsureMacvlanShimReconcile:
 
         assert ok
         assert "already configured" in msg
-        # No mutation of any kind.
+        # No mutation of any kind -- and no `ip` process at all.
+        assert fake.spawns == 0
         assert not fake.did("ip", "link", "del")
         assert not fake.did("ip", "link", "add")
         assert not fake.did("ip", "addr", "add")
-        assert not fake.did("ip", "route", "add")
-        assert not fake.did("ip", "route", "del")
+        assert not fake.did("ip", "route", "replace")
 
     def test_stale_ip_triggers_teardown_and_recreate(self, patch_ip):
         """(b) Shim exists but with the OLD IP: delete + recreate at the new IP + route."""
@@ -147,7 +152,7 @@ class TestEnsureMacvlanShimReconcile:
         # ...and rebuilt with the new address + route.
         assert fake.did("ip", "link", "add", SHIM)
         assert fake.did("ip", "addr", "add", f"{shim_ip}/32", "dev", SHIM)
-        assert fake.did("ip", "route", "add", f"{traefik_ip}/32", "dev", SHIM)
+        assert fake.did("ip", "route", "replace", f"{traefik_ip}/32", "dev", SHIM)
         # End state reflects the desired values.
         assert fake.current_shim_ip == shim_ip
         assert fake.route_dev == SHIM
@@ -165,8 +170,8 @@ class TestEnsureMacvlanShimReconcile:
         assert not fake.did("ip", "link", "del")
         assert not fake.did("ip", "link", "add")
         assert not fake.did("ip", "addr", "add")
-        # Route is (re)added on the shim.
-        assert fake.did("ip", "route", "add", f"{traefik_ip}/32", "dev", SHIM)
+        # Route is (re)placed on the shim.
+        assert fake.did("ip", "route", "replace", f"{traefik_ip}/32", "dev", SHIM)
         assert fake.route_dev == SHIM
 
     def test_correct_ip_stale_route_device_reconciles_route(self, patch_ip):
@@ -178,12 +183,11 @@ class TestEnsureMacvlanShimReconcile:
 
         assert ok
         assert "route reconciled" in msg
-        assert fake.did("ip", "route", "del", f"{traefik_ip}/32")
-        assert fake.did("ip", "route", "add", f"{traefik_ip}/32", "dev", SHIM)
+        assert fake.did("ip", "route", "replace", f"{traefik_ip}/32", "dev", SHIM)
         assert not fake.did("ip", "link", "del")
 
     def test_missing_interface_creates_from_scratch(self, patch_ip):
-        """No shim yet: existing create path runs (link add, addr add, up, route add)."""
+        """No shim yet: one batch creates it (link add, addr add, up, route replace)."""
         traefik_ip, shim_ip = "192.168.1.50", "192.168.1.51"
         fake = patch_ip(_FakeIp(exists=False))
 
@@ -196,9 +200,24 @@ class TestEnsureMacvlanShimReconcile:
         )
         assert fake.did("ip", "addr", "add", f"{shim_ip}/32", "dev", SHIM)
         assert fake.did("ip", "link", "set", SHIM, "up")
-        assert fake.did("ip", "route", "add", f"{traefik_ip}/32", "dev", SHIM)
+        assert fake.did("ip", "route", "replace", f"{traefik_ip}/32", "dev", SHIM)
         # Never tears anything down on a clean create.
         assert not fake.did("ip", "link", "del")
+        # A single batch: one process, not five.
+        assert fake.spawns == 1
+
+    def test_failed_batch_rolls_back_shim(self, patch_ip):
+        """A batch that stops part-way deletes the half-built shim and reports it."""
+        traefik_ip, shim_ip = "192.168.1.50", "192.168.1.51"
+        fake = patch_ip(_FakeIp(exists=False, fail_on="addr add"))
+
+        ok, msg = DsmOperations().ensure_macvlan_shim(INTERFACE, traefik_ip, shim_ip)
+
+        assert not ok
+        assert "Failed to create shim interface" in msg
+        assert fake.did("ip", "link", "del", SHIM)
+        assert not fake.did("ip", "link", "set", SHIM, "up")
+        assert not fake.exists
 
 
 class TestStartupScriptReconcile:
@@ -280,3 +299,29 @@ class TestStartupScriptSeamSelfHeal:
             )
             assert out.returncode == 0, out.stderr
             assert out.stdout.strip() == expected
+
+
+class TestShimProbes:
+    """The syscall-level probes behind the steady-state check."""
+
+    def test_loopback_exists_with_address(self):
+        assert privileged_ops._iface_exists("lo") is True
+        assert privileged_ops._iface_ipv4("lo") == "127.0.0.1/8"
+
+    def test_missing_interface(self):
+        assert privileged_ops._iface_exists("syrvis-nope0") is False
+        assert privileged_ops._iface_ipv4("syrvis-nope0") is None
+
+    def test_host_route_dev_reads_proc_table(self, tmp_path, monkeypatch):
+        table = tmp_path / "route"
+        table.write_text(
+            "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT\n"
+            "eth0\t00000000\t0101A8C0\t0003\t0\t0\t0\t00000000\t0\t0\t0\n"
+            "eth0\t0001A8C0\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0\n"
+            f"{SHIM}\t3201A8C0\t00000000\t0005\t0\t0\t0\tFFFFFFFF\t0\t0\t0\n"
+        )
+        monkeypatch.setattr(privileged_ops, "_PROC_NET_ROUTE", str(table))
+
+        assert privileged_ops._host_route_dev("192.168.1.50") == SHIM
+        # Covered only by the /24 -- not a host route
+        assert privileged_ops._host_route_dev("192.168.1.51") is None
@@ -8,6 +8,7 @@ real filesystem state in tmp_path in milliseconds.
 
 import io
 import json
+import os
 import stat
 import tarfile
 
@@ -160,9 +161,30 @@ class TestInstall:
         assert list((vdir / "wheel").glob("*.whl"))
         assert paths.active_version(home) == "0.1.0"
         assert (home / "bin" / "syrvis").exists()
+        assert (home / "bin" / "syrvis").stat().st_mode & 0o777 == 0o755
         assert (home / "syrvis.profile").exists()
         assert manifest.get_version_info(home, "0.1.0") is not None
 
+    def test_set_tree_readable_normalizes_modes(self, tmp_path):
+        tree = tmp_path / "tree"
+        (tree / "lib" / "pkg").mkdir(parents=True)
+        (tree / "bin").mkdir()
+        (tree / "lib" / "pkg" / "mod.py").write_text("x = 1\n")
+        (tree / "bin" / "tool").write_text("#!/bin/sh\n")
+        (tree / "bin" / "dangling").symlink_to(tmp_path / "missing")
+        for p in (tree / "lib" / "pkg", tree / "lib" / "pkg" / "mod.py", tree / "bin" / "tool"):
+            p.chmod(0o700)
+
+        version_manager.set_tree_readable(tree)
+
+        def mode(p):
+            return stat.S_IMODE(p.stat().st_mode)
+
+        assert mode(tree) == 0o755
+        assert mode(tree / "lib" / "pkg") == 0o755
+        assert mode(tree / "lib" / "pkg" / "mod.py") == 0o644
+        assert mode(tree / "bin" / "tool") == 0o755
+
     def test_wheel_filename_version_inference(self, tmp_path, home):
         bad = tmp_path / "notawheel-1.0.whl"
         bad.write_bytes(b"x")
@@ -331,6 +353,22 @@ class TestUninstall:
         assert not (home / "versions" / "0.1.0").exists()
         assert manifest.get_version_info(home, "0.1.0") is None
 
+    def test_remove_tree_unlinks_symlinks_without_following(self, tmp_path):
+        keep = tmp_path / "keep"
+        keep.mkdir()
+        (keep / "data.txt").write_text("x")
+        tree = tmp_path / "tree"
+        (tree / "lib" / "pkg").mkdir(parents=True)
+        (tree / "lib" / "pkg" / "mod.py").write_text("x = 1\n")
+        (tree / "lib64").symlink_to(tree / "lib")
+        (tree / "outside").symlink_to(keep)
+        (tree / "dangling").symlink_to(tmp_path / "missing")
+
+        version_manager.remove_tree(tree)
+
+        assert not os.path.lexists(str(tree))
+        assert (keep / "data.txt").exists()
+
 
 class TestCleanup:
     def test_keeps_active_and_newest(self, home, tmp_path, fake_venv_backend):
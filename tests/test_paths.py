@@ -17,8 +17,10 @@ from syrviscore.paths import (
     get_data_dir,
     get_versions_dir,
     get_active_version,
+    get_active_version_dir,
     list_installed_versions,
     set_syrvis_home,
+    update_current_symlink,
     unset_syrvis_home,
     validate_docker_compose_exists,
     ensure_directory_structure,
@@ -78,6 +80,25 @@ class TestGetSyrvisHome:
         result = get_syrvis_home()
         assert result == temp_syrvis_home
 
+    def test_env_home_confirmed_once_per_value(self, temp_syrvis_home, tmp_path, monkeypatch):
+        """A repeated SYRVIS_HOME value skips the isdir; a new value is checked."""
+        from syrviscore import paths
+
+        set_syrvis_home(str(temp_syrvis_home))
+        assert get_syrvis_home() == temp_syrvis_home
+
+        checked = []
+        real_isdir = os.path.isdir
+        monkeypatch.setattr(paths.os.path, "isdir", lambda p: checked.append(p) or real_isdir(p))
+        assert get_syrvis_home() == temp_syrvis_home
+        assert checked == []
+
+        other = tmp_path / "other-home"
+        other.mkdir()
+        monkeypatch.setenv("SYRVIS_HOME", str(other))
+        assert get_syrvis_home() == other
+        assert checked == [str(other)]
+
     def test_get_syrvis_home_not_set(self):
         """Test error when SYRVIS_HOME not set and no installation found."""
         unset_syrvis_home()
@@ -150,6 +171,27 @@ class TestIsInstallRoot:
         (root / ".syrviscore-manifest.json").write_text("{not json")
         assert _is_install_root(root) is False
 
+    def test_volume_search_skips_stray_copy_and_keeps_volume_order(self, tmp_path, monkeypatch):
+        """Strategy 3 takes the lowest-numbered volume holding a genuine install."""
+        from syrviscore import paths
+
+        for vol, self_identifying in (("volume2", False), ("volume3", True), ("volume5", True)):
+            root = tmp_path / vol / "syrviscore"
+            root.mkdir(parents=True)
+            recorded = str(root) if self_identifying else "/volume9/syrviscore"
+            (root / ".syrviscore-manifest.json").write_text(
+                json.dumps({"schema_version": 3, "install_path": recorded})
+            )
+        monkeypatch.setattr(
+            paths,
+            "_SECONDARY_VOLUME_MANIFEST_GLOB",
+            str(tmp_path / "volume[2-9]" / "syrviscore" / ".syrviscore-manifest.json"),
+        )
+        unset_syrvis_home()
+
+        assert get_syrvis_home() == tmp_path / "volume3" / "syrviscore"
+        unset_syrvis_home()
+
 
 class TestGetDockerComposePath:
     """Test get_docker_compose_path function."""
@@ -263,6 +305,37 @@ class TestVersionedPaths:
         result = get_active_version()
         assert result == "0.0.1"
 
+    def test_get_active_version_dir_follows_symlink_switch(self, temp_syrvis_home):
+        """The resolved ``current`` target tracks a replaced symlink."""
+        set_syrvis_home(str(temp_syrvis_home))
+        assert get_active_version_dir() == (temp_syrvis_home / "versions" / "0.0.1").resolve()
+
+        (temp_syrvis_home / "versions" / "0.0.2").mkdir()
+        tmp_link = temp_syrvis_home / ".current.tmp"
+        tmp_link.symlink_to("versions/0.0.2")
+        os.replace(str(tmp_link), str(temp_syrvis_home / "current"))
+        assert get_active_version_dir() == (temp_syrvis_home / "versions" / "0.0.2").resolve()
+
+    def test_get_active_version_dir_dangling_symlink_uses_manifest(self, temp_syrvis_home):
+        """A dangling ``current`` falls back to the manifest's active version."""
+        set_syrvis_home(str(temp_syrvis_home))
+        current = temp_syrvis_home / "current"
+        current.unlink()
+        current.symlink_to("versions/9.9.9")
+        assert get_active_version_dir() == temp_syrvis_home / "versions" / "0.0.1"
+
+    def test_update_current_symlink_replaces_link(self, temp_syrvis_home):
+        """Switching versions swaps the link in place and leaves no temp link."""
+        set_syrvis_home(str(temp_syrvis_home))
+        (temp_syrvis_home / "versions" / "0.0.2").mkdir()
+
+        update_current_symlink("0.0.2")
+
+        current = temp_syrvis_home / "current"
+        assert current.is_symlink()
+        assert os.readlink(str(current)) == "versions/0.0.2"
+        assert not list(temp_syrvis_home.glob(".current.*"))
+
     def test_list_installed_versions(self, temp_syrvis_home):
         """Test listing installed versions."""
         set_syrvis_home(str(temp_syrvis_home))
@@ -274,6 +347,31 @@ class TestVersionedPaths:
         assert "0.0.1" in result
         assert "0.0.2" in result
 
+    def test_list_installed_versions_numeric_order(self, temp_syrvis_home):
+        """Versions sort numerically (newest first); non-numeric names sort last."""
+        set_syrvis_home(str(temp_syrvis_home))
+        for name in ("0.10.0", "0.2.0", "dev"):
+            (temp_syrvis_home / "versions" / name).mkdir()
+
+        assert list_installed_versions() == ["0.10.0", "0.2.0", "0.0.1", "dev"]
+
+    def test_list_installed_versions_skips_files_and_dot_dirs(self, temp_syrvis_home):
+        """Only visible directories count; a missing versions/ lists nothing."""
+        set_syrvis_home(str(temp_syrvis_home))
+        versions = temp_syrvis_home / "versions"
+        (versions / ".staging-0.0.2").mkdir()
+        (versions / "0.0.3").write_text("not a dir")
+
+        assert list_installed_versions() == ["0.0.1"]
+
+        (versions / ".staging-0.0.2").rmdir()
+        (versions / "0.0.3").unlink()
+        (versions / "0.0.1" / "cli").rmdir()
+        (versions / "0.0.1" / "build").rmdir()
+        (versions / "0.0.1").rmdir()
+        versions.rmdir()
+        assert list_installed_versions() == []
+
 
 class TestManifest:
     """Test manifest functions."""
@@ -303,6 +401,55 @@ class TestManifest:
         updated = get_manifest()
         assert updated["setup_complete"] is True
 
+    def test_get_manifest_reads_file_once_while_unchanged(self, temp_syrvis_home, monkeypatch):
+        """Repeat reads reuse the cached text; callers still get independent dicts."""
+        from syrviscore import paths
+
+        set_syrvis_home(str(temp_syrvis_home))
+        first = get_manifest()
+        first["active_version"] = "mutated"
+
+        reads = []
+        real_read_bytes = paths.Path.read_bytes
+        monkeypatch.setattr(
+            paths.Path,
+            "read_bytes",
+            lambda self, *a, **k: reads.append(self) or real_read_bytes(self),
+        )
+
+        assert get_manifest()["active_version"] == "0.0.1"
+        assert reads == []
+
+    def test_save_manifest_primes_cache(self, temp_syrvis_home, monkeypatch):
+        """The manifest just written is served back without re-reading the file."""
+        from syrviscore import paths
+
+        set_syrvis_home(str(temp_syrvis_home))
+        manifest = get_manifest()
+        manifest["setup_complete"] = True
+        save_manifest(manifest)
+
+        monkeypatch.setattr(
+            paths.Path, "read_bytes", lambda self, *a, **k: pytest.fail("manifest re-read")
+        )
+        assert get_manifest()["setup_complete"] is True
+        mode = (temp_syrvis_home / ".syrviscore-manifest.json").stat().st_mode
+        assert mode & 0o777 == 0o644
+
+    def test_get_manifest_sees_external_rewrite(self, temp_syrvis_home):
+        """A manifest replaced by another writer is re-read."""
+        set_syrvis_home(str(temp_syrvis_home))
+        get_manifest()
+
+        manifest_path = temp_syrvis_home / ".syrviscore-manifest.json"
+        data = json.loads(manifest_path.read_text())
+        data["active_version"] = "0.0.2"
+        tmp = temp_syrvis_home / "manifest.tmp"
+        tmp.write_text(json.dumps(data))
+        os.replace(str(tmp), str(manifest_path))
+
+        assert get_manifest()["active_version"] == "0.0.2"
+
 
 class TestDirectoryStructure:
     """Test directory structure creation."""
@@ -405,7 +552,9 @@ class TestIsMountedVolume:
         from syrviscore import paths as paths_mod
 
         self._no_sim(monkeypatch)
-        monkeypatch.setattr(paths_mod, "resolve_volume_root", lambda loc: __import__("pathlib").Path("/"))
+        monkeypatch.setattr(
+            paths_mod, "resolve_volume_root", lambda loc: __import__("pathlib").Path("/")
+        )
         assert paths_mod.is_mounted_volume("/volume1") is True
 
     def test_sim_mode_accepts_existing_dir_under_sim_root(self, monkeypatch, tmp_path):
@@ -0,0 +1,483 @@
+"""
+Tests for privileged_ops helpers that read system state (group membership,
+socket permissions, symlinks).
+
+User and group databases are faked through monkeypatched ``pwd``/``grp``/``os``
+lookups so nothing here depends on the accounts of the machine running tests.
+"""
+
+import grp
+import os
+import pwd
+import socket
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from syrviscore import privileged_ops
+from syrviscore.privileged_ops import DsmOperations, SimulationOperations
+
+
+@pytest.fixture(autouse=True)
+def _fresh_probe_caches():
+    privileged_ops.clear_probe_caches()
+    yield
+    privileged_ops.clear_probe_caches()
+
+
+def _fake_accounts(monkeypatch, groups, users):
+    """Install fake grp/pwd lookups; ``groups`` maps name -> (gid, members)."""
+
+    def getgrnam(name):
+        if name not in groups:
+            raise KeyError(name)
+        gid, members = groups[name]
+        return SimpleNamespace(gr_name=name, gr_gid=gid, gr_mem=list(members))
+
+    def getpwnam(name):
+        if name not in users:
+            raise KeyError(name)
+        return SimpleNamespace(pw_name=name, pw_gid=users[name])
+
+    def getgrall():
+        raise AssertionError("group membership must not enumerate every group")
+
+    monkeypatch.setattr(grp, "getgrnam", getgrnam)
+    monkeypatch.setattr(grp, "getgrall", getgrall)
+    monkeypatch.setattr(pwd, "getpwnam", getpwnam)
+
+
+class TestIsUserInGroup:
+    """Membership goes through getgrouplist, never a full group walk."""
+
+    def test_supplementary_group_via_getgrouplist(self, monkeypatch):
+        """A gid reported by getgrouplist counts as membership."""
+        _fake_accounts(monkeypatch, {"docker": (999, [])}, {"alice": 100})
+        calls = []
+
+        def getgrouplist(user, gid):
+            calls.append((user, gid))
+            return [100, 999]
+
+        monkeypatch.setattr(privileged_ops.os, "getgrouplist", getgrouplist)
+
+        assert privileged_ops.is_user_in_group("alice", "docker") is True
+        assert DsmOperations()._is_user_in_group("alice", "docker") is True
+        assert calls == [("alice", 100), ("alice", 100)]
+
+    def test_not_a_member(self, monkeypatch):
+        """A gid missing from getgrouplist is not membership."""
+        _fake_accounts(monkeypatch, {"docker": (999, [])}, {"alice": 100})
+        monkeypatch.setattr(privileged_ops.os, "getgrouplist", lambda u, g: [100])
+
+        assert privileged_ops.is_user_in_group("alice", "docker") is False
+
+    def test_unknown_group_or_user(self, monkeypatch):
+        """Missing group is False; a missing user falls back to gr_mem."""
+        _fake_accounts(monkeypatch, {"docker": (999, ["ghost"])}, {"alice": 100})
+        monkeypatch.setattr(privileged_ops.os, "getgrouplist", lambda u, g: [g])
+
+        assert privileged_ops.is_user_in_group("alice", "nope") is False
+        assert privileged_ops.is_user_in_group("ghost", "docker") is True
+        assert privileged_ops.is_user_in_group("nobody", "docker") is False
+
+    def test_oserror_falls_back_to_member_list(self, monkeypatch):
+        """If getgrouplist fails, gr_mem and the primary gid still decide."""
+        _fake_accounts(
+            monkeypatch,
+            {"docker": (999, ["alice"]), "users": (100, [])},
+            {"alice": 100, "bob": 200},
+        )
+
+        def getgrouplist(user, gid):
+            raise OSError("nss failure")
+
+        monkeypatch.setattr(privileged_ops.os, "getgrouplist", getgrouplist)
+
+        assert privileged_ops.is_user_in_group("alice", "docker") is True
+        assert privileged_ops.is_user_in_group("alice", "users") is True
+        assert privileged_ops.is_user_in_group("bob", "docker") is False
+
+
+class TestProbeCaches:
+    """Stable lookups run once; failures and changed files are re-probed."""
+
+    def test_docker_group_gid_cached_once_found(self, monkeypatch):
+        """A missing group is re-checked; a found GID is reused."""
+        state = {"exists": False, "calls": 0}
+
+        def getgrnam(name):
+            state["calls"] += 1
+            if not state["exists"]:
+                raise KeyError(name)
+            return SimpleNamespace(gr_gid=999)
+
+        monkeypatch.setattr(grp, "getgrnam", getgrnam)
+
+        assert privileged_ops.get_docker_group_info() == (False, None)
+        state["exists"] = True
+        assert DsmOperations()._get_docker_group_info() == (True, 999)
+        assert privileged_ops.get_docker_group_info() == (True, 999)
+        assert state["calls"] == 2
+
+    def test_verify_docker_installed_caches_running(self, monkeypatch):
+        """Only a running Docker is remembered; a stopped one is re-probed."""
+        run = Mock(
+            side_effect=[
+                Mock(returncode=0, stdout="package Docker is stopped"),
+                Mock(returncode=0, stdout="package Docker is running"),
+            ]
+        )
+        monkeypatch.setattr(privileged_ops.subprocess, "run", run)
+        ops = DsmOperations()
+
+        assert ops.verify_docker_installed()[0] is False
+        assert ops.verify_docker_installed()[0] is True
+        assert ops.verify_docker_installed()[0] is True
+        assert run.call_count == 2
+
+    def test_socket_owner_names_cached_per_ids(self, tmp_path, monkeypatch):
+        """Names are resolved once per (uid, gid); a chmod needs no lookup."""
+        sock = tmp_path / "docker.sock"
+        sock.write_text("")
+        sock.chmod(0o600)
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(sock))
+        lookups = []
+        monkeypatch.setattr(
+            pwd, "getpwuid", lambda uid: lookups.append(uid) or SimpleNamespace(pw_name="root")
+        )
+        monkeypatch.setattr(grp, "getgrgid", lambda gid: SimpleNamespace(gr_name="docker"))
+
+        assert privileged_ops.get_docker_socket_permissions() == ("root", "docker", "600")
+        assert DsmOperations()._get_docker_socket_permissions() == ("root", "docker", "600")
+        sock.chmod(0o660)
+        assert privileged_ops.get_docker_socket_permissions() == ("root", "docker", "660")
+        assert len(lookups) == 1
+
+    def test_socket_permissions_unknown_when_missing_or_unreadable(self, tmp_path, monkeypatch):
+        """A missing socket or a stat error reports unknown; other errors propagate."""
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(tmp_path / "absent.sock"))
+        assert privileged_ops.get_docker_socket_permissions() == ("unknown", "unknown", "000")
+
+        def denied():
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(privileged_ops, "_get_docker_socket_stat", denied)
+        assert privileged_ops.get_docker_socket_permissions() == ("unknown", "unknown", "000")
+
+        def broken():
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr(privileged_ops, "_get_docker_socket_stat", broken)
+        with pytest.raises(RuntimeError):
+            privileged_ops.get_docker_socket_permissions()
+
+
+class TestEnsureDockerSocketPermissions:
+    """The socket check compares ids numerically and fixes drift."""
+
+    def _setup(self, tmp_path, monkeypatch, mode):
+        sock = tmp_path / "docker.sock"
+        sock.write_text("")
+        sock.chmod(mode)
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(sock))
+        monkeypatch.setattr(
+            privileged_ops, "get_docker_group_info", lambda: (True, sock.stat().st_gid)
+        )
+        return sock
+
+    def test_already_correct_needs_no_name_lookup(self, tmp_path, monkeypatch):
+        """Matching gid + 0660 passes without touching pwd/grp."""
+        self._setup(tmp_path, monkeypatch, 0o660)
+
+        def no_nss(*args):
+            raise AssertionError("name lookup on the already-correct path")
+
+        monkeypatch.setattr(pwd, "getpwuid", no_nss)
+        monkeypatch.setattr(grp, "getgrgid", no_nss)
+
+        ok, msg = DsmOperations().ensure_docker_socket_permissions()
+
+        assert ok
+        assert "already correct" in msg
+
+    def test_wrong_mode_is_fixed(self, tmp_path, monkeypatch):
+        """A drifted mode is reset to 0660 and reported with names."""
+        sock = self._setup(tmp_path, monkeypatch, 0o600)
+        monkeypatch.setattr(pwd, "getpwuid", lambda uid: SimpleNamespace(pw_name="root"))
+        monkeypatch.setattr(grp, "getgrgid", lambda gid: SimpleNamespace(gr_name="docker"))
+
+        ok, msg = DsmOperations().ensure_docker_socket_permissions()
+
+        assert ok
+        assert msg == "Docker socket permissions updated (root:docker 660)"
+        assert (sock.stat().st_mode & 0o777) == 0o660
+
+    def test_only_drifted_attribute_is_changed(self, tmp_path, monkeypatch):
+        """With the group already right, only the mode is rewritten."""
+        self._setup(tmp_path, monkeypatch, 0o600)
+        chowns = []
+        monkeypatch.setattr(privileged_ops.os, "chown", lambda *a: chowns.append(a))
+
+        ok, _ = DsmOperations().ensure_docker_socket_permissions()
+
+        assert ok
+        assert chowns == []
+
+    def test_missing_socket_or_group(self, tmp_path, monkeypatch):
+        """No socket, or no docker group to hand it to, is a failure."""
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(tmp_path / "absent.sock"))
+        assert DsmOperations().ensure_docker_socket_permissions() == (
+            False,
+            "Docker socket not found",
+        )
+
+        self._setup(tmp_path, monkeypatch, 0o600)
+        monkeypatch.setattr(privileged_ops, "get_docker_group_info", lambda: (False, None))
+        assert DsmOperations().ensure_docker_socket_permissions() == (
+            False,
+            "Docker group not found",
+        )
+
+
+class _FakeDaemon:
+    """Minimal dockerd stand-in: answers every request on a UNIX socket."""
+
+    def __init__(self, path, reply=b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\n\r\nOK"):
+        self.requests = []
+        self._reply = reply
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(path))
+        self._server.listen(4)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with conn:
+                self.requests.append(conn.recv(1024))
+                conn.sendall(self._reply)
+
+    def close(self):
+        self._server.close()
+
+
+class TestVerifyDockerAccessible:
+    """The accessibility probe pings dockerd over its socket, no docker CLI."""
+
+    def _no_subprocess(self, monkeypatch):
+        def run(*args, **kwargs):
+            raise AssertionError("docker CLI / su must not be spawned")
+
+        monkeypatch.setattr(privileged_ops.subprocess, "run", run)
+
+    def test_ping_reaches_daemon(self, tmp_path, monkeypatch):
+        """A 200 from /_ping means accessible."""
+        sock = tmp_path / "docker.sock"
+        daemon = _FakeDaemon(sock)
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(sock))
+        self._no_subprocess(monkeypatch)
+        try:
+            ok, msg = DsmOperations().verify_docker_accessible()
+        finally:
+            daemon.close()
+
+        assert ok
+        assert msg == "Docker daemon accessible"
+        assert daemon.requests[0].startswith(b"GET /_ping HTTP/1.0\r\n")
+
+    def test_non_200_or_missing_socket_not_accessible(self, tmp_path, monkeypatch):
+        """An error status or an absent socket is reported as not accessible."""
+        sock = tmp_path / "docker.sock"
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(sock))
+        self._no_subprocess(monkeypatch)
+
+        assert DsmOperations().verify_docker_accessible() == (
+            False,
+            "Docker daemon not accessible",
+        )
+
+        daemon = _FakeDaemon(sock, reply=b"HTTP/1.0 500 Internal Server Error\r\n\r\n")
+        try:
+            assert privileged_ops._docker_ping() is False
+        finally:
+            daemon.close()
+
+    def test_unknown_user_not_accessible(self, tmp_path, monkeypatch):
+        """The per-user fallback reports the logout hint for an unreachable daemon."""
+        monkeypatch.setattr(privileged_ops, "_DOCKER_SOCKET", str(tmp_path / "docker.sock"))
+        self._no_subprocess(monkeypatch)
+
+        ok, msg = DsmOperations().verify_docker_accessible("no-such-user-xyz")
+
+        assert not ok
+        assert "may need logout" in msg
+
+
+class TestEnsureGlobalSymlink:
+    """Symlink reconciliation (exercised through the simulation root)."""
+
+    def _setup(self, tmp_path):
+        install_dir = tmp_path / "install"
+        (install_dir / "bin").mkdir(parents=True)
+        (install_dir / "bin" / "syrvis").write_text("#!/bin/sh\n")
+        ops = SimulationOperations(tmp_path / "sim")
+        link = tmp_path / "sim" / "usr" / "local" / "bin" / "syrvis"
+        return ops, install_dir, link
+
+    def test_creates_then_reports_correct(self, tmp_path):
+        """A missing link is created; a second call is a no-op."""
+        ops, install_dir, link = self._setup(tmp_path)
+        target = str((install_dir / "bin" / "syrvis").resolve())
+
+        ok, msg = ops.ensure_global_symlink(install_dir)
+        assert ok and "created" in msg
+        assert os.readlink(str(link)) == target
+
+        ok, msg = ops.ensure_global_symlink(install_dir)
+        assert ok and "already correct" in msg
+
+    def test_correct_link_needs_no_realpath(self, tmp_path, monkeypatch):
+        """A link already holding the canonical target skips the realpath walk."""
+        ops, install_dir, link = self._setup(tmp_path)
+        install_dir = Path(os.path.realpath(str(install_dir)))
+        link.parent.mkdir(parents=True)
+        link.symlink_to(install_dir / "bin" / "syrvis")
+
+        def no_realpath(path):
+            raise AssertionError("realpath on the already-correct path")
+
+        monkeypatch.setattr(privileged_ops.os.path, "realpath", no_realpath)
+        ok, msg = ops.ensure_global_symlink(install_dir)
+
+        assert ok and "already correct" in msg
+
+    def test_replaces_stale_or_broken_link(self, tmp_path):
+        """A link pointing elsewhere (even a dangling one) is replaced."""
+        ops, install_dir, link = self._setup(tmp_path)
+        link.parent.mkdir(parents=True)
+        link.symlink_to(tmp_path / "gone")
+
+        ok, msg = ops.ensure_global_symlink(install_dir)
+
+        assert ok and "created" in msg
+        assert link.resolve() == (install_dir / "bin" / "syrvis").resolve()
+
+    def test_refuses_regular_file_and_missing_target(self, tmp_path):
+        """A real file is left alone; a missing target is an error."""
+        ops, install_dir, link = self._setup(tmp_path)
+        link.parent.mkdir(parents=True)
+        link.write_text("not a link")
+
+        ok, msg = ops.ensure_global_symlink(install_dir)
+        assert not ok and "not a symlink" in msg
+        assert link.read_text() == "not a link"
+
+        ok, msg = ops.ensure_global_symlink(tmp_path / "elsewhere")
+        assert not ok and "Target script not found" in msg
+
+    def test_refuses_symlinked_target(self, tmp_path):
+        """A bin/syrvis that is itself a symlink is never followed."""
+        ops, install_dir, link = self._setup(tmp_path)
+        payload = tmp_path / "payload"
+        payload.write_text("#!/bin/sh\n")
+        wrapper = install_dir / "bin" / "syrvis"
+        wrapper.unlink()
+        wrapper.symlink_to(payload)
+
+        ok, msg = ops.ensure_global_symlink(install_dir)
+
+        assert not ok and "not a regular file" in msg
+        assert not os.path.lexists(str(link))
+
+
+class TestSimulationScripts:
+    """Simulation scripts share the write-only-on-change helper."""
+
+    def test_rerun_leaves_scripts_untouched(self, tmp_path):
+        """A second install reports the scripts current and does not rewrite them."""
+        ops = SimulationOperations(tmp_path / "sim")
+        install_dir = tmp_path / "install"
+        startup = install_dir / "bin" / "syrvis-startup.sh"
+        boot = tmp_path / "sim" / "usr" / "local" / "etc" / "rc.d" / "S99syrviscore.sh"
+
+        assert "created" in ops.ensure_startup_script(install_dir, "alice")[1]
+        assert "created" in ops.ensure_boot_script(install_dir)[1]
+        inodes = (startup.stat().st_ino, boot.stat().st_ino)
+
+        assert "already current" in ops.ensure_startup_script(install_dir, "alice")[1]
+        assert "already current" in ops.ensure_boot_script(install_dir)[1]
+        assert (startup.stat().st_ino, boot.stat().st_ino) == inodes
+        assert (startup.stat().st_mode & 0o777) == 0o755
+
+
+class TestToolLookup:
+    """System tools are resolved on PATH once, falling back to the bare name."""
+
+    def test_resolves_once_and_falls_back(self, monkeypatch):
+        """shutil.which runs once per name; a missing tool keeps its name."""
+        privileged_ops._tool.cache_clear()
+        looked_up = []
+
+        def which(name):
+            looked_up.append(name)
+            return "/usr/sbin/ip" if name == "ip" else None
+
+        monkeypatch.setattr(privileged_ops.shutil, "which", which)
+        try:
+            assert privileged_ops._tool("ip") == "/usr/sbin/ip"
+            assert privileged_ops._tool("ip") == "/usr/sbin/ip"
+            assert privileged_ops._tool("synogroup") == "synogroup"
+            assert looked_up == ["ip", "synogroup"]
+        finally:
+            privileged_ops._tool.cache_clear()
+
+
+class TestSubprocessOutput:
+    """Output nobody reads is discarded rather than piped back."""
+
+    def test_synogroup_keeps_only_stderr(self, monkeypatch):
+        """Adding a user pipes stderr (for the error message) and drops stdout."""
+        _fake_accounts(monkeypatch, {"docker": (999, [])}, {"alice": 100})
+        monkeypatch.setattr(privileged_ops.os, "getgrouplist", lambda u, g: [100])
+        seen = {}
+
+        def run(argv, **kwargs):
+            seen.update(kwargs)
+            return Mock(returncode=1, stderr="synogroup: denied")
+
+        monkeypatch.setattr(privileged_ops.subprocess, "run", run)
+
+        ok, msg = DsmOperations().ensure_user_in_docker_group("alice")
+
+        assert not ok
+        assert msg.endswith("synogroup: denied")
+        assert seen["stdout"] is privileged_ops.subprocess.DEVNULL
+        assert seen["stderr"] is privileged_ops.subprocess.PIPE
+        assert "capture_output" not in seen
+
+
+class TestSimulationDockerGroup:
+    """Simulation reuses the shared docker-group lookup."""
+
+    def test_group_lookup_shared_and_cached(self, tmp_path, monkeypatch):
+        """Once the group is found, repeated calls do not look it up again."""
+        calls = []
+
+        def getgrnam(name):
+            calls.append(name)
+            return SimpleNamespace(gr_gid=999)
+
+        monkeypatch.setattr(grp, "getgrnam", getgrnam)
+        ops = SimulationOperations(tmp_path)
+
+        assert ops.ensure_docker_group() == (True, "Docker group exists (GID: 999)")
+        assert ops.ensure_docker_group() == (True, "Docker group exists (GID: 999)")
+        assert calls == ["docker"]
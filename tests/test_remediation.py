@@ -93,6 +93,19 @@ class TestApplyFixDispatch:
         assert "No automatic fix wired up" in msg
         assert fake_ops.calls == []
 
+    def test_plain_action_does_not_take_an_argument(self, fake_ops):
+        """Only the colon-prefixed actions carry a parameter."""
+        ok, msg = remediation.apply_fix("docker_group:extra", None)
+        assert not ok
+        assert "No automatic fix wired up for 'docker_group:extra'" in msg
+        assert fake_ops.calls == []
+
+    def test_startup_without_install_dir(self, fake_ops):
+        ok, msg = remediation.apply_fix("startup:kevin", None)
+        assert not ok
+        assert msg == "startup fix needs the install directory"
+        assert fake_ops.calls == []
+
 
 class TestVerifyRemediate:
     def test_remediate_applies_validator_fixes(self, monkeypatch):
@@ -3,6 +3,7 @@
 import pytest
 import yaml
 
+from syrviscore import docker_manager
 from syrviscore.service_manager import ServiceManager, _image_tag
 from syrviscore.service_schema import ServiceDefinition, ServiceValidationError
 
@@ -247,3 +248,172 @@ class TestSetImage:
         )
         assert r.exit_code == 0, r.output
         assert seen == {"name": "app", "image": "ghcr.io/acme/app:2.0.0"}
+
+
+class TestListStatuses:
+    """list() answers every row from one sparse container listing."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_docker_client(self):
+        """Each test patches docker.from_env; never reuse a previous test's client."""
+        docker_manager._reset_shared_client()
+        yield
+        docker_manager._reset_shared_client()
+
+    def _install(self, home, *names):
+        sm = _manager(home)
+        for name in names:
+            ok, msg = sm.add_image(name, "ghcr.io/acme/{}:1.0.0".format(name), start=False)
+            assert ok, msg
+        return sm
+
+    def test_rows_come_from_one_snapshot(self, home, monkeypatch):
+        sm = self._install(home, "alpha", "beta")
+        calls = []
+
+        def fake_statuses(self):
+            calls.append(1)
+            return {"alpha": "running"}
+
+        monkeypatch.setattr(ServiceManager, "_container_statuses", fake_statuses)
+        rows = {r["name"]: r["status"] for r in sm.list()}
+
+        assert rows == {"alpha": "running", "beta": "stopped"}
+        assert len(calls) == 1
+        assert sm._status_snapshot is None
+
+    def test_skips_entries_without_a_manifest(self, home, monkeypatch):
+        sm = self._install(home, "alpha")
+        (home / "services" / "stray.txt").write_text("x")
+        (home / "services" / "empty").mkdir()
+        (home / "services" / "broken").mkdir()
+        (home / "services" / "broken" / "syrvis-service.yaml").write_text("name: [\n")
+        monkeypatch.setattr(ServiceManager, "_container_statuses", lambda self: {})
+
+        rows = {r["name"]: r["status"] for r in sm.list()}
+
+        assert rows == {"alpha": "stopped", "broken": "error"}
+
+    def test_instance_domain_resolved_once_per_listing(self, home, monkeypatch):
+        import syrviscore.service_manager as sm_mod
+
+        sm = self._install(home, "alpha", "beta")
+        monkeypatch.setattr(ServiceManager, "_container_statuses", lambda self: {})
+        calls = []
+
+        def fake_domain():
+            calls.append(1)
+            return "example.org"
+
+        monkeypatch.setattr(sm_mod, "get_domain_from_env", fake_domain)
+        urls = sorted(r["url"] for r in sm.list())
+
+        assert urls == ["https://alpha.example.org", "https://beta.example.org"]
+        assert len(calls) == 1
+
+    def test_missing_services_dir_lists_nothing(self, home, monkeypatch):
+        def boom(self):
+            raise AssertionError("no daemon call without a services dir")
+
+        monkeypatch.setattr(ServiceManager, "_container_statuses", boom)
+        assert _manager(home).list() == []
+
+    def test_unreachable_daemon_falls_back_per_service(self, home, monkeypatch):
+        sm = self._install(home, "alpha")
+        monkeypatch.setattr(ServiceManager, "_container_statuses", lambda self: None)
+        monkeypatch.setattr(ServiceManager, "_get_service_status", lambda self, n: "paused")
+
+        assert [r["status"] for r in sm.list()] == ["paused"]
+
+    def test_container_statuses_parses_sparse_listing(self, home, monkeypatch):
+        import docker
+
+        class FakeContainer:
+            def __init__(self, attrs):
+                self.attrs = attrs
+
+        class FakeContainers:
+            def list(self, all=False, sparse=False):
+                assert all and sparse
+                return [
+                    FakeContainer({"Names": ["/alpha"], "State": "running"}),
+                    FakeContainer({"Names": ["/beta", "/beta-alias"], "State": "exited"}),
+                    FakeContainer({"Names": ["/gamma"]}),
+                ]
+
+        class FakeClient:
+            containers = FakeContainers()
+
+            def ping(self):
+                return True
+
+        monkeypatch.setattr(docker, "from_env", lambda: FakeClient())
+
+        assert _manager(home)._container_statuses() == {
+            "alpha": "running",
+            "beta": "exited",
+            "beta-alias": "exited",
+        }
+
+    def test_status_lookups_share_one_client(self, home, monkeypatch):
+        import docker
+
+        created = []
+
+        class FakeContainer:
+            status = "running"
+
+        class FakeContainers:
+            def get(self, name):
+                return FakeContainer()
+
+        class FakeClient:
+            containers = FakeContainers()
+
+            def ping(self):
+                return True
+
+        def fake_from_env():
+            created.append(1)
+            return FakeClient()
+
+        monkeypatch.setattr(docker, "from_env", fake_from_env)
+        sm = _manager(home)
+
+        assert sm._get_service_status("alpha") == "running"
+        assert sm._get_service_status("beta") == "running"
+        assert len(created) == 1
+
+    def test_failed_client_creation_is_retried(self, home, monkeypatch):
+        import docker
+
+        def unreachable():
+            raise docker.errors.DockerException("no daemon")
+
+        monkeypatch.setattr(docker, "from_env", unreachable)
+        sm = _manager(home)
+
+        assert sm._get_service_status("alpha") == "unknown"
+        assert docker_manager._shared_client is None
+
+    def test_status_unknown_once_daemon_goes_away(self, home, monkeypatch):
+        import docker
+
+        class FakeClient:
+            alive = True
+
+            def ping(self):
+                if not self.alive:
+                    raise docker.errors.DockerException("no daemon")
+                return True
+
+        client = FakeClient()
+        monkeypatch.setattr(docker, "from_env", lambda: client)
+        sm = _manager(home)
+        assert docker_manager.get_docker_client() is client
+
+        client.alive = False
+        monkeypatch.setattr(docker_manager, "_SHARED_CLIENT_PING_TTL", 0)
+
+        assert sm._get_service_status("alpha") == "unknown"
+        assert docker_manager._shared_client is None
@@ -8,6 +8,8 @@ repo. These tests pin the guarantees from the Phase 3 audit fixes:
 - unknown keys / unpinned images / privileged options are rejected
 """
 
+from pathlib import Path
+
 import pytest
 
 from syrviscore.service_schema import (
@@ -296,6 +298,73 @@ class TestComposeGenerationContainment:
         assert compose["services"]["cc"]["command"] == emit_argv
 
 
+class TestCloneService:
+    """The git clone is staged under services/ and installed with one rename."""
+
+    def _fake_git(self, monkeypatch, manifest, seen):
+        import subprocess as sp
+
+        import syrviscore.service_manager as sm
+
+        def fake_run(cmd, **kwargs):
+            dest = Path(cmd[-1])
+            seen.append(cmd)
+            dest.mkdir(parents=True)
+            if manifest is not None:
+                (dest / "syrvis-service.yaml").write_text(manifest)
+            return sp.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(sm.subprocess, "run", fake_run)
+
+    def test_clone_staged_in_services_dir_and_renamed(self, tmp_path, monkeypatch):
+        from syrviscore.service_manager import ServiceManager
+
+        seen = []
+        manifest = "name: gollum\nversion: 1.0.0\nimage: nginx:1.27.0\n"
+        self._fake_git(monkeypatch, manifest, seen)
+        mgr = ServiceManager(syrvis_home=tmp_path)
+
+        ok, msg, path = mgr._clone_service("https://example.com/gollum.git")
+
+        assert ok, msg
+        assert Path(seen[0][-1]).parent.parent == tmp_path / "services"
+        assert "--single-branch" in seen[0] and "--no-tags" in seen[0]
+        assert path == tmp_path / "services" / "gollum"
+        assert (path / "syrvis-service.yaml").is_file()
+        assert sorted(p.name for p in (tmp_path / "services").iterdir()) == ["gollum"]
+
+    @pytest.mark.parametrize(
+        "url,ok",
+        [
+            ("https://example.com/a.git", True),
+            ("git@example.com:a/b.git", True),
+            ("ssh://git@example.com/a.git", True),
+            ("http://example.com/a.git", False),
+            ("git://example.com/a.git", False),
+            ("file:///srv/a.git", False),
+            ("/srv/a.git", False),
+            ("--upload-pack=/bin/sh", False),
+            ("", False),
+        ],
+    )
+    def test_is_git_url_gate(self, tmp_path, url, ok):
+        from syrviscore.service_manager import ServiceManager
+
+        assert ServiceManager(syrvis_home=tmp_path)._is_git_url(url) is ok
+
+    def test_failed_clone_leaves_no_staging_dir(self, tmp_path, monkeypatch):
+        from syrviscore.service_manager import ServiceManager
+
+        self._fake_git(monkeypatch, None, [])
+        mgr = ServiceManager(syrvis_home=tmp_path)
+
+        ok, msg, path = mgr._clone_service("https://example.com/empty.git")
+
+        assert not ok and "No syrvis-service.yaml" in msg
+        assert path is None
+        assert list((tmp_path / "services").iterdir()) == []
+
+
 class TestElevationPreservesHome:
     def test_self_elevate_forwards_syrvis_home(self, monkeypatch):
         import syrviscore.privilege as privilege